@@ -0,0 +1,53 @@
+"""Local HTTP server used by the benchmarks (no network, no API key needed)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Tuple
+
+CHAT_RESPONSE: Dict[str, Any] = {
+    "id": "bench",
+    "content": "Hello! How can I help you today?",
+    "model": "gpt-4o",
+    "provider": "openai",
+    "usage": {"prompt_tokens": 10, "completion_tokens": 15, "total_tokens": 25},
+    "cost_usd": 0.000125,
+    "finish_reason": "stop",
+}
+
+
+def _handler(respond: Callable[[str, bytes], Tuple[int, bytes]]) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            status, body = respond(self.path, self.rfile.read(length))
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST  # noqa: N815
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def _chat(path: str, body: bytes) -> Tuple[int, bytes]:
+    return 200, json.dumps(CHAT_RESPONSE).encode()
+
+
+def start_server(
+    respond: Callable[[str, bytes], Tuple[int, bytes]] = _chat,
+) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a keep-alive server on a free port; returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(respond))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
@@ -0,0 +1,57 @@
+"""
+Calls-per-second with a fresh client per call vs the shared connection pool.
+
+Run with: ``python benchmarks/bench_connection_pool.py [calls]``
+
+The server is local plain HTTP, so the "before" number only pays for a TCP
+connect per call. Against the real API each fresh client also pays a TLS
+handshake, which makes the gap considerably larger.
+"""
+
+import sys
+import time
+
+import httpx
+
+from _server import start_server
+from cencori import Cencori
+
+MESSAGES = [{"role": "user", "content": "Hello!"}]
+
+
+def fresh_client_per_call(base_url: str, calls: int) -> float:
+    """The pre-pool behaviour: open and tear down an httpx.Client per request."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        with httpx.Client(timeout=30.0) as client:
+            client.post(
+                f"{base_url}/api/ai/chat",
+                json={"messages": MESSAGES, "model": "gpt-4o", "stream": False},
+                headers={"CENCORI_API_KEY": "csk_bench"},
+            ).json()
+    return calls / (time.perf_counter() - start)
+
+
+def pooled(base_url: str, calls: int) -> float:
+    with Cencori(api_key="csk_bench", base_url=base_url) as cencori:
+        cencori.ai.chat(messages=MESSAGES, model="gpt-4o")  # warm the pool
+        start = time.perf_counter()
+        for _ in range(calls):
+            cencori.ai.chat(messages=MESSAGES, model="gpt-4o")
+        return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server, base_url = start_server()
+    try:
+        before = fresh_client_per_call(base_url, calls)
+        after = pooled(base_url, calls)
+    finally:
+        server.shutdown()
+    print(f"fresh client per call: {before:8.1f} calls/s")
+    print(f"shared pool:           {after:8.1f} calls/s  ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Request-encoding cost of a long multi-turn chat: a plain message list, which
+is JSON-encoded in full every turn, against a ``Conversation``, which encodes
+each message once and joins the stored bytes.
+
+Run with: ``python benchmarks/bench_conversation.py [turns] [chars]``
+
+Each turn appends a user message and an assistant reply of ``chars``
+characters and sends the whole history. "encode" times only building the
+request bodies for every turn; "chat()" times every turn end to end through
+``ai.chat`` against an in-process mock transport (no network). Timings are
+the best of several runs, summed over all turns.
+"""
+
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List, Union
+
+import httpx
+
+from cencori import Cencori, Conversation
+
+REPLY = {"content": "ok", "model": "gpt-4o", "usage": {"total_tokens": 1}}
+
+
+def turn_messages(turn: int, chars: int) -> List[Dict[str, str]]:
+    text = (f"turn {turn}: " + "lorem ipsum dolor sit amet " * chars)[:chars]
+    return [{"role": "user", "content": text}, {"role": "assistant", "content": text}]
+
+
+def payload(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    return {"messages": messages, "model": "gpt-4o", "stream": False}
+
+
+def encode_list(turns: int, chars: int) -> int:
+    history: List[Dict[str, str]] = []
+    sent = 0
+    for turn in range(turns):
+        history.extend(turn_messages(turn, chars))
+        sent += len(httpx.Request("POST", "http://x", json=payload(history)).content)
+    return sent
+
+
+def encode_conversation(turns: int, chars: int) -> int:
+    conversation = Conversation()
+    sent = 0
+    for turn in range(turns):
+        conversation.extend(turn_messages(turn, chars))
+        body = conversation.body(payload(conversation.messages))
+        sent += len(httpx.Request("POST", "http://x", content=body).content)
+    return sent
+
+
+def chat(turns: int, chars: int, history: Union[List[Dict[str, str]], Conversation]) -> int:
+    client = Cencori(
+        api_key="csk_bench",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=REPLY))
+        ),
+    )
+    for turn in range(turns):
+        history.extend(turn_messages(turn, chars))
+        client.ai.chat(history, model="gpt-4o")
+    return turns
+
+
+def best_ms(run: Callable[[], int]) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    chars = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    assert encode_list(3, chars) == encode_conversation(3, chars)
+    final = [message for turn in range(turns) for message in turn_messages(turn, chars)]
+    size = len(json.dumps(payload(final)))
+    print(f"{turns} turns, {chars} chars/message ({size / 1e6:.1f} MB final history)")
+    print("  total ms          list  Conversation")
+    for label, old, new in [
+        ("encode", lambda: encode_list(turns, chars), lambda: encode_conversation(turns, chars)),
+        ("chat()", lambda: chat(turns, chars, []), lambda: chat(turns, chars, Conversation())),
+    ]:
+        print(f"  {label:<10} {best_ms(old):10.1f}  {best_ms(new):12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Embedding throughput (vectors/s): one request for the whole input vs split batches.
+
+Run with: ``python benchmarks/bench_embeddings.py [texts] [dims]``
+
+The local server models provider work as a fixed 20 ms per request plus
+50 µs per input, so parallel batches can overlap that time the way they
+overlap model latency against the real API. JSON encoding and decoding
+costs are real.
+"""
+
+import json
+import sys
+import time
+from typing import Tuple
+
+from _server import start_server
+from cencori import Cencori, EmbeddingBatching
+
+REQUEST_LATENCY = 0.020
+PER_INPUT_LATENCY = 0.000050
+
+
+def make_responder(dims: int):  # type: ignore[no-untyped-def]
+    vector = json.dumps([round(0.001 * i, 6) for i in range(dims)])
+    item = '{"embedding":' + vector + "}"
+
+    def respond(path: str, body: bytes) -> Tuple[int, bytes]:
+        count = len(json.loads(body)["input"])
+        time.sleep(REQUEST_LATENCY + PER_INPUT_LATENCY * count)
+        data = ",".join([item] * count)
+        return 200, f'{{"data":[{data}],"usage":{{"total_tokens":{count}}}}}'.encode()
+
+    return respond
+
+
+def run(base_url: str, texts: list, batching: EmbeddingBatching) -> float:
+    with Cencori(
+        api_key="csk_bench", base_url=base_url, timeout=300.0, embedding_batching=batching
+    ) as cencori:
+        cencori.ai.embeddings(["warm up"])
+        start = time.perf_counter()
+        response = cencori.ai.embeddings(texts)
+        elapsed = time.perf_counter() - start
+    assert len(response.embeddings) == len(texts)
+    return len(texts) / elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    dims = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    texts = [f"document {i} about topic {i % 97}" for i in range(count)]
+    server, base_url = start_server(make_responder(dims))
+    try:
+        single = run(base_url, texts, EmbeddingBatching(max_items=count, max_tokens=10**9))
+        split = run(base_url, texts, EmbeddingBatching())
+        wide = run(base_url, texts, EmbeddingBatching(max_parallel=16))
+    finally:
+        server.shutdown()
+    print(f"{count} texts x {dims} dims")
+    print(f"one request:                {single:10.0f} vectors/s")
+    print(f"256/batch, 4 in parallel:   {split:10.0f} vectors/s  ({split / single:.2f}x)")
+    print(f"256/batch, 16 in parallel:  {wide:10.0f} vectors/s  ({wide / single:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
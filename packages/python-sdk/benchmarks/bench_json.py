@@ -0,0 +1,96 @@
+"""
+CPU cost of JSON encoding and decoding per request with the standard-library
+codec against orjson.
+
+Run with: ``python benchmarks/bench_json.py`` (needs ``pip install orjson``)
+
+"rag encode" builds the body of a RAG request with a long history;
+"embed decode" parses an embeddings response for a 64-text batch;
+"sse decode" parses one streamed chat event; "chat()" and "embeddings()"
+time a full call through the client against an in-process mock transport
+(no network). Each figure is the best of several runs of CPU time, per
+operation.
+"""
+
+import time
+from typing import Callable, Dict, List
+
+import httpx
+
+from cencori import Cencori, JSONCodec, OrjsonCodec
+from cencori.sse import ServerSentEvent
+
+TEXT = "lorem ipsum dolor sit amet, consectetur adipiscing elit ✓ " * 20
+TEXTS = [f"{i}: {TEXT}" for i in range(64)]
+MESSAGES: List[Dict[str, str]] = [
+    {"role": "user" if i % 2 else "assistant", "content": TEXT} for i in range(40)
+]
+RAG_PAYLOAD = {
+    "model": "gpt-4o",
+    "messages": MESSAGES,
+    "namespace": "docs",
+    "limit": 8,
+    "threshold": 0.5,
+    "includeSources": True,
+    "stream": False,
+}
+EMBEDDINGS = {
+    "model": "text-embedding-3-small",
+    "data": [
+        {"embedding": [(i * 7 + j) % 1000 / 997 for j in range(1536)], "index": i}
+        for i in range(64)
+    ],
+    "usage": {"prompt_tokens": 640, "total_tokens": 640},
+}
+EVENT = ServerSentEvent(
+    event="message",
+    data='{"delta": "lorem ipsum ", "model": "gpt-4o", "provider": "openai", '
+    '"finish_reason": null}',
+)
+
+
+def client(codec: JSONCodec, reply: Dict) -> Cencori:
+    body = httpx.Response(200, json=reply).content
+    return Cencori(
+        api_key="csk_bench",
+        json_codec=codec,
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        ),
+    )
+
+
+def cases(codec: JSONCodec) -> Dict[str, Callable[[], object]]:
+    embed_body = codec.dumps(EMBEDDINGS)
+    chat_client = client(codec, {"content": "ok", "model": "gpt-4o"})
+    embed_client = client(codec, EMBEDDINGS)
+    return {
+        "rag encode": lambda: codec.dumps(RAG_PAYLOAD),
+        "embed decode": lambda: codec.loads(embed_body),
+        "sse decode": lambda: EVENT.json(codec.loads),
+        "chat()": lambda: chat_client.ai.chat(MESSAGES, model="gpt-4o"),
+        "embeddings()": lambda: embed_client.ai.embeddings(TEXTS),
+    }
+
+
+def best_us(run: Callable[[], object], number: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.process_time()
+        for _ in range(number):
+            run()
+        best = min(best, time.process_time() - start)
+    return best / number * 1e6
+
+
+def main() -> None:
+    old, new = cases(JSONCodec()), cases(OrjsonCodec())
+    print("  CPU µs/op            json     orjson  speedup")
+    for label in old:
+        number = 20000 if label == "sse decode" else 200
+        before, after = best_us(old[label], number), best_us(new[label], number)
+        print(f"  {label:<14} {before:9.1f}  {after:9.1f}  {before / after:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
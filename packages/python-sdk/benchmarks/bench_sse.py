@@ -0,0 +1,80 @@
+"""
+Per-event cost of parsing a chat token stream: the shared bytes-level SSE
+decoder against the previous ``iter_lines()`` + ``json.loads`` loop.
+
+Run with: ``python benchmarks/bench_sse.py [events]``
+
+The stream is a typical token-by-token chat response split into network
+sized chunks, fed through ``httpx.Response`` so both paths include httpx's
+own byte iteration. "framing" is the cost of finding each event's data;
+"+ json" adds decoding it. Timings are the best of several runs.
+"""
+
+import json
+import sys
+import time
+from typing import Callable, Iterator, List
+
+import httpx
+
+from cencori.sse import DONE, iter_events
+
+
+def make_chunks(events: int, chunk_size: int) -> List[bytes]:
+    body = b"".join(
+        b"data: " + json.dumps({"delta": f" tok{i}", "finish_reason": None}).encode() + b"\n\n"
+        for i in range(events)
+    )
+    body += b"data: [DONE]\n\n"
+    return [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+
+def legacy(response: httpx.Response, decode: bool) -> Iterator[object]:
+    for line in response.iter_lines():
+        if not line or not line.startswith("data: "):
+            continue
+        data_str = line[6:]
+        if data_str == "[DONE]":
+            return
+        try:
+            yield json.loads(data_str) if decode else data_str
+        except json.JSONDecodeError:
+            continue
+
+
+def shared(response: httpx.Response, decode: bool) -> Iterator[object]:
+    for event in iter_events(response.iter_bytes()):
+        if event.data == DONE:
+            return
+        yield event.json() if decode else event.data
+
+
+def per_event_us(
+    parse: Callable[[httpx.Response, bool], Iterator[object]],
+    chunks: List[bytes],
+    events: int,
+    decode: bool,
+) -> float:
+    best = float("inf")
+    for _ in range(7):
+        response = httpx.Response(200, content=iter(chunks))
+        start = time.perf_counter()
+        count = sum(1 for _ in parse(response, decode))
+        best = min(best, time.perf_counter() - start)
+        assert count == events
+    return best / events * 1e6
+
+
+def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{events} events, µs/event          iter_lines  SSEDecoder")
+    for label, chunk_size in [("1 event/chunk", 48), ("4 KiB chunks", 4096)]:
+        chunks = make_chunks(events, chunk_size)
+        for stage, decode in [("framing", False), ("+ json", True)]:
+            old = per_event_us(legacy, chunks, events, decode)
+            new = per_event_us(shared, chunks, events, decode)
+            print(f"  {label:<14} {stage:<9} {old:10.2f}  {new:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,41 @@ One SDK for AI Gateway, Compute, Workflow, and Storage.
 Every operation is secured, logged, and tracked.
 """
 
-from .client import Cencori
+from .client import AsyncCencori, Cencori
+from .accumulator import StreamAccumulator
+from .cache import ResponseCache
+from .chunking import EmbeddingBatching
+from .codec import JSONCodec, OrjsonCodec
+from .coalesce import EmbeddingCoalescing
+from .concurrency import AdaptiveConcurrency
+from .conversation import Conversation
+from .embedding_cache import EmbeddingCache
+from .hedging import HedgePolicy
+from .ratelimit import RateLimit, RateLimiter
+from .retry import RetryPolicy
+from .routing import ModelRouter, RoutedAttempt
+from .stream_timeout import StreamTimeout
+from .timing import AsyncTimedStream, StreamStats, TimedStream
+from .tokens import (
+    ContextFitter,
+    TokenProfile,
+    estimate_message_tokens,
+    estimate_text_tokens,
+)
+from .batch import BatchModule
 from .vision import VisionModule
 from .voice import VoiceModule
 from .documents import DocumentsModule
 from .errors import (
     AuthenticationError,
     CencoriError,
+    ContextWindowError,
     InsufficientCreditsError,
     ProviderError,
     RateLimitError,
     SafetyError,
+    StreamDecodeError,
+    StreamStalledError,
 )
 from .types import (
     Agent,
@@ -25,11 +49,13 @@ from .types import (
     AgentKey,
     AgentListItem,
     APIKey,
+    BatchSummary,
     Breakdown,
     ChatParams,
     ChatResponse,
     CompletionRequest,
     CostMetrics,
+    CompactVectors,
     CreateAgentKeyParams,
     CreateAgentParams,
     CreateAPIKeyParams,
@@ -41,16 +67,20 @@ from .types import (
     EmbeddingUsage,
     GenerateObjectRequest,
     GenerateObjectResponse,
+    GenerateObjectStreamChunk,
     GeneratedImage,
     ImageGenerationRequest,
     ImageGenerationResponse,
+    ItemResult,
     KeyUsageStats,
     LatencyMetrics,
     Memory,
     MemoryNamespace,
     Message,
     MetricsResponse,
+    ModelScore,
     Project,
+    RaceResult,
     RagRequest,
     RagResponse,
     RagSource,
@@ -70,6 +100,8 @@ from .types import (
     Stats,
     StoreMemoryOptions,
     StreamChunk,
+    StreamStatsSummary,
+    StreamTiming,
     TokenMetrics,
     ToolCall,
     ToolCallFunction,
@@ -84,9 +116,32 @@ from .types import (
 __version__ = "1.4.0"
 __all__ = [
     "Cencori",
+    "AsyncCencori",
     "VisionModule",
     "VoiceModule",
     "DocumentsModule",
+    "BatchModule",
+    "Conversation",
+    "JSONCodec",
+    "OrjsonCodec",
+    "RetryPolicy",
+    "ModelRouter",
+    "RoutedAttempt",
+    "HedgePolicy",
+    "ModelScore",
+    "RaceResult",
+    "AdaptiveConcurrency",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "EmbeddingCache",
+    "EmbeddingBatching",
+    "EmbeddingCoalescing",
+    "StreamTimeout",
+    "ContextFitter",
+    "TokenProfile",
+    "estimate_message_tokens",
+    "estimate_text_tokens",
     # Errors
     "CencoriError",
     "AuthenticationError",
@@ -94,11 +149,20 @@ __all__ = [
     "SafetyError",
     "InsufficientCreditsError",
     "ProviderError",
+    "StreamDecodeError",
+    "StreamStalledError",
+    "ContextWindowError",
     # Chat / AI types
     "Message",
     "ChatParams",
     "ChatResponse",
     "StreamChunk",
+    "StreamAccumulator",
+    "TimedStream",
+    "AsyncTimedStream",
+    "StreamTiming",
+    "StreamStats",
+    "StreamStatsSummary",
     "Usage",
     "ToolDefinition",
     "ToolCall",
@@ -110,14 +174,20 @@ __all__ = [
     # Embedding
     "EmbeddingRequest",
     "EmbeddingResponse",
+    "CompactVectors",
     "EmbeddingUsage",
     # Generate Object
     "GenerateObjectRequest",
     "GenerateObjectResponse",
+    "GenerateObjectStreamChunk",
     # Image Generation
     "ImageGenerationRequest",
     "ImageGenerationResponse",
     "GeneratedImage",
+    # Fan-out
+    "ItemResult",
+    # Batch
+    "BatchSummary",
     # RAG
     "RagRequest",
     "RagResponse",
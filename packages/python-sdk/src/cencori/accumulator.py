@@ -0,0 +1,153 @@
+"""Rebuilds a complete chat response from streamed chunks."""
+
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from .types import ChatResponse, StreamChunk, ToolCall, ToolCallFunction, Usage
+
+
+class StreamAccumulator:
+    """
+    Passes ``chat_stream`` chunks through while building the final response.
+
+    Text deltas are joined into ``content``; tool-call fragments are merged
+    by ``index`` (or ``id``) into typed :class:`ToolCall` objects with their
+    argument strings concatenated; the finish reason, usage and cost are
+    taken from the chunks that carry them. :meth:`response` returns the
+    ``ChatResponse`` that ``ai.chat`` returns for the same completion (the
+    stream does not carry ``id`` or ``provider``), so tools can be dispatched
+    without a second request.
+
+    Args:
+        model: Model to report when the stream does not name one
+
+    Example:
+        >>> from cencori import StreamAccumulator
+        >>> stream = StreamAccumulator(model="gpt-4o")
+        >>> for chunk in stream.wrap(cencori.ai.chat_stream(messages=[...], tools=[...])):
+        ...     print(chunk.delta, end="", flush=True)
+        >>> response = stream.response()
+        >>> for call in response.tool_calls or []:
+        ...     dispatch(call.function.name, json.loads(call.function.arguments))
+    """
+
+    def __init__(self, model: str = "") -> None:
+        self.model = model
+        self.finish_reason: Optional[str] = None
+        self.usage: Optional[Usage] = None
+        self.cost_usd = 0.0
+        self.error: Optional[str] = None
+        self._parts: List[str] = []
+        self._tool_calls: List[ToolCall] = []
+        self._slots: Dict[Any, ToolCall] = {}
+
+    @property
+    def content(self) -> str:
+        """Text received so far."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    @property
+    def tool_calls(self) -> Optional[List[ToolCall]]:
+        """Tool calls received so far, or None if there are none."""
+        return list(self._tool_calls) or None
+
+    def add(self, chunk: StreamChunk) -> StreamChunk:
+        """Fold ``chunk`` into the response and return it unchanged."""
+        if chunk.delta:
+            self._parts.append(chunk.delta)
+        if chunk.finish_reason is not None:
+            self.finish_reason = chunk.finish_reason
+        if chunk.usage is not None:
+            self.usage = chunk.usage
+        if chunk.cost_usd is not None:
+            self.cost_usd = chunk.cost_usd
+        if chunk.error is not None:
+            self.error = chunk.error
+        for position, fragment in enumerate(chunk.tool_calls or []):
+            self._merge(position, _as_dict(fragment))
+        return chunk
+
+    def wrap(self, chunks: Iterator[StreamChunk]) -> Iterator[StreamChunk]:
+        """Yield every chunk of ``chunks`` after adding it."""
+        for chunk in chunks:
+            yield self.add(chunk)
+
+    async def awrap(self, chunks: AsyncIterator[StreamChunk]) -> AsyncIterator[StreamChunk]:
+        """Async version of :meth:`wrap`."""
+        async for chunk in chunks:
+            yield self.add(chunk)
+
+    def response(self) -> ChatResponse:
+        """The response assembled from the chunks added so far."""
+        return ChatResponse(
+            content=self.content,
+            model=self.model,
+            usage=self.usage or Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+            cost_usd=self.cost_usd,
+            finish_reason=self.finish_reason,
+            tool_calls=self.tool_calls,
+        )
+
+    def _merge(self, position: int, fragment: Dict[str, Any]) -> None:
+        # OpenAI-style deltas carry an index and are appended to; calls sent
+        # whole (Cencori's finish chunk) carry only an id and replace any
+        # earlier copy of the same call.
+        index = fragment.get("index")
+        call_id = fragment.get("id")
+        key: Any = index if index is not None else call_id or ("position", position)
+        call = self._slots.get(key)
+        if call is None and call_id:
+            call = self._slots.get(call_id)
+        if call is None:
+            call = ToolCall(id="", function=ToolCallFunction(name="", arguments=""))
+            self._slots[key] = call
+            self._tool_calls.append(call)
+        assert call.function is not None
+        if call_id:
+            call.id = call_id
+            self._slots[call_id] = call
+        if fragment.get("type"):
+            call.type = fragment["type"]
+        function = fragment.get("function") or {}
+        arguments = _arguments(function.get("arguments") or "")
+        if index is None:
+            call.function.name = function.get("name") or call.function.name
+            call.function.arguments = arguments or call.function.arguments
+        else:
+            if function.get("name") and not call.function.name:
+                call.function.name = function["name"]
+            call.function.arguments += arguments
+
+
+def parse_tool_calls(raw: Optional[List[Any]]) -> Optional[List[ToolCall]]:
+    """Typed tool calls from their wire form (dicts), or None if there are none."""
+    if not raw:
+        return None
+    calls: List[ToolCall] = []
+    for item in raw:
+        item = _as_dict(item)
+        function = item.get("function") or {}
+        calls.append(
+            ToolCall(
+                id=item.get("id", ""),
+                type=item.get("type", "function"),
+                function=ToolCallFunction(
+                    name=function.get("name", ""),
+                    arguments=_arguments(function.get("arguments", "")),
+                ),
+            )
+        )
+    return calls
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return dict(value)
+
+
+def _arguments(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
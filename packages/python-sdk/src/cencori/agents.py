@@ -13,7 +13,7 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient, Cencori
 
 
 class AgentsModule:
@@ -32,17 +32,7 @@ class AgentsModule:
             List of AgentListItem objects
         """
         data = self._client._request("GET", "/v1/agents")
-        return [
-            AgentListItem(
-                id=a["id"],
-                name=a["name"],
-                description=a.get("description"),
-                is_active=a.get("is_active", True),
-                shadow_mode=a.get("shadow_mode", False),
-                created_at=a.get("created_at", ""),
-            )
-            for a in data.get("data", [])
-        ]
+        return self._parse_list(data)
 
     def create(self, params: CreateAgentParams) -> Agent:
         """
@@ -54,22 +44,7 @@ class AgentsModule:
         Returns:
             The created Agent
         """
-        payload: Dict[str, Any] = {"name": params.name}
-        if params.description is not None:
-            payload["description"] = params.description
-        if params.config is not None:
-            config = {}
-            if params.config.model:
-                config["model"] = params.config.model
-            if params.config.system_prompt is not None:
-                config["system_prompt"] = params.config.system_prompt
-            if params.config.tools is not None:
-                config["tools"] = params.config.tools
-            if params.config.temperature is not None:
-                config["temperature"] = params.config.temperature
-            payload["config"] = config
-
-        data = self._client._request("POST", "/v1/agents", json=payload)
+        data = self._client._request("POST", "/v1/agents", json=self._create_payload(params))
         return self._parse_agent(data)
 
     def get(self, agent_id: str) -> Agent:
@@ -96,27 +71,7 @@ class AgentsModule:
         Returns:
             Updated Agent
         """
-        payload: Dict[str, Any] = {}
-        if params.name is not None:
-            payload["name"] = params.name
-        if params.description is not None:
-            payload["description"] = params.description
-        if params.is_active is not None:
-            payload["is_active"] = params.is_active
-        if params.shadow_mode is not None:
-            payload["shadow_mode"] = params.shadow_mode
-        if params.config is not None:
-            config: Dict[str, Any] = {}
-            if params.config.model:
-                config["model"] = params.config.model
-            if params.config.system_prompt is not None:
-                config["system_prompt"] = params.config.system_prompt
-            if params.config.tools is not None:
-                config["tools"] = params.config.tools
-            if params.config.temperature is not None:
-                config["temperature"] = params.config.temperature
-            payload["config"] = config
-
+        payload = self._update_payload(params)
         data = self._client._request("PATCH", f"/v1/agents/{agent_id}", json=payload)
         return self._parse_agent(data)
 
@@ -140,6 +95,49 @@ class AgentsModule:
         Returns:
             Created AgentKey
         """
+        payload = self._key_payload(params)
+        data = self._client._request("POST", f"/v1/agents/{agent_id}/keys", json=payload)
+        return self._parse_key(data, agent_id)
+
+    @staticmethod
+    def _config_payload(config: AgentConfig) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
+        if config.model:
+            payload["model"] = config.model
+        if config.system_prompt is not None:
+            payload["system_prompt"] = config.system_prompt
+        if config.tools is not None:
+            payload["tools"] = config.tools
+        if config.temperature is not None:
+            payload["temperature"] = config.temperature
+        return payload
+
+    @staticmethod
+    def _create_payload(params: CreateAgentParams) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"name": params.name}
+        if params.description is not None:
+            payload["description"] = params.description
+        if params.config is not None:
+            payload["config"] = AgentsModule._config_payload(params.config)
+        return payload
+
+    @staticmethod
+    def _update_payload(params: UpdateAgentParams) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
+        if params.name is not None:
+            payload["name"] = params.name
+        if params.description is not None:
+            payload["description"] = params.description
+        if params.is_active is not None:
+            payload["is_active"] = params.is_active
+        if params.shadow_mode is not None:
+            payload["shadow_mode"] = params.shadow_mode
+        if params.config is not None:
+            payload["config"] = AgentsModule._config_payload(params.config)
+        return payload
+
+    @staticmethod
+    def _key_payload(params: Optional[CreateAgentKeyParams]) -> Dict[str, Any]:
         payload: Dict[str, Any] = {}
         if params is not None:
             if params.name is not None:
@@ -150,8 +148,24 @@ class AgentsModule:
                 payload["key_type"] = params.key_type
             if params.allowed_domains is not None:
                 payload["allowed_domains"] = params.allowed_domains
+        return payload
 
-        data = self._client._request("POST", f"/v1/agents/{agent_id}/keys", json=payload)
+    @staticmethod
+    def _parse_list(data: Dict[str, Any]) -> List[AgentListItem]:
+        return [
+            AgentListItem(
+                id=a["id"],
+                name=a["name"],
+                description=a.get("description"),
+                is_active=a.get("is_active", True),
+                shadow_mode=a.get("shadow_mode", False),
+                created_at=a.get("created_at", ""),
+            )
+            for a in data.get("data", [])
+        ]
+
+    @staticmethod
+    def _parse_key(data: Dict[str, Any], agent_id: str) -> AgentKey:
         return AgentKey(
             id=data.get("id", ""),
             name=data.get("name", ""),
@@ -163,7 +177,8 @@ class AgentsModule:
             created_at=data.get("created_at", ""),
         )
 
-    def _parse_agent(self, data: Dict[str, Any]) -> Agent:
+    @staticmethod
+    def _parse_agent(data: Dict[str, Any]) -> Agent:
         config = None
         if "config" in data:
             c = data["config"]
@@ -183,3 +198,51 @@ class AgentsModule:
             updated_at=data.get("updated_at"),
             config=config,
         )
+
+
+class AsyncAgentsModule:
+    """
+    Agents module for :class:`~cencori.AsyncCencori`.
+
+    Same methods as :class:`AgentsModule`; each one is a coroutine.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+
+    async def list(self) -> List[AgentListItem]:
+        """List all agents for the project."""
+        data = await self._client._async_request("GET", "/v1/agents")
+        return AgentsModule._parse_list(data)
+
+    async def create(self, params: CreateAgentParams) -> Agent:
+        """Create a new AI agent."""
+        data = await self._client._async_request(
+            "POST", "/v1/agents", json=AgentsModule._create_payload(params)
+        )
+        return AgentsModule._parse_agent(data)
+
+    async def get(self, agent_id: str) -> Agent:
+        """Get an agent by ID."""
+        data = await self._client._async_request("GET", f"/v1/agents/{agent_id}")
+        return AgentsModule._parse_agent(data)
+
+    async def update_config(self, agent_id: str, params: UpdateAgentParams) -> Agent:
+        """Update an agent's configuration."""
+        data = await self._client._async_request(
+            "PATCH", f"/v1/agents/{agent_id}", json=AgentsModule._update_payload(params)
+        )
+        return AgentsModule._parse_agent(data)
+
+    async def delete(self, agent_id: str) -> None:
+        """Delete an agent by ID."""
+        await self._client._async_request("DELETE", f"/v1/agents/{agent_id}")
+
+    async def create_key(
+        self, agent_id: str, params: Optional[CreateAgentKeyParams] = None
+    ) -> AgentKey:
+        """Create an API key for an agent."""
+        data = await self._client._async_request(
+            "POST", f"/v1/agents/{agent_id}/keys", json=AgentsModule._key_payload(params)
+        )
+        return AgentsModule._parse_key(data, agent_id)
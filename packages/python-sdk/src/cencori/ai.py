@@ -1,21 +1,45 @@
 """AI module for chat completions, embeddings, and streaming."""
 
-import json
-from typing import Any, Dict, Iterator, List, Optional, Union, TYPE_CHECKING
-
-import httpx
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+    cast,
+)
 
-from .errors import AuthenticationError, CencoriError, RateLimitError
+from . import vectors
+from .accumulator import StreamAccumulator, parse_tool_calls
+from .cache import cache_key
+from .coalesce import EmbeddingCoalescer
+from .conversation import Conversation
+from .embedding_cache import EmbeddingCache
+from .errors import CencoriError
+from .fanout import DEFAULT_CONCURRENCY, ProgressCallback, async_run_many, run_many
+from .partial_json import PartialJSONParser
+from .race import async_race, race
+from .ratelimit import estimate_tokens
+from .retry import RetryPolicy
+from .routing import RoutedAttempt
+from .sse import DONE, aiter_events, iter_events
+from .timing import AsyncTimedStream, StreamTimer, TimedStream
 from .types import (
     ChatResponse,
     EmbeddingResponse,
     EmbeddingUsage,
     GenerateObjectRequest,
     GenerateObjectResponse,
+    GenerateObjectStreamChunk,
     GeneratedImage,
-    ImageGenerationRequest,
+    ItemResult,
     ImageGenerationResponse,
-    RagRequest,
+    RaceResult,
     RagResponse,
     RagSource,
     RagStreamChunk,
@@ -31,7 +55,7 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient
 
 
 class AIModule:
@@ -42,8 +66,9 @@ class AIModule:
     Cencori's unified API with built-in security, logging, and cost tracking.
     """
 
-    def __init__(self, client: "Cencori") -> None:
+    def __init__(self, client: "BaseClient") -> None:
         self._client = client
+        self._coalescer: Optional[EmbeddingCoalescer] = None
 
     # =========================================================================
     # Chat Methods
@@ -51,7 +76,7 @@ class AIModule:
 
     def chat(
         self,
-        messages: List[Dict[str, str]],
+        messages: Union[List[Dict[str, str]], Conversation],
         model: str = "gemini-2.5-flash",
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -59,12 +84,15 @@ class AIModule:
         tools: Optional[List[ToolDefinition]] = None,
         tool_choice: Optional[ToolChoice] = None,
         prompt: Optional[Dict[str, Any]] = None,
+        cache: Optional[bool] = None,
+        models: Optional[List[str]] = None,
     ) -> ChatResponse:
         """
         Send a chat completion request (non-streaming).
 
         Args:
-            messages: List of message dicts with 'role' and 'content'
+            messages: List of message dicts with 'role' and 'content', or a
+                :class:`Conversation` for long histories
             model: AI model to use (default: gemini-2.5-flash)
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens in response
@@ -72,14 +100,223 @@ class AIModule:
             tools: Tool definitions for function calling
             tool_choice: How the model chooses to call tools
             prompt: Prompt Registry reference
+            cache: Use the client's response cache (default: only when
+                temperature is 0; False bypasses it)
+            models: Candidate models to route between instead of ``model``;
+                the client's :class:`ModelRouter` picks the fastest healthy
+                one and falls back to the next on provider or rate-limit
+                errors
 
         Returns:
             ChatResponse with content, usage, and cost
         """
+        if models is not None:
+            router = self._client.router
+            return router.call(
+                models,
+                lambda candidate, attempt: self._chat(
+                    messages,
+                    candidate,
+                    temperature,
+                    max_tokens,
+                    user_id,
+                    tools,
+                    tool_choice,
+                    prompt,
+                    cache,
+                    router.retry,
+                    attempt,
+                ),
+            )
+        return self._chat(
+            messages, model, temperature, max_tokens, user_id, tools, tool_choice, prompt, cache
+        )
+
+    def _chat(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+        cache: Optional[bool] = None,
+        retry: Optional[RetryPolicy] = None,
+        attempt: Optional[RoutedAttempt] = None,
+    ) -> ChatResponse:
+        payload = self._chat_payload(
+            messages, model, False, temperature, max_tokens, user_id, tools, tool_choice, prompt
+        )
+
+        key = self._cache_key(payload, temperature, cache)
+        cached = self._cache_get(key)
+        if cached is not None:
+            if attempt is not None:
+                attempt.discard()
+            return self._parse_chat(cached, model)
+
+        estimated = self._pace(model, payload["messages"], max_tokens)
+        if attempt is not None:
+            attempt.restart()
+        data = self._client._request(
+            "POST",
+            "/api/ai/chat",
+            json=payload,
+            retry=retry,
+            hedge=temperature == 0,
+            content=self._chat_body(messages, payload),
+        )
+        self._settle(model, estimated, data)
+
+        response = self._parse_chat(data, model)
+        self._cache_set(key, data)
+        return response
+
+    def chat_stream(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str = "gemini-2.5-flash",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+    ) -> TimedStream[StreamChunk]:
+        """
+        Send a chat completion request with streaming.
+
+        The returned iterator's ``timing`` holds the connect, first-byte,
+        first-token and inter-token latencies once the stream ends.
+
+        Raises:
+            StreamDecodeError: If an event carries malformed JSON
+        """
+        payload = self._chat_payload(
+            messages, model, True, temperature, max_tokens, user_id, tools, tool_choice, prompt
+        )
+        timer = self._timer(model, "/api/ai/chat")
+        content = self._chat_body(messages, payload)
+        events = self._chat_events(payload, payload["messages"], max_tokens, timer, content)
+        return TimedStream(events, timer)
+
+    def _chat_events(
+        self,
+        payload: Dict[str, Any],
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int],
+        timer: StreamTimer,
+        content: Optional[bytes] = None,
+    ) -> Iterator[StreamChunk]:
+        self._pace(payload["model"], messages, max_tokens)
+        timer.start()
+        with self._client._stream(
+            "POST", "/api/ai/chat", json=payload, timer=timer, content=content
+        ) as response:
+            for event in iter_events(timer.body(response.iter_bytes())):
+                if event.data == DONE:
+                    return
+                chunk = self._chat_chunk(event.json(self._client._codec.loads))
+                if chunk.delta:
+                    timer.token()
+                if chunk.error is not None:
+                    timer.finish(False)
+                yield chunk
+                if chunk.error is not None:
+                    return
+
+    def chat_race(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        models: List[str],
+        stream: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+        grace: float = 0.0,
+    ) -> RaceResult[Union[ChatResponse, TimedStream[StreamChunk]]]:
+        """
+        Send the same chat request to every model at once and keep the fastest.
+
+        Each model is streamed; the first complete response wins (with
+        ``stream``, the first token, and ``value`` is that model's stream,
+        starting from the token). The other requests are then closed so they
+        don't hold pool connections. Unlike ``chat(models=...)``, which tries
+        candidates one at a time, this pays for every model to cut latency.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            stream: Race to the first token and return the winning stream
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+            user_id: Optional user ID for rate limiting
+            tools: Tool definitions for function calling
+            tool_choice: How the model chooses to call tools
+            prompt: Prompt Registry reference
+            grace: Seconds to let the others keep going after the win so the
+                runner-up's margin can be measured (default: stop at once)
+
+        Returns:
+            RaceResult with the winning ``model``, its ``value``, ``elapsed_s``,
+            ``margin_s`` and the ``errors`` of models that failed
+
+        Raises:
+            The first candidate's error if every model fails
+
+        Example:
+            >>> result = cencori.ai.chat_race(messages, models=["gpt-4o-mini", "gemini-2.5-flash"])
+            >>> print(result.model, result.elapsed_s, result.value.content)
+        """
+        return race(
+            models,
+            lambda model: self.chat_stream(
+                messages, model, temperature, max_tokens, user_id, tools, tool_choice, prompt
+            ),
+            stream,
+            grace,
+            self._client.router,
+        )
+
+    def _timer(self, model: str, endpoint: str) -> StreamTimer:
+        return StreamTimer(model, endpoint, self._client.stream_stats)
+
+    def _fit(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        max_tokens: Optional[int],
+        tools: Optional[List[ToolDefinition]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Trim ``messages`` to the model's context window when a fitter is configured."""
+        fitter = self._client._context_fitter
+        if fitter is None:
+            return messages
+        return fitter.fit(messages, model, max_tokens, tools)
+
+    def _chat_payload(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str,
+        stream: bool,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        history: List[Dict[str, Any]] = (
+            messages.messages if isinstance(messages, Conversation) else messages
+        )
         payload: Dict[str, Any] = {
-            "messages": messages,
+            "messages": self._fit(history, model, max_tokens, tools),
             "model": model,
-            "stream": False,
+            "stream": stream,
         }
 
         if temperature is not None:
@@ -89,111 +326,110 @@ class AIModule:
         if user_id is not None:
             payload["userId"] = user_id
         if tools is not None:
-            payload["tools"] = [t.__dict__ if hasattr(t, '__dict__') else t for t in tools]
+            payload["tools"] = [t.__dict__ if hasattr(t, "__dict__") else t for t in tools]
         if tool_choice is not None:
-            payload["toolChoice"] = tool_choice.__dict__ if hasattr(tool_choice, '__dict__') else tool_choice
+            payload["toolChoice"] = (
+                tool_choice.__dict__ if hasattr(tool_choice, "__dict__") else tool_choice
+            )
         if prompt is not None:
             payload["prompt"] = prompt
+        return payload
+
+    @staticmethod
+    def _chat_body(
+        messages: Union[List[Dict[str, str]], Conversation], payload: Dict[str, Any]
+    ) -> Optional[bytes]:
+        """Pre-encoded request body for a :class:`Conversation`, else None (the codec encodes)."""
+        if isinstance(messages, Conversation):
+            return messages.body(payload)
+        return None
+
+    @staticmethod
+    def _chat_chunk(data: Dict[str, Any]) -> StreamChunk:
+        if "error" in data:
+            return StreamChunk(delta="", error=data.get("error"))
+        return StreamChunk(
+            delta=data.get("delta", ""),
+            finish_reason=data.get("finish_reason"),
+            tool_calls=data.get("toolCalls") or data.get("tool_calls"),
+            usage=_parse_usage(data) if "usage" in data else None,
+            cost_usd=data.get("cost_usd"),
+        )
 
-        data = self._client._request("POST", "/api/ai/chat", json=payload)
-
+    @staticmethod
+    def _parse_chat(data: Dict[str, Any], model: str) -> ChatResponse:
         tool_calls = None
         if "toolCalls" in data and data["toolCalls"]:
-            tool_calls = data["toolCalls"]
+            tool_calls = parse_tool_calls(data["toolCalls"])
         elif "choices" in data and data["choices"]:
             choice = data["choices"][0]
             if "message" in choice and "tool_calls" in choice["message"]:
-                tool_calls = choice["message"]["tool_calls"]
+                tool_calls = parse_tool_calls(choice["message"]["tool_calls"])
 
         return ChatResponse(
             id=data.get("id", ""),
             content=data.get("content", ""),
             model=data.get("model", model),
             provider=data.get("provider", ""),
-            usage=Usage(
-                prompt_tokens=data.get("usage", {}).get("prompt_tokens", 0),
-                completion_tokens=data.get("usage", {}).get("completion_tokens", 0),
-                total_tokens=data.get("usage", {}).get("total_tokens", 0),
-            ),
+            usage=_parse_usage(data),
             cost_usd=data.get("cost_usd", 0.0),
             finish_reason=data.get("finish_reason"),
             tool_calls=tool_calls,
         )
 
-    def chat_stream(
-        self,
-        messages: List[Dict[str, str]],
-        model: str = "gemini-2.5-flash",
-        temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
-        user_id: Optional[str] = None,
-        tools: Optional[List[ToolDefinition]] = None,
-        tool_choice: Optional[ToolChoice] = None,
-        prompt: Optional[Dict[str, Any]] = None,
-    ) -> Iterator[StreamChunk]:
-        """
-        Send a chat completion request with streaming.
-        """
-        payload: Dict[str, Any] = {
-            "messages": messages,
-            "model": model,
-            "stream": True,
-        }
+    # =========================================================================
+    # Rate Limiting
+    # =========================================================================
 
-        if temperature is not None:
-            payload["temperature"] = temperature
-        if max_tokens is not None:
-            payload["maxTokens"] = max_tokens
-        if user_id is not None:
-            payload["userId"] = user_id
-        if tools is not None:
-            payload["tools"] = [t.__dict__ if hasattr(t, '__dict__') else t for t in tools]
-        if tool_choice is not None:
-            payload["toolChoice"] = tool_choice.__dict__ if hasattr(tool_choice, '__dict__') else tool_choice
-        if prompt is not None:
-            payload["prompt"] = prompt
+    def _pace(self, model: str, messages: List[Dict[str, Any]], max_tokens: Optional[int]) -> int:
+        """Wait for the local rate limiter (if any); returns the estimated tokens charged."""
+        limiter = self._client._rate_limiter
+        if limiter is None:
+            return 0
+        estimated = estimate_tokens(messages, max_tokens, model)
+        limiter.acquire(self._client._api_key, model, estimated)
+        return estimated
+
+    async def _async_pace(
+        self, model: str, messages: List[Dict[str, Any]], max_tokens: Optional[int]
+    ) -> int:
+        """Async version of :meth:`_pace`."""
+        limiter = self._client._rate_limiter
+        if limiter is None:
+            return 0
+        estimated = estimate_tokens(messages, max_tokens, model)
+        await limiter.async_acquire(self._client._api_key, model, estimated)
+        return estimated
+
+    def _settle(self, model: str, estimated: int, data: Dict[str, Any]) -> None:
+        """Correct the token budget with the usage the gateway reported."""
+        limiter = self._client._rate_limiter
+        if limiter is not None and estimated:
+            actual = data.get("usage", {}).get("total_tokens", 0)
+            limiter.settle(self._client._api_key, model, estimated, actual)
 
-        url = f"{self._client._base_url}/api/ai/chat"
-        headers = {
-            "Content-Type": "application/json",
-            "CENCORI_API_KEY": self._client._api_key,
-        }
+    # =========================================================================
+    # Response Cache
+    # =========================================================================
 
-        with httpx.Client(timeout=60.0) as http_client:
-            with http_client.stream("POST", url, json=payload, headers=headers) as response:
-                if response.status_code == 401:
-                    raise AuthenticationError()
-                if response.status_code == 429:
-                    raise RateLimitError()
-                if not response.is_success:
-                    raise CencoriError(f"Request failed with status {response.status_code}")
-
-                for line in response.iter_lines():
-                    if not line or not line.startswith("data: "):
-                        continue
-
-                    data_str = line[6:]
-
-                    if data_str == "[DONE]":
-                        return
-
-                    try:
-                        data = json.loads(data_str)
-
-                        if "error" in data:
-                            yield StreamChunk(
-                                delta="",
-                                error=data.get("error"),
-                            )
-                            return
-
-                        yield StreamChunk(
-                            delta=data.get("delta", ""),
-                            finish_reason=data.get("finish_reason"),
-                            tool_calls=data.get("toolCalls"),
-                        )
-                    except json.JSONDecodeError:
-                        continue
+    def _cache_key(
+        self, payload: Dict[str, Any], temperature: Optional[float], cache: Optional[bool]
+    ) -> Optional[str]:
+        """Cache key for a chat payload, or None when the call should not be cached."""
+        if self._client._cache is None or cache is False:
+            return None
+        if cache is None and temperature != 0:
+            return None
+        return cache_key("/api/ai/chat", payload, self._client._api_key)
+
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if key is None or self._client._cache is None:
+            return None
+        return self._client._cache.get(key)
+
+    def _cache_set(self, key: Optional[str], data: Dict[str, Any]) -> None:
+        if key is not None and self._client._cache is not None:
+            self._client._cache.set(key, data)
 
     # =========================================================================
     # Completions Method
@@ -224,17 +460,187 @@ class AIModule:
         self,
         input: Union[str, List[str]],
         model: str = "text-embedding-3-small",
+        cache: Optional[bool] = None,
+        compact: bool = False,
     ) -> EmbeddingResponse:
         """
         Generate embeddings for text.
+
+        Large input lists are split per the client's ``EmbeddingBatching``
+        and the batches sent concurrently; vectors come back in input order
+        with the usage summed. With an ``embedding_cache`` on the client, only
+        texts missing from the cache are sent and ``usage`` counts only those.
+        Pass ``cache=False`` to bypass the cache.
+
+        With ``compact=True`` the vectors are decoded straight from the
+        response bytes into one float32 matrix (see :class:`EmbeddingResponse`)
+        instead of a list of Python float lists, which is several times
+        smaller and faster to build for large inputs.
         """
-        payload: Dict[str, Any] = {
-            "input": input,
-            "model": model,
-        }
+        store = self._embedding_store(cache)
+        if store is None and isinstance(input, str) and not compact:
+            payload: Dict[str, Any] = {
+                "input": input,
+                "model": model,
+            }
+            data = self._client._request("POST", "/api/ai/embeddings", json=payload, hedge=True)
+            return self._parse_embeddings(data, model)
+
+        texts = [input] if isinstance(input, str) else list(input)
+        cached: List[Optional[List[float]]] = (
+            store.get_many(model, texts) if store is not None else [None] * len(texts)
+        )
+        misses = self._embedding_misses(texts, cached)
+        fresh = None
+        if misses:
+
+            def send(batch: List[str]) -> EmbeddingResponse:
+                payload = {"input": batch, "model": model}
+                if compact:
+                    body = self._client._request_bytes(
+                        "POST", "/api/ai/embeddings", json=payload, hedge=True
+                    )
+                    return self._checked_compact(
+                        body, model, batch, store, self._client._codec.loads
+                    )
+                data = self._client._request("POST", "/api/ai/embeddings", json=payload, hedge=True)
+                return self._checked_embeddings(data, model, batch, store)
+
+            batching = self._client._embedding_batching
+            batches = batching.split(misses)
+            if len(batches) == 1:
+                fresh = send(batches[0])
+            else:
+                fresh = self._combine_embeddings(
+                    list(run_many(send, batches, concurrency=batching.max_parallel)),
+                    model,
+                    compact,
+                )
+        return self._merge_embeddings(texts, cached, misses, fresh, model, compact)
+
+    def _embedding_store(self, cache: Optional[bool]) -> Optional[EmbeddingCache]:
+        return None if cache is False else self._client._embedding_cache
+
+    @staticmethod
+    def _embedding_misses(texts: List[str], cached: List[Optional[List[float]]]) -> List[str]:
+        """Distinct uncached texts, in first-seen order."""
+        return list(dict.fromkeys(t for t, vector in zip(texts, cached) if vector is None))
+
+    @staticmethod
+    def _checked_embeddings(
+        data: Dict[str, Any], model: str, batch: List[str], store: Optional[EmbeddingCache]
+    ) -> EmbeddingResponse:
+        """Parse one batch's response, check it is complete and cache its vectors."""
+        fresh = AIModule._parse_embeddings(data, model)
+        if len(fresh.embeddings) != len(batch):
+            raise CencoriError(
+                f"Expected {len(batch)} embeddings, received {len(fresh.embeddings)}"
+            )
+        if store is not None:
+            store.put_many(model, batch, cast(List[List[float]], fresh.embeddings))
+        return fresh
+
+    @staticmethod
+    def _checked_compact(
+        body: bytes,
+        model: str,
+        batch: List[str],
+        store: Optional[EmbeddingCache],
+        loads: Callable[[bytes], Any],
+    ) -> EmbeddingResponse:
+        """Compact counterpart of :meth:`_checked_embeddings`."""
+        data, matrix, dims = vectors.decode_embeddings(body, loads)
+        received = len(data.get("data", []))
+        if received != len(batch):
+            raise CencoriError(f"Expected {len(batch)} embeddings, received {received}")
+        if store is not None:
+            rows = [vectors.row_array(matrix, dims, i) for i in range(received)]
+            store.put_many(model, batch, rows)
+        return EmbeddingResponse(
+            model=data.get("model", model),
+            embeddings=matrix,
+            usage=EmbeddingUsage(
+                total_tokens=data.get("usage", {}).get("total_tokens", 0),
+            ),
+            dimensions=dims,
+        )
 
-        data = self._client._request("POST", "/api/ai/embeddings", json=payload)
+    @staticmethod
+    def _combine_embeddings(
+        results: List[ItemResult[EmbeddingResponse]], model: str, compact: bool = False
+    ) -> EmbeddingResponse:
+        """Concatenate per-batch responses in order; raise the first batch error."""
+        for item in results:
+            if item.error is not None:
+                raise item.error
+        responses = [item.value for item in results if item.value is not None]
+        if compact:
+            embeddings = vectors.concat([response.embeddings for response in responses])
+        else:
+            embeddings = [vector for response in responses for vector in response.embeddings]
+        return EmbeddingResponse(
+            model=responses[0].model if responses else model,
+            embeddings=embeddings,
+            usage=EmbeddingUsage(
+                total_tokens=sum(response.usage.total_tokens for response in responses)
+            ),
+            dimensions=responses[0].dimensions if responses else 0,
+        )
 
+    @staticmethod
+    def _merge_embeddings(
+        texts: List[str],
+        cached: List[Optional[List[float]]],
+        misses: List[str],
+        fresh: Optional[EmbeddingResponse],
+        model: str,
+        compact: bool = False,
+    ) -> EmbeddingResponse:
+        if fresh is not None and len(misses) == len(texts):
+            return fresh  # nothing cached or repeated: vectors are already in order
+        usage = EmbeddingUsage(total_tokens=fresh.usage.total_tokens if fresh is not None else 0)
+        if compact:
+            return AIModule._merge_compact(texts, cached, misses, fresh, model, usage)
+        sent = dict(zip(misses, fresh.embeddings)) if fresh is not None else {}
+        embeddings = [
+            vector if vector is not None else sent[text] for text, vector in zip(texts, cached)
+        ]
+        return EmbeddingResponse(
+            model=fresh.model if fresh is not None else model,
+            embeddings=embeddings,
+            usage=usage,
+            dimensions=len(embeddings[0]) if embeddings else 0,
+        )
+
+    @staticmethod
+    def _merge_compact(
+        texts: List[str],
+        cached: List[Optional[List[float]]],
+        misses: List[str],
+        fresh: Optional[EmbeddingResponse],
+        model: str,
+        usage: EmbeddingUsage,
+    ) -> EmbeddingResponse:
+        if fresh is not None:
+            dims = fresh.dimensions
+        else:
+            dims = next((len(vector) for vector in cached if vector is not None), 0)
+        sent = {text: i for i, text in enumerate(misses)}
+        matrix = vectors.allocate(len(texts), dims)
+        for i, (text, vector) in enumerate(zip(texts, cached)):
+            if vector is None:
+                assert fresh is not None
+                vector = vectors.row(fresh.embeddings, dims, sent[text])
+            vectors.set_row(matrix, dims, i, vector)
+        return EmbeddingResponse(
+            model=fresh.model if fresh is not None else model,
+            embeddings=matrix,
+            usage=usage,
+            dimensions=dims,
+        )
+
+    @staticmethod
+    def _parse_embeddings(data: Dict[str, Any], model: str) -> EmbeddingResponse:
         embeddings = [item["embedding"] for item in data.get("data", [])]
 
         return EmbeddingResponse(
@@ -243,6 +649,7 @@ class AIModule:
             usage=EmbeddingUsage(
                 total_tokens=data.get("usage", {}).get("total_tokens", 0),
             ),
+            dimensions=len(embeddings[0]) if embeddings else 0,
         )
 
     # =========================================================================
@@ -252,24 +659,112 @@ class AIModule:
     def generate_object(
         self,
         params: GenerateObjectRequest,
+        cache: Optional[bool] = None,
     ) -> GenerateObjectResponse:
         """
         Generate structured output matching a JSON schema.
         Uses function calling to enforce the schema on the model output.
+
+        ``cache`` works as in :meth:`chat`.
+        """
+        payload = self._generate_object_payload(params)
+        key = self._cache_key(payload, params.temperature, cache)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return self._parse_generate_object(cached, self._client._codec.loads)
+
+        data = self._client._request("POST", "/api/ai/chat", json=payload)
+        response = self._parse_generate_object(data, self._client._codec.loads)
+        self._cache_set(key, data)
+        return response
+
+    def generate_object_stream(
+        self, params: GenerateObjectRequest
+    ) -> TimedStream[GenerateObjectStreamChunk]:
+        """
+        Stream structured output as it is generated.
+
+        The function-call arguments are parsed incrementally while they
+        stream, yielding progressively more complete partial objects (fields
+        appear once their key is complete; strings grow as they arrive). The
+        last chunk has ``done=True`` and holds the fully parsed object and
+        the usage.
+
+        Raises:
+            CencoriError: If the model returns no structured output, or the
+                complete arguments are not valid JSON
         """
+        payload = self._generate_object_payload(params)
+        payload["stream"] = True
+        timer = self._timer(params.model, "/api/ai/chat")
+        return TimedStream(self._object_events(payload, params.model, timer), timer)
+
+    def _object_events(
+        self, payload: Dict[str, Any], model: str, timer: StreamTimer
+    ) -> Iterator[GenerateObjectStreamChunk]:
+        stream = StreamAccumulator(model=model)
+        parser = PartialJSONParser()
+
+        timer.start()
+        with self._client._stream("POST", "/api/ai/chat", json=payload, timer=timer) as response:
+            for event in iter_events(timer.body(response.iter_bytes())):
+                if event.data == DONE:
+                    break
+                partial = self._object_progress(
+                    stream, parser, event.json(self._client._codec.loads), timer
+                )
+                if partial is not None:
+                    yield GenerateObjectStreamChunk(object=partial)
+        yield self._object_final(stream, self._client._codec.loads)
+
+    @staticmethod
+    def _object_progress(
+        stream: StreamAccumulator,
+        parser: PartialJSONParser,
+        data: Dict[str, Any],
+        timer: StreamTimer,
+    ) -> Optional[Dict[str, Any]]:
+        """Fold one stream event in; return the partial object if it grew."""
+        chunk = stream.add(AIModule._chat_chunk(data))
+        if chunk.delta or chunk.tool_calls:
+            timer.token()
+        if chunk.error is not None:
+            raise CencoriError(chunk.error)
+        calls = stream.tool_calls
+        if not calls or calls[0].function is None:
+            return None
+        partial = parser.update(calls[0].function.arguments)
+        return partial if isinstance(partial, dict) else None
+
+    @staticmethod
+    def _object_final(
+        stream: StreamAccumulator, loads: Callable[[str], Any]
+    ) -> GenerateObjectStreamChunk:
+        calls = stream.tool_calls
+        if not calls or calls[0].function is None:
+            raise CencoriError("Model did not return structured output")
+        try:
+            parsed = loads(calls[0].function.arguments)
+        except ValueError:
+            raise CencoriError("Failed to parse structured output as JSON")
+        return GenerateObjectStreamChunk(object=parsed, done=True, usage=stream.response().usage)
+
+    @staticmethod
+    def _generate_object_payload(params: GenerateObjectRequest) -> Dict[str, Any]:
         messages = params.messages or [{"role": "user", "content": params.prompt or ""}]
         schema_name = params.schema_name or "generate_object"
 
         payload: Dict[str, Any] = {
             "model": params.model,
-            "messages": [m.__dict__ if hasattr(m, '__dict__') else m for m in messages],
+            "messages": [m.__dict__ if hasattr(m, "__dict__") else m for m in messages],
             "stream": False,
             "tools": [
                 {
                     "type": "function",
                     "function": {
                         "name": schema_name,
-                        "description": params.schema_description or "Generate a structured object matching the schema",
+                        "description": params.schema_description
+                        or "Generate a structured object matching the schema",
                         "parameters": params.schema,
                     },
                 }
@@ -281,9 +776,12 @@ class AIModule:
             payload["temperature"] = params.temperature
         if params.max_tokens is not None:
             payload["maxTokens"] = params.max_tokens
+        return payload
 
-        data = self._client._request("POST", "/api/ai/chat", json=payload)
-
+    @staticmethod
+    def _parse_generate_object(
+        data: Dict[str, Any], loads: Callable[[str], Any]
+    ) -> GenerateObjectResponse:
         tool_calls = data.get("toolCalls") or data.get("tool_calls") or []
         if not tool_calls and "choices" in data:
             choice = data["choices"][0]
@@ -294,18 +792,11 @@ class AIModule:
             raise CencoriError("Model did not return structured output")
 
         try:
-            parsed = json.loads(tool_calls[0]["function"]["arguments"])
-        except (KeyError, json.JSONDecodeError):
+            parsed = loads(tool_calls[0]["function"]["arguments"])
+        except (KeyError, ValueError):
             raise CencoriError("Failed to parse structured output as JSON")
 
-        return GenerateObjectResponse(
-            object=parsed,
-            usage=Usage(
-                prompt_tokens=data.get("usage", {}).get("prompt_tokens", 0),
-                completion_tokens=data.get("usage", {}).get("completion_tokens", 0),
-                total_tokens=data.get("usage", {}).get("total_tokens", 0),
-            ),
-        )
+        return GenerateObjectResponse(object=parsed, usage=_parse_usage(data))
 
     # =========================================================================
     # Image Generation
@@ -324,6 +815,20 @@ class AIModule:
         """
         Generate images from a text prompt.
         """
+        payload = self._image_payload(prompt, model, n, size, quality, style, response_format)
+        data = self._client._request("POST", "/api/ai/images/generate", json=payload)
+        return self._parse_image(data, model)
+
+    @staticmethod
+    def _image_payload(
+        prompt: str,
+        model: str,
+        n: Optional[int] = None,
+        size: Optional[str] = None,
+        quality: Optional[str] = None,
+        style: Optional[str] = None,
+        response_format: Optional[str] = None,
+    ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "prompt": prompt,
             "model": model,
@@ -338,9 +843,10 @@ class AIModule:
             payload["style"] = style
         if response_format is not None:
             payload["responseFormat"] = response_format
+        return payload
 
-        data = self._client._request("POST", "/api/ai/images/generate", json=payload)
-
+    @staticmethod
+    def _parse_image(data: Dict[str, Any], model: str) -> ImageGenerationResponse:
         images = [GeneratedImage(**img) for img in data.get("images", [])]
 
         return ImageGenerationResponse(
@@ -367,38 +873,19 @@ class AIModule:
         """
         RAG (Retrieval-Augmented Generation) chat with automatic memory context.
         """
-        payload: Dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-            "namespace": namespace,
-            "limit": limit,
-            "threshold": threshold,
-            "include_sources": include_sources,
-            "stream": False,
-        }
-        if temperature is not None:
-            payload["temperature"] = temperature
-        if max_tokens is not None:
-            payload["maxTokens"] = max_tokens
-
-        data = self._client._request("POST", "/api/ai/rag", json=payload)
-
-        sources = None
-        if "sources" in data and data["sources"]:
-            sources = [RagSource(**s) for s in data["sources"]]
-
-        return RagResponse(
-            message={"role": "assistant", "content": data.get("message", {}).get("content", "")},
-            model=data.get("model", model),
-            provider=data.get("provider", ""),
-            usage=Usage(
-                prompt_tokens=data.get("usage", {}).get("prompt_tokens", 0),
-                completion_tokens=data.get("usage", {}).get("completion_tokens", 0),
-                total_tokens=data.get("usage", {}).get("total_tokens", 0),
-            ),
-            sources=sources,
-            latency_ms=data.get("latency_ms", 0),
+        payload = self._rag_payload(
+            model,
+            messages,
+            namespace,
+            False,
+            temperature,
+            max_tokens,
+            limit,
+            threshold,
+            include_sources,
         )
+        data = self._client._request("POST", "/api/ai/rag", json=payload)
+        return self._parse_rag(data, model)
 
     def rag_stream(
         self,
@@ -410,63 +897,90 @@ class AIModule:
         limit: int = 5,
         threshold: float = 0.5,
         include_sources: bool = True,
-    ) -> Iterator[RagStreamChunk]:
+    ) -> TimedStream[RagStreamChunk]:
         """
         Stream RAG responses with automatic memory context.
         """
+        payload = self._rag_payload(
+            model,
+            messages,
+            namespace,
+            True,
+            temperature,
+            max_tokens,
+            limit,
+            threshold,
+            include_sources,
+        )
+        timer = self._timer(model, "/api/ai/rag")
+        return TimedStream(self._rag_events(payload, timer), timer)
+
+    def _rag_events(self, payload: Dict[str, Any], timer: StreamTimer) -> Iterator[RagStreamChunk]:
+        timer.start()
+        with self._client._stream("POST", "/api/ai/rag", json=payload, timer=timer) as response:
+            for event in iter_events(timer.body(response.iter_bytes())):
+                if event.data == DONE:
+                    return
+                chunk = self._rag_chunk(event.json(self._client._codec.loads))
+                if chunk.delta:
+                    timer.token()
+                yield chunk
+
+    def _rag_payload(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        namespace: str,
+        stream: bool,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        limit: int = 5,
+        threshold: float = 0.5,
+        include_sources: bool = True,
+    ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": model,
-            "messages": messages,
+            "messages": self._fit(messages, model, max_tokens),
             "namespace": namespace,
             "limit": limit,
             "threshold": threshold,
             "include_sources": include_sources,
-            "stream": True,
+            "stream": stream,
         }
         if temperature is not None:
             payload["temperature"] = temperature
         if max_tokens is not None:
             payload["maxTokens"] = max_tokens
+        return payload
 
-        url = f"{self._client._base_url}/api/ai/rag"
-        headers = {
-            "Content-Type": "application/json",
-            "CENCORI_API_KEY": self._client._api_key,
-        }
+    @staticmethod
+    def _rag_chunk(data: Dict[str, Any]) -> RagStreamChunk:
+        sources = None
+        if "sources" in data and data["sources"]:
+            sources = [RagSource(**s) for s in data["sources"]]
+
+        return RagStreamChunk(
+            type=data.get("type", "content"),
+            delta=data.get("delta"),
+            finish_reason=data.get("finish_reason"),
+            sources=sources,
+            error=data.get("error"),
+        )
 
-        with httpx.Client(timeout=60.0) as http_client:
-            with http_client.stream("POST", url, json=payload, headers=headers) as response:
-                if response.status_code == 401:
-                    raise AuthenticationError()
-                if response.status_code == 429:
-                    raise RateLimitError()
-                if not response.is_success:
-                    raise CencoriError(f"Request failed with status {response.status_code}")
-
-                for line in response.iter_lines():
-                    if not line or not line.startswith("data: "):
-                        continue
-
-                    data_str = line[6:]
-
-                    if data_str == "[DONE]":
-                        return
-
-                    try:
-                        data = json.loads(data_str)
-                        sources = None
-                        if "sources" in data and data["sources"]:
-                            sources = [RagSource(**s) for s in data["sources"]]
-
-                        yield RagStreamChunk(
-                            type=data.get("type", "content"),
-                            delta=data.get("delta"),
-                            finish_reason=data.get("finish_reason"),
-                            sources=sources,
-                            error=data.get("error"),
-                        )
-                    except json.JSONDecodeError:
-                        continue
+    @staticmethod
+    def _parse_rag(data: Dict[str, Any], model: str) -> RagResponse:
+        sources = None
+        if "sources" in data and data["sources"]:
+            sources = [RagSource(**s) for s in data["sources"]]
+
+        return RagResponse(
+            message={"role": "assistant", "content": data.get("message", {}).get("content", "")},
+            model=data.get("model", model),
+            provider=data.get("provider", ""),
+            usage=_parse_usage(data),
+            sources=sources,
+            latency_ms=data.get("latency_ms", 0),
+        )
 
     # =========================================================================
     # Responses API
@@ -480,29 +994,62 @@ class AIModule:
         Send a request to the OpenAI-compatible Responses API.
         Supports built-in tools: web_search_preview, file_search, code_interpreter.
         """
-        payload = request.__dict__ if hasattr(request, '__dict__') else request
-        # Ensure stream is False for synchronous
-        if isinstance(payload, dict):
-            payload["stream"] = False
+        data = self._client._request(
+            "POST", "/v1/responses", json=self._responses_payload(request, False)
+        )
+        return self._parse_responses(data)
 
-        data = self._client._request("POST", "/v1/responses", json=payload)
+    def responses_stream(
+        self,
+        request: ResponsesRequest,
+    ) -> TimedStream[Dict[str, Any]]:
+        """
+        Stream responses from the Responses API via SSE.
+        Yields dicts with 'type' and 'data' keys.
+        """
+        payload = self._responses_payload(request, True)
+        timer = self._timer(request.model, "/v1/responses")
+        return TimedStream(self._responses_events(payload, timer), timer)
 
+    def _responses_events(
+        self, payload: Dict[str, Any], timer: StreamTimer
+    ) -> Iterator[Dict[str, Any]]:
+        timer.start()
+        with self._client._stream("POST", "/v1/responses", json=payload, timer=timer) as response:
+            for event in iter_events(timer.body(response.iter_bytes())):
+                if event.data == DONE:
+                    return
+                if event.data.strip():
+                    if event.event.endswith(".delta"):
+                        timer.token()
+                    yield {"type": event.event, "data": event.json(self._client._codec.loads)}
+
+    @staticmethod
+    def _responses_payload(request: ResponsesRequest, stream: bool) -> Dict[str, Any]:
+        payload = dict(request.__dict__) if hasattr(request, "__dict__") else dict(request)
+        payload["stream"] = stream
+        return payload
+
+    @staticmethod
+    def _parse_responses(data: Dict[str, Any]) -> ResponsesResponse:
         output = []
         for item in data.get("output", []):
             content_parts = None
             if "content" in item and item["content"]:
                 content_parts = [ResponseContentPart(**c) for c in item["content"]]
-            output.append(ResponsesOutputItem(
-                id=item.get("id", ""),
-                type=item.get("type", ""),
-                status=item.get("status"),
-                role=item.get("role"),
-                content=content_parts,
-                call_id=item.get("call_id"),
-                name=item.get("name"),
-                arguments=item.get("arguments"),
-                error=item.get("error"),
-            ))
+            output.append(
+                ResponsesOutputItem(
+                    id=item.get("id", ""),
+                    type=item.get("type", ""),
+                    status=item.get("status"),
+                    role=item.get("role"),
+                    content=content_parts,
+                    call_id=item.get("call_id"),
+                    name=item.get("name"),
+                    arguments=item.get("arguments"),
+                    error=item.get("error"),
+                )
+            )
 
         return ResponsesResponse(
             id=data.get("id", ""),
@@ -515,52 +1062,58 @@ class AIModule:
             metadata=data.get("metadata"),
         )
 
-    def responses_stream(
+    # =========================================================================
+    # Fan-out Methods
+    # =========================================================================
+
+    def chat_many(
         self,
-        request: ResponsesRequest,
-    ) -> Iterator[Dict[str, Any]]:
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[ItemResult[ChatResponse]]:
         """
-        Stream responses from the Responses API via SSE.
-        Yields dicts with 'type' and 'data' keys.
+        Run many independent chat requests with bounded concurrency.
+
+        Args:
+            requests: Keyword arguments for :meth:`chat`, one dict per request
+            concurrency: Maximum requests in flight at once
+            ordered: Yield results in input order (False: as they finish)
+            on_progress: Called as ``on_progress(completed, total)``
+
+        Returns:
+            Iterator of ItemResult; a failed request carries its exception in
+            ``error`` instead of stopping the run
+
+        Example:
+            >>> prompts = ["Summarize A", "Summarize B"]
+            >>> for item in cencori.ai.chat_many(
+            ...     [{"messages": [{"role": "user", "content": p}]} for p in prompts],
+            ...     concurrency=16,
+            ... ):
+            ...     print(item.index, item.value.content if item.ok else item.error)
         """
-        payload = request.__dict__ if hasattr(request, '__dict__') else request
-        if isinstance(payload, dict):
-            payload["stream"] = True
+        return run_many(
+            lambda kwargs: self.chat(**kwargs), requests, concurrency, ordered, on_progress
+        )
 
-        url = f"{self._client._base_url}/v1/responses"
-        headers = {
-            "Content-Type": "application/json",
-            "CENCORI_API_KEY": self._client._api_key,
-        }
+    def embeddings_many(
+        self,
+        inputs: Iterable[Union[str, List[str]]],
+        model: str = "text-embedding-3-small",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[ItemResult[EmbeddingResponse]]:
+        """
+        Run one :meth:`embeddings` request per input with bounded concurrency.
 
-        with httpx.Client(timeout=60.0) as http_client:
-            with http_client.stream("POST", url, json=payload, headers=headers) as response:
-                if response.status_code == 401:
-                    raise AuthenticationError()
-                if response.status_code == 429:
-                    raise RateLimitError()
-                if not response.is_success:
-                    raise CencoriError(f"Request failed with status {response.status_code}")
-
-                event_type = ""
-                for line in response.iter_lines():
-                    line = line.strip()
-                    if not line:
-                        event_type = ""
-                        continue
-                    if line.startswith("event: "):
-                        event_type = line[7:].strip()
-                        continue
-                    if line.startswith("data: "):
-                        data_str = line[6:].strip()
-                        if not data_str:
-                            continue
-                        try:
-                            parsed = json.loads(data_str)
-                            yield {"type": event_type or "message", "data": parsed}
-                        except json.JSONDecodeError:
-                            continue
-                        event_type = ""
+        Same result and progress semantics as :meth:`chat_many`.
+        """
+        return run_many(
+            lambda input: self.embeddings(input, model), inputs, concurrency, ordered, on_progress
+        )
 
     # =========================================================================
     # Async Methods
@@ -568,7 +1121,7 @@ class AIModule:
 
     async def async_chat(
         self,
-        messages: List[Dict[str, str]],
+        messages: Union[List[Dict[str, str]], Conversation],
         model: str = "gemini-2.5-flash",
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -576,40 +1129,146 @@ class AIModule:
         tools: Optional[List[ToolDefinition]] = None,
         tool_choice: Optional[ToolChoice] = None,
         prompt: Optional[Dict[str, Any]] = None,
+        cache: Optional[bool] = None,
+        models: Optional[List[str]] = None,
     ) -> ChatResponse:
-        """Send a chat completion request asynchronously."""
-        payload: Dict[str, Any] = {
-            "messages": messages,
-            "model": model,
-            "stream": False,
-        }
+        """Send a chat completion request asynchronously; see :meth:`chat` for ``models``."""
+        if models is not None:
+            router = self._client.router
+            return await router.async_call(
+                models,
+                lambda candidate, attempt: self._async_chat(
+                    messages,
+                    candidate,
+                    temperature,
+                    max_tokens,
+                    user_id,
+                    tools,
+                    tool_choice,
+                    prompt,
+                    cache,
+                    router.retry,
+                    attempt,
+                ),
+            )
+        return await self._async_chat(
+            messages, model, temperature, max_tokens, user_id, tools, tool_choice, prompt, cache
+        )
 
-        if temperature is not None:
-            payload["temperature"] = temperature
-        if max_tokens is not None:
-            payload["maxTokens"] = max_tokens
-        if user_id is not None:
-            payload["userId"] = user_id
-        if tools is not None:
-            payload["tools"] = [t.__dict__ if hasattr(t, '__dict__') else t for t in tools]
-        if tool_choice is not None:
-            payload["toolChoice"] = tool_choice.__dict__ if hasattr(tool_choice, '__dict__') else tool_choice
-        if prompt is not None:
-            payload["prompt"] = prompt
+    async def _async_chat(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+        cache: Optional[bool] = None,
+        retry: Optional[RetryPolicy] = None,
+        attempt: Optional[RoutedAttempt] = None,
+    ) -> ChatResponse:
+        payload = self._chat_payload(
+            messages, model, False, temperature, max_tokens, user_id, tools, tool_choice, prompt
+        )
 
-        data = await self._client._async_request("POST", "/api/ai/chat", json=payload)
+        key = self._cache_key(payload, temperature, cache)
+        cached = self._cache_get(key)
+        if cached is not None:
+            if attempt is not None:
+                attempt.discard()
+            return self._parse_chat(cached, model)
+
+        estimated = await self._async_pace(model, payload["messages"], max_tokens)
+        if attempt is not None:
+            attempt.restart()
+        data = await self._client._async_request(
+            "POST",
+            "/api/ai/chat",
+            json=payload,
+            retry=retry,
+            hedge=temperature == 0,
+            content=self._chat_body(messages, payload),
+        )
+        self._settle(model, estimated, data)
 
-        return ChatResponse(
-            content=data.get("content", ""),
-            model=data.get("model", model),
-            provider=data.get("provider", ""),
-            usage=Usage(
-                prompt_tokens=data.get("usage", {}).get("prompt_tokens", 0),
-                completion_tokens=data.get("usage", {}).get("completion_tokens", 0),
-                total_tokens=data.get("usage", {}).get("total_tokens", 0),
+        response = self._parse_chat(data, model)
+        self._cache_set(key, data)
+        return response
+
+    def async_chat_stream(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str = "gemini-2.5-flash",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+    ) -> AsyncTimedStream[StreamChunk]:
+        """
+        Stream a chat completion asynchronously.
+
+        Closing the iterator (``await stream.aclose()``) or cancelling the
+        consuming task aborts the upstream request immediately.
+        """
+        payload = self._chat_payload(
+            messages, model, True, temperature, max_tokens, user_id, tools, tool_choice, prompt
+        )
+        timer = self._timer(model, "/api/ai/chat")
+        content = self._chat_body(messages, payload)
+        events = self._async_chat_events(payload, payload["messages"], max_tokens, timer, content)
+        return AsyncTimedStream(events, timer)
+
+    async def _async_chat_events(
+        self,
+        payload: Dict[str, Any],
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int],
+        timer: StreamTimer,
+        content: Optional[bytes] = None,
+    ) -> AsyncIterator[StreamChunk]:
+        await self._async_pace(payload["model"], messages, max_tokens)
+        timer.start()
+        async with self._client._async_stream(
+            "POST", "/api/ai/chat", json=payload, timer=timer, content=content
+        ) as response:
+            async for event in aiter_events(timer.abody(response.aiter_bytes())):
+                if event.data == DONE:
+                    return
+                chunk = self._chat_chunk(event.json(self._client._codec.loads))
+                if chunk.delta:
+                    timer.token()
+                if chunk.error is not None:
+                    timer.finish(False)
+                yield chunk
+                if chunk.error is not None:
+                    return
+
+    async def async_chat_race(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        models: List[str],
+        stream: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+        grace: float = 0.0,
+    ) -> RaceResult[Union[ChatResponse, AsyncTimedStream[StreamChunk]]]:
+        """Race a chat request across models asynchronously; the losers are cancelled."""
+        return await async_race(
+            models,
+            lambda model: self.async_chat_stream(
+                messages, model, temperature, max_tokens, user_id, tools, tool_choice, prompt
             ),
-            cost_usd=data.get("cost_usd", 0.0),
-            finish_reason=data.get("finish_reason"),
+            stream,
+            grace,
+            self._client.router,
         )
 
     async def async_completions(
@@ -631,31 +1290,113 @@ class AIModule:
         self,
         input: Union[str, List[str]],
         model: str = "text-embedding-3-small",
+        cache: Optional[bool] = None,
+        compact: bool = False,
     ) -> EmbeddingResponse:
-        """Generate embeddings asynchronously."""
-        payload: Dict[str, Any] = {
-            "input": input,
-            "model": model,
-        }
-
-        data = await self._client._async_request("POST", "/api/ai/embeddings", json=payload)
-
-        embeddings = [item["embedding"] for item in data.get("data", [])]
+        """
+        Generate embeddings asynchronously; see :meth:`embeddings`.
 
-        return EmbeddingResponse(
-            model=data.get("model", model),
-            embeddings=embeddings,
-            usage=EmbeddingUsage(
-                total_tokens=data.get("usage", {}).get("total_tokens", 0),
-            ),
+        With ``embedding_coalescing`` on the client, a single-text call joins
+        concurrent ones in one request (see :class:`EmbeddingCoalescing`).
+        """
+        coalescing = self._client._embedding_coalescing
+        if coalescing is not None and isinstance(input, str) and not compact:
+            if self._coalescer is None:
+                self._coalescer = EmbeddingCoalescer(coalescing, self.async_embeddings)
+            return await self._coalescer.embed(input, model, cache)
+
+        store = self._embedding_store(cache)
+        if store is None and isinstance(input, str) and not compact:
+            payload: Dict[str, Any] = {
+                "input": input,
+                "model": model,
+            }
+            data = await self._client._async_request(
+                "POST", "/api/ai/embeddings", json=payload, hedge=True
+            )
+            return self._parse_embeddings(data, model)
+
+        texts = [input] if isinstance(input, str) else list(input)
+        cached: List[Optional[List[float]]] = (
+            store.get_many(model, texts) if store is not None else [None] * len(texts)
         )
+        misses = self._embedding_misses(texts, cached)
+        fresh = None
+        if misses:
+
+            async def send(batch: List[str]) -> EmbeddingResponse:
+                payload = {"input": batch, "model": model}
+                if compact:
+                    body = await self._client._async_request_bytes(
+                        "POST", "/api/ai/embeddings", json=payload, hedge=True
+                    )
+                    return self._checked_compact(
+                        body, model, batch, store, self._client._codec.loads
+                    )
+                data = await self._client._async_request(
+                    "POST", "/api/ai/embeddings", json=payload, hedge=True
+                )
+                return self._checked_embeddings(data, model, batch, store)
+
+            batching = self._client._embedding_batching
+            batches = batching.split(misses)
+            if len(batches) == 1:
+                fresh = await send(batches[0])
+            else:
+                results = [
+                    item
+                    async for item in async_run_many(
+                        send, batches, concurrency=batching.max_parallel
+                    )
+                ]
+                fresh = self._combine_embeddings(results, model, compact)
+        return self._merge_embeddings(texts, cached, misses, fresh, model, compact)
 
     async def async_generate_object(
         self,
         params: GenerateObjectRequest,
+        cache: Optional[bool] = None,
     ) -> GenerateObjectResponse:
         """Generate structured output asynchronously."""
-        return self.generate_object(params)
+        payload = self._generate_object_payload(params)
+        key = self._cache_key(payload, params.temperature, cache)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return self._parse_generate_object(cached, self._client._codec.loads)
+
+        data = await self._client._async_request("POST", "/api/ai/chat", json=payload)
+        response = self._parse_generate_object(data, self._client._codec.loads)
+        self._cache_set(key, data)
+        return response
+
+    def async_generate_object_stream(
+        self, params: GenerateObjectRequest
+    ) -> AsyncTimedStream[GenerateObjectStreamChunk]:
+        """Stream structured output asynchronously; see :meth:`generate_object_stream`."""
+        payload = self._generate_object_payload(params)
+        payload["stream"] = True
+        timer = self._timer(params.model, "/api/ai/chat")
+        return AsyncTimedStream(self._async_object_events(payload, params.model, timer), timer)
+
+    async def _async_object_events(
+        self, payload: Dict[str, Any], model: str, timer: StreamTimer
+    ) -> AsyncIterator[GenerateObjectStreamChunk]:
+        stream = StreamAccumulator(model=model)
+        parser = PartialJSONParser()
+
+        timer.start()
+        async with self._client._async_stream(
+            "POST", "/api/ai/chat", json=payload, timer=timer
+        ) as response:
+            async for event in aiter_events(timer.abody(response.aiter_bytes())):
+                if event.data == DONE:
+                    break
+                partial = self._object_progress(
+                    stream, parser, event.json(self._client._codec.loads), timer
+                )
+                if partial is not None:
+                    yield GenerateObjectStreamChunk(object=partial)
+        yield self._object_final(stream, self._client._codec.loads)
 
     async def async_generate_image(
         self,
@@ -668,7 +1409,9 @@ class AIModule:
         response_format: Optional[str] = None,
     ) -> ImageGenerationResponse:
         """Generate images asynchronously."""
-        return self.generate_image(prompt, model, n, size, quality, style, response_format)
+        payload = self._image_payload(prompt, model, n, size, quality, style, response_format)
+        data = await self._client._async_request("POST", "/api/ai/images/generate", json=payload)
+        return self._parse_image(data, model)
 
     async def async_rag(
         self,
@@ -682,11 +1425,322 @@ class AIModule:
         include_sources: bool = True,
     ) -> RagResponse:
         """RAG asynchronously."""
-        return self.rag(model, messages, namespace, temperature, max_tokens, limit, threshold, include_sources)
+        payload = self._rag_payload(
+            model,
+            messages,
+            namespace,
+            False,
+            temperature,
+            max_tokens,
+            limit,
+            threshold,
+            include_sources,
+        )
+        data = await self._client._async_request("POST", "/api/ai/rag", json=payload)
+        return self._parse_rag(data, model)
+
+    def async_rag_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        namespace: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        limit: int = 5,
+        threshold: float = 0.5,
+        include_sources: bool = True,
+    ) -> AsyncTimedStream[RagStreamChunk]:
+        """Stream RAG responses asynchronously; closing the iterator aborts the request."""
+        payload = self._rag_payload(
+            model,
+            messages,
+            namespace,
+            True,
+            temperature,
+            max_tokens,
+            limit,
+            threshold,
+            include_sources,
+        )
+        timer = self._timer(model, "/api/ai/rag")
+        return AsyncTimedStream(self._async_rag_events(payload, timer), timer)
+
+    async def _async_rag_events(
+        self, payload: Dict[str, Any], timer: StreamTimer
+    ) -> AsyncIterator[RagStreamChunk]:
+        timer.start()
+        async with self._client._async_stream(
+            "POST", "/api/ai/rag", json=payload, timer=timer
+        ) as response:
+            async for event in aiter_events(timer.abody(response.aiter_bytes())):
+                if event.data == DONE:
+                    return
+                chunk = self._rag_chunk(event.json(self._client._codec.loads))
+                if chunk.delta:
+                    timer.token()
+                yield chunk
 
     async def async_responses(
         self,
         request: ResponsesRequest,
     ) -> ResponsesResponse:
         """Responses API asynchronously."""
-        return self.responses(request)
+        data = await self._client._async_request(
+            "POST", "/v1/responses", json=self._responses_payload(request, False)
+        )
+        return self._parse_responses(data)
+
+    def async_responses_stream(
+        self,
+        request: ResponsesRequest,
+    ) -> AsyncTimedStream[Dict[str, Any]]:
+        """
+        Stream the Responses API asynchronously.
+        Yields dicts with 'type' and 'data' keys; closing the iterator aborts the request.
+        """
+        payload = self._responses_payload(request, True)
+        timer = self._timer(request.model, "/v1/responses")
+        return AsyncTimedStream(self._async_responses_events(payload, timer), timer)
+
+    async def _async_responses_events(
+        self, payload: Dict[str, Any], timer: StreamTimer
+    ) -> AsyncIterator[Dict[str, Any]]:
+        timer.start()
+        async with self._client._async_stream(
+            "POST", "/v1/responses", json=payload, timer=timer
+        ) as response:
+            async for event in aiter_events(timer.abody(response.aiter_bytes())):
+                if event.data == DONE:
+                    return
+                if event.data.strip():
+                    if event.event.endswith(".delta"):
+                        timer.token()
+                    yield {"type": event.event, "data": event.json(self._client._codec.loads)}
+
+    def async_chat_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[ChatResponse]]:
+        """Async version of :meth:`chat_many`; closing the iterator cancels in-flight calls."""
+
+        async def call(kwargs: Dict[str, Any]) -> ChatResponse:
+            return await self.async_chat(**kwargs)
+
+        return async_run_many(call, requests, concurrency, ordered, on_progress)
+
+    def async_embeddings_many(
+        self,
+        inputs: Iterable[Union[str, List[str]]],
+        model: str = "text-embedding-3-small",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[EmbeddingResponse]]:
+        """Async version of :meth:`embeddings_many`."""
+
+        async def call(input: Union[str, List[str]]) -> EmbeddingResponse:
+            return await self.async_embeddings(input, model)
+
+        return async_run_many(call, inputs, concurrency, ordered, on_progress)
+
+
+class AsyncAIModule:
+    """
+    AI module for :class:`~cencori.AsyncCencori`.
+
+    Same API as :class:`AIModule`, but every method is a coroutine and the
+    streaming methods return async iterators over the shared async pool.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._ai = AIModule(client)
+
+    async def chat(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str = "gemini-2.5-flash",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+        cache: Optional[bool] = None,
+        models: Optional[List[str]] = None,
+    ) -> ChatResponse:
+        """Send a chat completion request (non-streaming)."""
+        return await self._ai.async_chat(
+            messages,
+            model,
+            temperature,
+            max_tokens,
+            user_id,
+            tools,
+            tool_choice,
+            prompt,
+            cache,
+            models,
+        )
+
+    def chat_stream(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str = "gemini-2.5-flash",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+    ) -> AsyncTimedStream[StreamChunk]:
+        """Stream a chat completion; closing the iterator aborts the request."""
+        return self._ai.async_chat_stream(
+            messages, model, temperature, max_tokens, user_id, tools, tool_choice, prompt
+        )
+
+    async def chat_race(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        models: List[str],
+        stream: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        user_id: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: Optional[ToolChoice] = None,
+        prompt: Optional[Dict[str, Any]] = None,
+        grace: float = 0.0,
+    ) -> RaceResult[Union[ChatResponse, AsyncTimedStream[StreamChunk]]]:
+        """Race a chat request across models; see :meth:`AIModule.chat_race`."""
+        return await self._ai.async_chat_race(
+            messages,
+            models,
+            stream,
+            temperature,
+            max_tokens,
+            user_id,
+            tools,
+            tool_choice,
+            prompt,
+            grace,
+        )
+
+    async def completions(
+        self,
+        prompt: str,
+        model: str = "gemini-2.5-flash",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> ChatResponse:
+        """Create a text completion (wraps chat internally)."""
+        return await self._ai.async_completions(prompt, model, temperature, max_tokens)
+
+    async def embeddings(
+        self,
+        input: Union[str, List[str]],
+        model: str = "text-embedding-3-small",
+        cache: Optional[bool] = None,
+        compact: bool = False,
+    ) -> EmbeddingResponse:
+        """Generate embeddings for text, served from the embedding cache when configured."""
+        return await self._ai.async_embeddings(input, model, cache, compact)
+
+    async def generate_object(
+        self, params: GenerateObjectRequest, cache: Optional[bool] = None
+    ) -> GenerateObjectResponse:
+        """Generate structured output matching a JSON schema."""
+        return await self._ai.async_generate_object(params, cache)
+
+    def generate_object_stream(
+        self, params: GenerateObjectRequest
+    ) -> AsyncTimedStream[GenerateObjectStreamChunk]:
+        """Stream structured output as progressively more complete partial objects."""
+        return self._ai.async_generate_object_stream(params)
+
+    async def generate_image(
+        self,
+        prompt: str,
+        model: str = "dall-e-3",
+        n: Optional[int] = None,
+        size: Optional[str] = None,
+        quality: Optional[str] = None,
+        style: Optional[str] = None,
+        response_format: Optional[str] = None,
+    ) -> ImageGenerationResponse:
+        """Generate images from a text prompt."""
+        return await self._ai.async_generate_image(
+            prompt, model, n, size, quality, style, response_format
+        )
+
+    async def rag(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        namespace: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        limit: int = 5,
+        threshold: float = 0.5,
+        include_sources: bool = True,
+    ) -> RagResponse:
+        """RAG chat with automatic memory context."""
+        return await self._ai.async_rag(
+            model, messages, namespace, temperature, max_tokens, limit, threshold, include_sources
+        )
+
+    def rag_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        namespace: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        limit: int = 5,
+        threshold: float = 0.5,
+        include_sources: bool = True,
+    ) -> AsyncTimedStream[RagStreamChunk]:
+        """Stream RAG responses; closing the iterator aborts the request."""
+        return self._ai.async_rag_stream(
+            model, messages, namespace, temperature, max_tokens, limit, threshold, include_sources
+        )
+
+    async def responses(self, request: ResponsesRequest) -> ResponsesResponse:
+        """Send a request to the OpenAI-compatible Responses API."""
+        return await self._ai.async_responses(request)
+
+    def responses_stream(self, request: ResponsesRequest) -> AsyncTimedStream[Dict[str, Any]]:
+        """Stream the Responses API; yields dicts with 'type' and 'data' keys."""
+        return self._ai.async_responses_stream(request)
+
+    def chat_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[ChatResponse]]:
+        """Run many chat requests with bounded concurrency; see :meth:`AIModule.chat_many`."""
+        return self._ai.async_chat_many(requests, concurrency, ordered, on_progress)
+
+    def embeddings_many(
+        self,
+        inputs: Iterable[Union[str, List[str]]],
+        model: str = "text-embedding-3-small",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[EmbeddingResponse]]:
+        """Run one embeddings request per input with bounded concurrency."""
+        return self._ai.async_embeddings_many(inputs, model, concurrency, ordered, on_progress)
+
+
+def _parse_usage(data: Dict[str, Any]) -> Usage:
+    usage = data.get("usage", {})
+    return Usage(
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+        total_tokens=usage.get("total_tokens", 0),
+    )
@@ -0,0 +1,247 @@
+"""
+Batch module — resumable offline runs over JSONL request files.
+
+Each input line is one request::
+
+    {"custom_id": "row-1", "type": "chat", "params": {"messages": [...], "model": "gpt-4o"}}
+    {"custom_id": "row-2", "type": "embeddings", "params": {"input": "hello"}}
+    {"custom_id": "row-3", "type": "vision", "params": {"image_url": "https://..."}}
+
+``type`` defaults to ``"chat"`` and ``params`` are the keyword arguments of
+the matching method (``ai.chat``, ``ai.embeddings``, ``vision.analyze``,
+``documents.extract``). Each output line holds the ``custom_id``, the input
+line's byte ``offset``, and either ``response`` or ``error``. An ``error``
+whose ``retryable`` flag is set (rate limits, timeouts, 5xx) is sent again
+when the run is resumed.
+
+Example:
+    >>> from cencori import Cencori
+    >>> cencori = Cencori()
+    >>> summary = cencori.batch.run("requests.jsonl", "results.jsonl", concurrency=64)
+    >>> print(summary.succeeded, summary.failed, summary.skipped)
+"""
+
+import json
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, is_dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .errors import CencoriError
+from .fanout import ProgressCallback, run_many
+from .retry import is_transient
+from .types import BatchSummary
+
+if TYPE_CHECKING:
+    from .client import Cencori
+
+DEFAULT_BATCH_CONCURRENCY = 32
+DEFAULT_SYNC_EVERY = 1000
+DEFAULT_SYNC_INTERVAL = 1.0
+
+
+class BatchModule:
+    """
+    Runs JSONL request files through the client with a resumable checkpoint.
+
+    Accessed via ``cencori.batch``. Requests run through the same pool,
+    retries and limiters as direct calls.
+    """
+
+    def __init__(self, client: "Cencori") -> None:
+        self._client = client
+
+    def run(
+        self,
+        input_path: str,
+        output_path: str,
+        checkpoint_path: Optional[str] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ) -> BatchSummary:
+        """
+        Run every request in ``input_path`` and write results to ``output_path``.
+
+        Results are appended as requests finish (not in input order). Every
+        ``sync_every`` results or ``sync_interval`` seconds, whichever comes
+        first, and when the run ends, the output is synced to disk and then
+        the checkpoint durably records each new result's input line byte
+        offset and the output file's size. Rerunning the same command after a
+        crash or kill skips the recorded lines and trims the output past them,
+        so only the results since the last sync are requested again. An
+        existing output file without a checkpoint is overwritten.
+
+        Requests that fail for good (a 4xx such as a bad request) count as
+        done. Requests that fail transiently, after the client's own retries
+        (429, 5xx, timeouts), are written with ``"retryable": true`` on their
+        error but not marked done: a rerun sends them again and appends the
+        new result, so the last output line for an ``offset`` is current.
+
+        Args:
+            input_path: JSONL file of requests
+            output_path: JSONL file for results
+            checkpoint_path: Checkpoint file (default: ``output_path + ".checkpoint"``)
+            concurrency: Maximum requests in flight at once
+            on_progress: Called as ``on_progress(completed, None)`` per result
+            sync_every: Most results written between syncs
+            sync_interval: Most seconds between syncs
+
+        Returns:
+            BatchSummary with succeeded/failed/skipped counts
+        """
+        if sync_every < 1:
+            raise ValueError("sync_every must be at least 1")
+        checkpoint_path = checkpoint_path or output_path + ".checkpoint"
+        done, output_size, checkpoint_size = _load_checkpoint(checkpoint_path)
+        summary = BatchSummary(skipped=len(done))
+        started = time.monotonic()
+
+        with ExitStack() as files:
+            output = files.enter_context(_open_at(output_path, output_size))
+            checkpoint = files.enter_context(_open_at(checkpoint_path, checkpoint_size))
+            entries: List[bytes] = []
+            synced = time.monotonic()
+
+            def commit() -> None:
+                # Output first: an entry must never point at unsynced results.
+                _sync(output)
+                checkpoint.write(b"".join(entries))
+                _sync(checkpoint)
+                entries.clear()
+
+            try:
+                for item in run_many(
+                    self._execute,
+                    _pending_lines(input_path, done),
+                    concurrency=concurrency,
+                    ordered=False,
+                    on_progress=on_progress,
+                ):
+                    assert item.value is not None  # _execute never raises
+                    record = item.value
+                    error = record.get("error")
+                    if error is None:
+                        summary.succeeded += 1
+                    else:
+                        summary.failed += 1
+                    output.write(json.dumps(record, default=_jsonable).encode() + b"\n")
+                    # Transient failures keep the output size but stay pending.
+                    status = " retry" if error is not None and error["retryable"] else ""
+                    entries.append(f"{record['offset']} {output.tell()}{status}\n".encode())
+                    now = time.monotonic()
+                    if len(entries) >= sync_every or now - synced >= sync_interval:
+                        commit()
+                        synced = now
+            finally:
+                if entries:
+                    commit()
+
+        summary.elapsed_s = time.monotonic() - started
+        return summary
+
+    def _execute(self, line: Tuple[int, bytes]) -> Dict[str, Any]:
+        offset, raw = line
+        record: Dict[str, Any] = {"custom_id": None, "offset": offset}
+        try:
+            request = json.loads(raw)
+            record["custom_id"] = request.get("custom_id")
+            kind = request.get("type", "chat")
+            record["type"] = kind
+            handler = self._handler(kind)
+            record["response"] = handler(**request.get("params", {}))
+            record["error"] = None
+        except Exception as exc:  # noqa: BLE001 - recorded on the output line
+            record["response"] = None
+            record["error"] = _error_record(exc)
+        return record
+
+    def _handler(self, kind: str) -> Callable[..., Any]:
+        handlers: Dict[str, Callable[..., Any]] = {
+            "chat": self._client.ai.chat,
+            "embeddings": self._client.ai.embeddings,
+            "vision": self._client.vision.analyze,
+            "documents": self._client.documents.extract,
+        }
+        if kind not in handlers:
+            raise ValueError(f"Unknown batch request type: {kind!r}")
+        return handlers[kind]
+
+
+def _load_checkpoint(path: str) -> Tuple[Set[int], int, int]:
+    """
+    Read a checkpoint: completed input offsets, the output size they account
+    for, and the length of the checkpoint up to its last complete entry.
+
+    Entries are ``"<offset> <output size>"``, with a trailing ``retry`` for
+    lines that failed transiently and are not done.
+    """
+    done: Set[int] = set()
+    output_size = 0
+    checkpoint_size = 0
+    if not os.path.exists(path):
+        return done, output_size, checkpoint_size
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # torn final write
+            offset, size, *status = line.split()
+            if not status:
+                done.add(int(offset))
+            output_size = int(size)
+            checkpoint_size += len(line)
+    return done, output_size, checkpoint_size
+
+
+@contextmanager
+def _open_at(path: str, size: int) -> Iterator[BinaryIO]:
+    """Open ``path`` for writing, truncated to ``size`` bytes and positioned at its end."""
+    with open(path, "r+b" if os.path.exists(path) else "wb") as f:
+        f.truncate(size)
+        f.seek(size)
+        yield f
+
+
+def _sync(f: BinaryIO) -> None:
+    """Flush ``f`` through to the disk."""
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _pending_lines(path: str, done: Set[int]) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for non-blank input lines not yet completed."""
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            start = offset
+            offset += len(line)
+            if start not in done and line.strip():
+                yield start, line
+
+
+def _error_record(exc: Exception) -> Dict[str, Any]:
+    error: Dict[str, Any] = {"type": type(exc).__name__, "message": str(exc)}
+    if isinstance(exc, CencoriError):
+        error["status_code"] = exc.status_code
+        error["code"] = exc.code
+    error["retryable"] = is_transient(exc)
+    return error
+
+
+def _jsonable(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
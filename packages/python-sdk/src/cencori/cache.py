@@ -0,0 +1,241 @@
+"""Deterministic response cache: in-memory LRU tier over an optional SQLite tier."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+# Rows looked at per eviction query, and the longest a memory-tier hit waits
+# before its recency is written to the SQLite tier.
+_EVICT_BATCH = 64
+_TOUCH_LIMIT = 256
+# Expired rows are filtered on read; purging them is a table scan, done at
+# most this often.
+_PURGE_INTERVAL = 60.0
+
+
+def cache_key(endpoint: str, payload: Dict[str, Any], scope: str = "") -> str:
+    """
+    SHA-256 of the endpoint and the canonical JSON form of a request payload.
+
+    ``scope`` separates callers that must not see each other's responses;
+    the client passes its API key.
+    """
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=lambda value: value.__dict__,
+    )
+    return hashlib.sha256(f"{scope}\n{endpoint}\n{canonical}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of raw API responses for repeatable requests.
+
+    Entries are keyed by :func:`cache_key` and stored as encoded JSON, so a
+    hit always returns a fresh copy. The memory tier keeps the
+    ``max_entries`` most recently used responses. When ``path`` is given, a
+    SQLite tier persists responses across processes and runs; it expires
+    entries after ``ttl`` seconds and evicts least recently used entries once
+    the stored bytes exceed ``max_bytes``.
+
+    ``chat`` and ``generate_object`` consult the cache only when the
+    temperature is 0 or the call passes ``cache=True``. Keys include the
+    client's API key, so clients with different keys can share one cache
+    without seeing each other's responses.
+
+    Args:
+        max_entries: Capacity of the in-memory LRU tier (0 disables it)
+        path: SQLite database file for the persistent tier (None for memory only)
+        ttl: Seconds an entry stays valid (None for no expiry)
+        max_bytes: Size bound for the SQLite tier (None for unbounded)
+
+    Example:
+        >>> from cencori import Cencori, ResponseCache
+        >>> cache = ResponseCache(path=".cencori-cache.db", ttl=7 * 86400)
+        >>> cencori = Cencori(cache=cache)
+        >>> cencori.ai.chat(messages=[...], temperature=0)  # served locally next time
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        # SQLite tier bookkeeping: stored bytes (kept as a running total, so
+        # another process's writes are only seen when it is recounted), when
+        # expired rows were last purged, and memory hits not yet written there.
+        self._bytes = 0
+        self._purged = 0.0
+        self._touched: Dict[str, float] = {}
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            self._bytes = self._stored_bytes()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for ``key``, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            value = self._memory_get(key, now)
+            if value is not None and self._db is not None:
+                self._touch(key, now)
+            elif value is None and self._db is not None:
+                value = self._db_get(key, now)
+                if value is not None:
+                    self._memory_put(key, value, now)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        data: Dict[str, Any] = json.loads(value)
+        return data
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Store a response under ``key``."""
+        value = json.dumps(response, separators=(",", ":")).encode()
+        now = time.time()
+        with self._lock:
+            self._memory_put(key, value, now)
+            if self._db is not None:
+                old = self._db.execute(
+                    "SELECT size FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value), now, now),
+                )
+                self._touched.pop(key, None)
+                self._bytes += len(value) - (old[0] if old else 0)
+                self._evict(now)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._bytes = 0
+
+    def close(self) -> None:
+        """Close the SQLite tier."""
+        with self._lock:
+            if self._db is not None:
+                self._flush_touched()
+                self._db.close()
+                self._db = None
+
+    # ── memory tier ────────────────────────────────────────────
+
+    def _memory_get(self, key: str, now: float) -> Optional[bytes]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        created, value = entry
+        if self._expired(created, now):
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_put(self, key: str, value: bytes, created: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # ── SQLite tier ────────────────────────────────────────────
+
+    def _db_get(self, key: str, now: float) -> Optional[bytes]:
+        assert self._db is not None
+        row = self._db.execute(
+            "SELECT value, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, created = row
+        if self._expired(created, now):
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._bytes -= len(value)
+            return None
+        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return bytes(value)
+
+    def _touch(self, key: str, now: float) -> None:
+        """Note a memory-tier hit; written to the SQLite tier in batches."""
+        self._touched[key] = now
+        if len(self._touched) >= _TOUCH_LIMIT:
+            self._flush_touched()
+
+    def _flush_touched(self) -> None:
+        assert self._db is not None
+        if self._touched:
+            self._db.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _stored_bytes(self) -> int:
+        assert self._db is not None
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(total)
+
+    def _evict(self, now: float) -> None:
+        assert self._db is not None
+        if self.ttl is not None and now - self._purged >= min(self.ttl, _PURGE_INTERVAL):
+            self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+            self._purged = now
+            self._bytes = self._stored_bytes()
+        if self.max_bytes is None or self._bytes <= self.max_bytes:
+            return
+        # Recount (other processes may have written or evicted) and bring
+        # recency up to date before picking the least recently used rows.
+        self._flush_touched()
+        self._bytes = self._stored_bytes()
+        while self._bytes > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT ?", (_EVICT_BATCH,)
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._bytes -= size
+                if self._bytes <= self.max_bytes:
+                    break
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
@@ -0,0 +1,54 @@
+"""Splitting of large embedding inputs into bounded requests."""
+
+from dataclasses import dataclass
+from typing import List
+
+from .tokens import estimate_text_tokens
+
+
+@dataclass
+class EmbeddingBatching:
+    """
+    How ``ai.embeddings`` splits a large input list into requests.
+
+    Inputs are packed in order into batches of at most ``max_items`` texts
+    and about ``max_tokens`` tokens (by :func:`estimate_text_tokens`); a
+    single text larger than ``max_tokens`` is sent on its own. Batches are
+    dispatched ``max_parallel`` at a time over the connection pool, each
+    retried on its own under the client's retry policy, and the vectors are
+    reassembled in input order with the usage summed.
+
+    Args:
+        max_items: Maximum texts per request
+        max_tokens: Approximate token budget per request
+        max_parallel: Batches in flight at once for one call
+
+    Example:
+        >>> from cencori import Cencori, EmbeddingBatching
+        >>> cencori = Cencori(embedding_batching=EmbeddingBatching(max_items=512, max_parallel=8))
+        >>> cencori.ai.embeddings(fifty_thousand_strings)
+    """
+
+    max_items: int = 256
+    max_tokens: int = 100_000
+    max_parallel: int = 4
+
+    def split(self, texts: List[str]) -> List[List[str]]:
+        """Pack ``texts`` in order into batches within both limits."""
+        if self.max_items < 1 or self.max_tokens < 1:
+            raise ValueError("max_items and max_tokens must be at least 1")
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = estimate_text_tokens(text)
+            if current and (
+                len(current) >= self.max_items or current_tokens + tokens > self.max_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
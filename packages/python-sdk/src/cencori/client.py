@@ -1,12 +1,37 @@
 """Cencori SDK client."""
 
-from typing import Any, Dict, Optional, cast
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 import httpx
 
-from .agents import AgentsModule
-from .ai import AIModule
+from .agents import AgentsModule, AsyncAgentsModule
+from .ai import AIModule, AsyncAIModule
 from .api_keys import APIKeysModule
+from .batch import BatchModule
+from .cache import ResponseCache
+from .chunking import EmbeddingBatching
+from .codec import JSONCodec, default_codec
+from .coalesce import EmbeddingCoalescing
+from .embedding_cache import EmbeddingCache
+from .hedging import HedgePolicy, Hedger
+from .concurrency import AdaptiveConcurrency, Permit
 from .errors import (
     AuthenticationError,
     CencoriError,
@@ -15,14 +40,43 @@ from .errors import (
     RateLimitError,
     SafetyError,
 )
-from .memory import MemoryModule
-from .metrics import MetricsModule
+from .memory import AsyncMemoryModule, MemoryModule
+from .metrics import AsyncMetricsModule, MetricsModule
 from .projects import ProjectsModule
-from .sessions import SessionsModule
-from .telemetry import TelemetryModule
-from .vision import VisionModule
-from .voice import VoiceModule
-from .documents import DocumentsModule
+from .ratelimit import RateLimiter
+from .retry import RETRYABLE_EXCEPTIONS, RetryPolicy, parse_retry_after
+from .routing import ModelRouter
+from .sessions import AsyncSessionsModule, SessionsModule
+from .stream_timeout import AsyncWatchedStream, StreamTimeout, WatchedStream
+from .telemetry import AsyncTelemetryModule, TelemetryModule
+from .timing import StreamStats, StreamTimer
+from .tokens import ContextFitter
+from .vision import AsyncVisionModule, VisionModule
+from .voice import AsyncVoiceModule, VoiceModule
+from .documents import AsyncDocumentsModule, DocumentsModule
+
+_ClientT = TypeVar("_ClientT", bound="BaseClient")
+
+# Connection pool defaults shared by the sync and async transports.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """
+    Parked async generator that closes ``client`` when its event loop shuts down.
+
+    Once started on a loop, the loop's ``shutdown_asyncgens()`` (run by
+    ``asyncio.run()``) closes it there, the only loop that can still close
+    the client's connections.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
 
 
 class ComputeModule:
@@ -72,25 +126,10 @@ class VectorsSubmodule:
         raise NotImplementedError("Storage module coming soon")
 
 
-class Cencori:
+class BaseClient:
     """
-    Cencori SDK client.
-
-    One SDK for AI Gateway, Compute, Workflow, and Storage.
-    Every operation is secured, logged, and tracked.
-
-    Args:
-        api_key: Your Cencori API key (starts with 'csk_')
-        base_url: API base URL (default: https://cencori.com)
-        timeout: Request timeout in seconds (default: 30)
-
-    Example:
-        >>> from cencori import Cencori
-        >>> cencori = Cencori(api_key="csk_...")
-        >>> response = cencori.ai.chat(
-        ...     messages=[{"role": "user", "content": "Hello!"}]
-        ... )
-        >>> print(response.content)
+    Configuration, pooled transports and request machinery shared by
+    :class:`Cencori` and :class:`AsyncCencori`.
     """
 
     def __init__(
@@ -98,6 +137,23 @@ class Cencori:
         api_key: Optional[str] = None,
         base_url: str = "https://cencori.com",
         timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        retry: Optional[RetryPolicy] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        embedding_batching: Optional[EmbeddingBatching] = None,
+        embedding_coalescing: Optional[EmbeddingCoalescing] = None,
+        stream_stats: Optional[StreamStats] = None,
+        stream_timeout: Optional[StreamTimeout] = None,
+        router: Optional[ModelRouter] = None,
+        hedging: Optional[HedgePolicy] = None,
+        context_fitter: Optional[ContextFitter] = None,
+        json_codec: Optional[JSONCodec] = None,
     ) -> None:
         import os
 
@@ -107,29 +163,45 @@ class Cencori:
         if not resolved_api_key:
             raise ValueError(
                 "Cencori API key is required. "
-                "Pass it via Cencori(api_key='csk_...') or set CENCORI_API_KEY environment variable."
+                f"Pass it via {type(self).__name__}(api_key='csk_...') "
+                "or set CENCORI_API_KEY environment variable."
             )
 
         self._api_key = resolved_api_key
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
-
-        # Initialize modules
-        self.ai = AIModule(self)
-        self.vision = VisionModule(self)
-        self.voice = VoiceModule(self)
-        self.documents = DocumentsModule(self)
-        self.agents = AgentsModule(self)
-        self.memory = MemoryModule(self)
-        self.sessions = SessionsModule(self)
-        self.telemetry = TelemetryModule(self)
-        self.projects = ProjectsModule(self)
-        self.api_keys = APIKeysModule(self)
-        self.metrics = MetricsModule(self)
-
-        self.compute = ComputeModule()
-        self.workflow = WorkflowModule()
-        self.storage = StorageModule()
+        self._limits = limits or DEFAULT_LIMITS
+        self._http2 = http2
+        self._retry = retry or RetryPolicy()
+        self._concurrency = concurrency
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._embedding_cache = embedding_cache
+        self._embedding_batching = embedding_batching or EmbeddingBatching()
+        self._embedding_coalescing = embedding_coalescing
+        # Per-model TTFT / throughput of completed streams.
+        self.stream_stats = stream_stats or StreamStats()
+        self._stream_timeout = stream_timeout or StreamTimeout()
+        # Latency/error scores behind ``ai.chat(models=[...])``.
+        self.router = router or ModelRouter()
+        self._hedger = Hedger(hedging) if hedging is not None else None
+        self._context_fitter = context_fitter
+        self._codec = json_codec or default_codec()
+
+        # Pooled transports are created lazily on first use.
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._async_http_client = async_http_client
+        self._owns_async_http_client = async_http_client is None
+        self._async_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Owned async clients, each with the generator that closes it with its loop.
+        self._async_http_clients: List[Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]] = []
+        self._pool_lock = threading.Lock()
+
+        self._init_modules()
+
+    def _init_modules(self) -> None:
+        """Attach the API modules; implemented by each client class."""
 
     # =========================================================================
     # Synchronous Request Methods
@@ -141,50 +213,171 @@ class Cencori:
         endpoint: str,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
-        """Make a synchronous HTTP request to the Cencori API."""
-        url = f"{self._base_url}{endpoint}"
-
-        request_headers = {
-            "Content-Type": "application/json",
-            "CENCORI_API_KEY": self._api_key,
-        }
-        if headers:
-            request_headers.update(headers)
-
-        with httpx.Client(timeout=self._timeout) as client:
-            response = client.request(
-                method=method,
-                url=url,
-                json=json,
-                headers=request_headers,
-            )
-
+        """Make a synchronous HTTP request to the Cencori API, retrying per policy."""
+        response = self._send(method, endpoint, json, headers, retry, hedge, content=content)
         return self._handle_response(response)
 
-    def request(
+    def _request_bytes(
         self,
+        method: str,
         endpoint: str,
-        method: str = "GET",
-        body: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        hedge: bool = False,
+    ) -> bytes:
+        """Like :meth:`_request`, but return the raw body for custom decoding."""
+        return self._send(method, endpoint, json, headers, hedge=hedge).content
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        base_url: Optional[str] = None,
+        content: Optional[bytes] = None,
+    ) -> httpx.Response:
         """
-        Make a generic API request.
+        Send a request with retries; returns a successful response or raises.
 
-        Args:
-            endpoint: API endpoint path (e.g., '/api/v1/custom')
-            method: HTTP method (GET, POST, PUT, DELETE)
-            body: Request body as dict
-            headers: Additional headers
+        ``retry`` overrides the client's policy for this call. ``hedge`` marks
+        the call idempotent, so a configured :class:`HedgePolicy` may race a
+        duplicate against it. ``content`` is ``json`` already encoded (e.g. by
+        a :class:`Conversation`); otherwise ``json`` is encoded once with the
+        client's codec and the same bytes are reused for every attempt.
+        """
+        if content is None and json is not None:
+            content = self._codec.dumps(json)
+        hedger = self._hedger
+        if hedge and hedger is not None:
+            alternate = hedger.alternate(endpoint, json)
+            return hedger.call(
+                hedger.key(endpoint, json),
+                lambda: self._send(method, endpoint, json, headers, retry, content=content),
+                lambda: self._send(
+                    method,
+                    endpoint,
+                    alternate,
+                    headers,
+                    retry,
+                    base_url=hedger.policy.base_url,
+                    # A swapped model means the pre-encoded body no longer matches.
+                    content=content if alternate is json else None,
+                ),
+            )
 
-        Returns:
-            Response data as dict
+        client = self._get_http_client()
+        url = f"{(base_url or self._base_url).rstrip('/')}{endpoint}"
+        state = (retry or self._retry).start()
+
+        while True:
+            try:
+                with self._permit(endpoint) as permit:
+                    response = client.request(
+                        method=method,
+                        url=url,
+                        content=content,
+                        headers=self._headers(headers),
+                        timeout=state.timeout(self._timeout),
+                    )
+                    permit.observe(response.status_code)
+            except RETRYABLE_EXCEPTIONS as exc:
+                delay = state.next_delay(exc=exc)
+                if delay is None:
+                    raise
+            else:
+                if response.is_success:
+                    return response
+                delay = state.next_delay(response)
+                if delay is None:
+                    self._handle_response(response)  # raises for error statuses
+                    return response
+            time.sleep(delay)
+
+    @contextmanager
+    def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        timer: Optional[StreamTimer] = None,
+        content: Optional[bytes] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Open a streaming request on the pooled client; raises on error status.
 
-        Example:
-            >>> data = cencori.request('/api/v1/custom', method='POST', body={'foo': 'bar'})
+        Retries happen only before the first byte of the body is handed to the
+        caller, so a retried stream never yields duplicate events. Reading the
+        body raises :class:`StreamStalledError` when the client's
+        :class:`StreamTimeout` is exceeded.
         """
-        return self._request(method, endpoint, json=body, headers=headers)
+        client = self._get_http_client()
+        state = self._retry.start()
+        limits = self._stream_timeout
+        if content is None and json is not None:
+            content = self._codec.dumps(json)
+        deadline = limits.deadline()
+
+        while True:
+            permit = self._permit(endpoint).acquire()
+            request = client.build_request(
+                method,
+                f"{self._base_url}{endpoint}",
+                content=content,
+                headers=self._headers(),
+                timeout=limits.httpx_timeout(self._timeout),
+            )
+            if timer is not None:
+                request.extensions["trace"] = timer.trace
+            try:
+                response = client.send(request, stream=True)
+            except RETRYABLE_EXCEPTIONS as exc:
+                permit.release()
+                delay = state.next_delay(exc=exc)
+                if delay is None:
+                    if isinstance(exc, httpx.ReadTimeout):
+                        raise limits.stalled(endpoint, read_timed_out=True) from exc
+                    raise
+                time.sleep(delay)
+                continue
+            except BaseException:
+                permit.release()
+                raise
+
+            permit.observe(response.status_code)
+            if response.is_success:
+                if timer is not None:
+                    timer.headers()
+                break
+            try:
+                response.read()
+            finally:
+                response.close()
+                permit.release()
+            delay = state.next_delay(response)
+            if delay is None:
+                self._raise_for_stream(response)
+            time.sleep(cast(float, delay))
+
+        response.stream = WatchedStream(
+            cast(httpx.SyncByteStream, response.stream),
+            limits,
+            endpoint,
+            deadline,
+            response.extensions.get("network_stream"),
+        )
+        # The slot stays held while the caller consumes the stream.
+        try:
+            yield response
+        finally:
+            response.close()
+            permit.release()
 
     # =========================================================================
     # Async Request Methods
@@ -196,40 +389,158 @@ class Cencori:
         endpoint: str,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
-        """Make an async HTTP request to the Cencori API."""
-        url = f"{self._base_url}{endpoint}"
-
-        request_headers = {
-            "Content-Type": "application/json",
-            "CENCORI_API_KEY": self._api_key,
-        }
-        if headers:
-            request_headers.update(headers)
-
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                json=json,
-                headers=request_headers,
-            )
-
+        """Make an async HTTP request to the Cencori API, retrying per policy."""
+        response = await self._async_send(
+            method, endpoint, json, headers, retry, hedge, content=content
+        )
         return self._handle_response(response)
 
-    async def async_request(
+    async def _async_request_bytes(
         self,
+        method: str,
         endpoint: str,
-        method: str = "GET",
-        body: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        hedge: bool = False,
+    ) -> bytes:
+        """Async version of :meth:`_request_bytes`."""
+        return (await self._async_send(method, endpoint, json, headers, hedge=hedge)).content
+
+    async def _async_send(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        base_url: Optional[str] = None,
+        content: Optional[bytes] = None,
+    ) -> httpx.Response:
+        """Async version of :meth:`_send`."""
+        if content is None and json is not None:
+            content = self._codec.dumps(json)
+        hedger = self._hedger
+        if hedge and hedger is not None:
+            alternate = hedger.alternate(endpoint, json)
+            return await hedger.async_call(
+                hedger.key(endpoint, json),
+                lambda: self._async_send(method, endpoint, json, headers, retry, content=content),
+                lambda: self._async_send(
+                    method,
+                    endpoint,
+                    alternate,
+                    headers,
+                    retry,
+                    base_url=hedger.policy.base_url,
+                    # A swapped model means the pre-encoded body no longer matches.
+                    content=content if alternate is json else None,
+                ),
+            )
+
+        client = self._get_async_http_client()
+        url = f"{(base_url or self._base_url).rstrip('/')}{endpoint}"
+        state = (retry or self._retry).start()
+
+        while True:
+            try:
+                async with self._permit(endpoint) as permit:
+                    response = await client.request(
+                        method=method,
+                        url=url,
+                        content=content,
+                        headers=self._headers(headers),
+                        timeout=state.timeout(self._timeout),
+                    )
+                    permit.observe(response.status_code)
+            except RETRYABLE_EXCEPTIONS as exc:
+                delay = state.next_delay(exc=exc)
+                if delay is None:
+                    raise
+            else:
+                if response.is_success:
+                    return response
+                delay = state.next_delay(response)
+                if delay is None:
+                    self._handle_response(response)  # raises for error statuses
+                    return response
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def _async_stream(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        timer: Optional[StreamTimer] = None,
+        content: Optional[bytes] = None,
+    ) -> AsyncIterator[httpx.Response]:
         """
-        Make a generic async API request.
+        Async version of :meth:`_stream`.
 
-        Same as request() but async.
+        Leaving the context (including closing or cancelling the consuming
+        iterator) closes the response, which aborts the upstream request.
         """
-        return await self._async_request(method, endpoint, json=body, headers=headers)
+        client = self._get_async_http_client()
+        state = self._retry.start()
+        limits = self._stream_timeout
+        if content is None and json is not None:
+            content = self._codec.dumps(json)
+        deadline = limits.deadline()
+
+        while True:
+            permit = await self._permit(endpoint).async_acquire()
+            request = client.build_request(
+                method,
+                f"{self._base_url}{endpoint}",
+                content=content,
+                headers=self._headers(),
+                timeout=limits.httpx_timeout(self._timeout),
+            )
+            if timer is not None:
+                request.extensions["trace"] = timer.atrace
+            try:
+                response = await client.send(request, stream=True)
+            except RETRYABLE_EXCEPTIONS as exc:
+                permit.release()
+                delay = state.next_delay(exc=exc)
+                if delay is None:
+                    if isinstance(exc, httpx.ReadTimeout):
+                        raise limits.stalled(endpoint, read_timed_out=True) from exc
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                permit.release()
+                raise
+
+            permit.observe(response.status_code)
+            if response.is_success:
+                if timer is not None:
+                    timer.headers()
+                break
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+                permit.release()
+            delay = state.next_delay(response)
+            if delay is None:
+                self._raise_for_stream(response)
+            await asyncio.sleep(cast(float, delay))
+
+        response.stream = AsyncWatchedStream(
+            cast(httpx.AsyncByteStream, response.stream), limits, endpoint, deadline
+        )
+        try:
+            yield response
+        finally:
+            permit.release()
+            await response.aclose()
 
     # =========================================================================
     # Response Handling
@@ -241,7 +552,7 @@ class Cencori:
             raise AuthenticationError()
 
         if response.status_code == 429:
-            raise RateLimitError()
+            raise RateLimitError(retry_after=parse_retry_after(response))
 
         if response.status_code == 402:
             raise InsufficientCreditsError()
@@ -249,7 +560,7 @@ class Cencori:
         if response.status_code == 502:
             raise ProviderError()
 
-        data = cast(Dict[str, Any], response.json())
+        data = cast(Dict[str, Any], self._codec.loads(response.content))
 
         if response.status_code == 400 and "reasons" in data:
             raise SafetyError(
@@ -265,6 +576,129 @@ class Cencori:
 
         return data
 
+    def _raise_for_stream(self, response: httpx.Response) -> None:
+        """Raise for a failed streaming response whose body may not be JSON."""
+        try:
+            self._handle_response(response)
+        except ValueError:
+            raise CencoriError(
+                f"Request failed with status {response.status_code}",
+                status_code=response.status_code,
+            )
+
+    # =========================================================================
+    # Connection Pool
+    # =========================================================================
+
+    def _headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Default request headers, merged with any per-call headers."""
+        headers = {
+            "Content-Type": "application/json",
+            "CENCORI_API_KEY": self._api_key,
+        }
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _permit(self, endpoint: str) -> Permit:
+        """Concurrency slot for ``endpoint`` (no-op unless a limiter is configured)."""
+        if self._concurrency is None:
+            return Permit(None)
+        return self._concurrency.permit(endpoint)
+
+    def _get_http_client(self) -> httpx.Client:
+        """Return the shared sync client, creating it on first use."""
+        if self._http_client is None:
+            with self._pool_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        timeout=self._timeout,
+                        limits=self._limits,
+                        http2=self._http2,
+                    )
+        return self._http_client
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared async client, creating it on first use.
+
+        An ``httpx.AsyncClient`` is bound to the event loop it first ran on, so
+        an owned client is replaced when called from a different loop (e.g.
+        successive ``asyncio.run()`` calls). Each one is closed when its loop
+        shuts down, since no other loop can close its connections.
+        """
+        if not self._owns_async_http_client:
+            return cast(httpx.AsyncClient, self._async_http_client)
+
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._pool_lock:
+            if self._async_http_client is None or (
+                loop is not None and self._async_http_client_loop is not loop
+            ):
+                client = httpx.AsyncClient(
+                    timeout=self._timeout,
+                    limits=self._limits,
+                    http2=self._http2,
+                )
+                if loop is not None:
+                    closer = _close_with_loop(client)
+                    asyncio.ensure_future(closer.__anext__())
+                    self._async_http_clients = [
+                        entry for entry in self._async_http_clients if not entry[0].is_closed
+                    ]
+                    self._async_http_clients.append((client, closer))
+                self._async_http_client = client
+                self._async_http_client_loop = loop
+            return self._async_http_client
+
+    def close(self) -> None:
+        """Close the pooled sync transport (async transports need ``aclose()``)."""
+        if self._hedger is not None:
+            self._hedger.close()
+        if not self._owns_http_client:
+            return
+        with self._pool_lock:
+            client, self._http_client = self._http_client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close both pooled transports."""
+        self.close()
+        if not self._owns_async_http_client:
+            return
+        with self._pool_lock:
+            client, self._async_http_client = self._async_http_client, None
+            self._async_http_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self: _ClientT) -> _ClientT:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
     # =========================================================================
     # Utility Methods
     # =========================================================================
@@ -283,3 +717,187 @@ class Cencori:
             "base_url": self._base_url,
             "api_key_hint": f"{self._api_key[:6]}...{self._api_key[-4:]}",
         }
+
+
+class Cencori(BaseClient):
+    """
+    Cencori SDK client.
+
+    One SDK for AI Gateway, Compute, Workflow, and Storage.
+    Every operation is secured, logged, and tracked.
+
+    Args:
+        api_key: Your Cencori API key (starts with 'csk_')
+        base_url: API base URL (default: https://cencori.com)
+        timeout: Request timeout in seconds (default: 30)
+        limits: Connection pool limits shared by every module
+            (default: 100 connections, 20 kept alive)
+        http2: Negotiate HTTP/2 when the server supports it
+            (requires ``pip install cencori[http2]``)
+        http_client: Bring your own ``httpx.Client`` (not closed by ``close()``)
+        async_http_client: Bring your own ``httpx.AsyncClient``
+            (not closed by ``aclose()``)
+        retry: Retry policy for failed calls (default: 3 attempts with
+            jittered exponential backoff; ``RetryPolicy(max_attempts=1)``
+            disables retries)
+        concurrency: Adaptive (AIMD) in-flight limiter per endpoint family;
+            off by default
+        rate_limiter: Local per-key/per-model token-bucket pacing for chat
+            calls; callers wait instead of being rejected (off by default)
+        cache: Response cache for deterministic ``chat`` / ``generate_object``
+            calls (temperature 0 or ``cache=True``); off by default
+        embedding_cache: Persistent ``(model, sha256(text))`` vector store;
+            ``ai.embeddings`` sends only cache misses (off by default)
+        embedding_batching: How large embedding inputs are split and how many
+            batches run in parallel (default: 256 texts / ~100k tokens per
+            request, 4 in flight)
+        embedding_coalescing: Micro-batching of concurrent single-text
+            ``ai.embeddings`` calls on :class:`AsyncCencori` (off by default)
+        stream_stats: Where completed streams record per-model TTFT and
+            tokens/sec (default: a fresh :class:`StreamStats`, available as
+            ``stream_stats``); pass one instance to share it between clients
+        stream_timeout: Idle-gap and total-deadline limits for streaming
+            calls (default: 60s without bytes, no deadline); exceeding one
+            raises :class:`StreamStalledError`
+        router: Scores models by EWMA latency and error rate for
+            ``ai.chat(models=[...])`` (default: a fresh :class:`ModelRouter`,
+            available as ``router``)
+        hedging: Race a duplicate against idempotent calls (temperature-0
+            ``chat``, ``embeddings``, memory ``search``) that run past a
+            percentile of recent latency; off by default
+        context_fitter: Trims old turns so ``chat`` / ``rag`` payloads fit
+            the model's context window before sending; off by default
+        json_codec: Encodes request bodies and decodes responses and stream
+            events (default: orjson when installed, else the standard library)
+
+    The client keeps one keep-alive connection pool per transport (sync and
+    async) and every module reuses it, so repeated calls skip the TCP/TLS
+    handshake. Call ``close()`` / ``aclose()`` or use the client as a context
+    manager to release the connections.
+
+    Example:
+        >>> from cencori import Cencori
+        >>> with Cencori(api_key="csk_...") as cencori:
+        ...     response = cencori.ai.chat(
+        ...         messages=[{"role": "user", "content": "Hello!"}]
+        ...     )
+        ...     print(response.content)
+    """
+
+    def _init_modules(self) -> None:
+        self.ai = AIModule(self)
+        self.vision = VisionModule(self)
+        self.voice = VoiceModule(self)
+        self.documents = DocumentsModule(self)
+        self.agents = AgentsModule(self)
+        self.memory = MemoryModule(self)
+        self.sessions = SessionsModule(self)
+        self.telemetry = TelemetryModule(self)
+        self.projects = ProjectsModule(self)
+        self.api_keys = APIKeysModule(self)
+        self.metrics = MetricsModule(self)
+        self.batch = BatchModule(self)
+
+        self.compute = ComputeModule()
+        self.workflow = WorkflowModule()
+        self.storage = StorageModule()
+
+    # =========================================================================
+    # Generic Requests
+    # =========================================================================
+
+    def request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a generic API request.
+
+        Args:
+            endpoint: API endpoint path (e.g., '/api/v1/custom')
+            method: HTTP method (GET, POST, PUT, DELETE)
+            body: Request body as dict
+            headers: Additional headers
+
+        Returns:
+            Response data as dict
+
+        Example:
+            >>> data = cencori.request('/api/v1/custom', method='POST', body={'foo': 'bar'})
+        """
+        return self._request(method, endpoint, json=body, headers=headers)
+
+    async def async_request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a generic async API request.
+
+        Same as request() but async.
+        """
+        return await self._async_request(method, endpoint, json=body, headers=headers)
+
+
+class AsyncCencori(BaseClient):
+    """
+    Asyncio-native Cencori SDK client.
+
+    Takes the same arguments as :class:`Cencori`. Every module method is a
+    coroutine (streams are async iterators) running on the shared
+    ``httpx.AsyncClient`` pool, so thousands of calls can be in flight from
+    one event loop without a thread per call.
+
+    Example:
+        >>> import asyncio
+        >>> from cencori import AsyncCencori
+        >>> async def main():
+        ...     async with AsyncCencori(api_key="csk_...") as cencori:
+        ...         replies = await asyncio.gather(*(
+        ...             cencori.ai.chat(messages=[{"role": "user", "content": q}])
+        ...             for q in ["Hi", "Hello"]
+        ...         ))
+        >>> asyncio.run(main())
+    """
+
+    def _init_modules(self) -> None:
+        self.ai = AsyncAIModule(self)
+        self.vision = AsyncVisionModule(self)
+        self.voice = AsyncVoiceModule(self)
+        self.documents = AsyncDocumentsModule(self)
+        self.agents = AsyncAgentsModule(self)
+        self.memory = AsyncMemoryModule(self)
+        self.sessions = AsyncSessionsModule(self)
+        self.telemetry = AsyncTelemetryModule(self)
+        self.projects = ProjectsModule(self)
+        self.api_keys = APIKeysModule(self)
+        self.metrics = AsyncMetricsModule(self)
+
+        self.compute = ComputeModule()
+        self.workflow = WorkflowModule()
+        self.storage = StorageModule()
+
+    # =========================================================================
+    # Generic Requests
+    # =========================================================================
+
+    async def request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a generic API request.
+
+        Example:
+            >>> data = await cencori.request('/api/v1/custom', method='POST', body={'foo': 'bar'})
+        """
+        return await self._async_request(method, endpoint, json=body, headers=headers)
@@ -0,0 +1,114 @@
+"""Micro-batching of concurrent single-text embedding calls."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .tokens import estimate_text_tokens
+from .types import EmbeddingResponse, EmbeddingUsage
+
+EmbedBatch = Callable[[List[str], str, Optional[bool]], Awaitable[EmbeddingResponse]]
+
+
+@dataclass
+class EmbeddingCoalescing:
+    """
+    Opt-in micro-batching for concurrent ``await ai.embeddings(text)`` calls.
+
+    On :class:`AsyncCencori`, single-text calls for the same model are held
+    for up to ``window_ms`` milliseconds, or until ``max_items`` are waiting,
+    and sent together as one ``/api/ai/embeddings`` request. Each caller gets
+    an ordinary ``EmbeddingResponse`` with its own vector; the batch's token
+    usage is shared out in proportion to each text's estimated size. If the
+    batch request fails, every caller in it gets the error.
+
+    Args:
+        window_ms: How long the first call in a batch waits for company
+        max_items: Batch size that triggers an immediate send
+
+    Example:
+        >>> from cencori import AsyncCencori, EmbeddingCoalescing
+        >>> cencori = AsyncCencori(embedding_coalescing=EmbeddingCoalescing(window_ms=2))
+        >>> await cencori.ai.embeddings("one query")  # batched with concurrent calls
+    """
+
+    window_ms: float = 2.0
+    max_items: int = 64
+
+
+@dataclass
+class _Pending:
+    timer: asyncio.TimerHandle
+    texts: List[str] = field(default_factory=list)
+    futures: "List[asyncio.Future[EmbeddingResponse]]" = field(default_factory=list)
+
+
+class EmbeddingCoalescer:
+    """Collects concurrent single-text calls per ``(model, cache)`` and sends them as one."""
+
+    def __init__(self, settings: EmbeddingCoalescing, send: EmbedBatch) -> None:
+        if settings.max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self._settings = settings
+        self._send = send
+        self._pending: Dict[Tuple[str, Optional[bool]], _Pending] = {}
+        self._tasks: "Set[asyncio.Task[None]]" = set()
+
+    async def embed(self, text: str, model: str, cache: Optional[bool]) -> EmbeddingResponse:
+        """Queue ``text`` for the next batch and wait for its vector."""
+        loop = asyncio.get_running_loop()
+        key = (model, cache)
+        pending = self._pending.get(key)
+        if pending is None:
+            timer = loop.call_later(self._settings.window_ms / 1000, self._flush, key)
+            pending = self._pending[key] = _Pending(timer)
+        future: "asyncio.Future[EmbeddingResponse]" = loop.create_future()
+        pending.texts.append(text)
+        pending.futures.append(future)
+        if len(pending.texts) >= self._settings.max_items:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: Tuple[str, Optional[bool]]) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        pending.timer.cancel()
+        task = asyncio.ensure_future(self._dispatch(key, pending))
+        self._tasks.add(task)  # keep a reference until it finishes
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, key: Tuple[str, Optional[bool]], pending: _Pending) -> None:
+        model, cache = key
+        try:
+            response = await self._send(pending.texts, model, cache)
+        except Exception as exc:  # noqa: BLE001 - every waiting caller gets the error
+            for future in pending.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # Cancelled (e.g. on shutdown): don't leave the callers waiting forever.
+            for future in pending.futures:
+                future.cancel()
+            raise
+        shares = _share_usage(pending.texts, response.usage.total_tokens)
+        for future, vector, tokens in zip(pending.futures, response.embeddings, shares):
+            if not future.done():  # the caller may have been cancelled
+                future.set_result(
+                    EmbeddingResponse(
+                        model=response.model,
+                        embeddings=[vector],
+                        usage=EmbeddingUsage(total_tokens=tokens),
+                        dimensions=response.dimensions,
+                    )
+                )
+
+
+def _share_usage(texts: List[str], total: int) -> List[int]:
+    """Split ``total`` tokens across ``texts`` by estimated size, summing exactly."""
+    sizes = [max(estimate_text_tokens(text), 1) for text in texts]
+    weight = sum(sizes)
+    shares = [total * size // weight for size in sizes]
+    shares[-1] += total - sum(shares)
+    return shares
@@ -0,0 +1,68 @@
+"""
+JSON encoding and decoding for request bodies, responses and stream events.
+
+The client uses :class:`OrjsonCodec` when orjson is installed
+(``pip install cencori[orjson]``) and the standard library otherwise. Both
+produce compact UTF-8 JSON, the same bytes httpx would send.
+"""
+
+import json
+from typing import Any, Union, cast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without orjson installed
+    orjson = None
+
+
+class JSONCodec:
+    """
+    Standard-library codec, and the interface for custom ones.
+
+    Subclass it and override :meth:`dumps` / :meth:`loads` to plug in another
+    library, then pass an instance as ``Cencori(json_codec=...)``.
+    """
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode ``value`` as compact UTF-8 JSON."""
+        # Plain objects (e.g. SDK dataclasses) are sent as their attributes.
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=vars
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON; raises ``ValueError`` (``json.JSONDecodeError``) if malformed."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson codec: several times faster than the standard library.
+
+    Values orjson rejects (integers beyond 64 bits, non-string keys) are
+    encoded by the standard library instead, so any payload that worked
+    before still works.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson: pip install cencori[orjson]")
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return cast(bytes, orjson.dumps(value, default=vars))
+        except TypeError:
+            return super().dumps(value)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return orjson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """The fastest available codec."""
+    return OrjsonCodec() if orjson is not None else JSONCodec()
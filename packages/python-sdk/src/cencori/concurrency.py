@@ -0,0 +1,272 @@
+"""Client-side adaptive (AIMD) concurrency limiting per endpoint family."""
+
+import asyncio
+import threading
+from collections import deque
+from types import TracebackType
+from typing import Deque, Dict, Optional, Type
+
+# Status codes that signal the gateway is overloaded.
+OVERLOAD_STATUSES = frozenset({429, 502})
+
+# Endpoint prefix -> family. Families share one adaptive limit.
+ENDPOINT_FAMILIES = (
+    ("/api/ai/chat", "chat"),
+    ("/api/ai/rag", "chat"),
+    ("/v1/responses", "chat"),
+    ("/api/ai/embeddings", "embeddings"),
+    ("/api/memory", "memory"),
+    ("/api/ai/audio", "voice"),
+)
+
+
+def endpoint_family(endpoint: str) -> Optional[str]:
+    """Map an API path to its concurrency family (None if not limited)."""
+    for prefix, family in ENDPOINT_FAMILIES:
+        if endpoint.startswith(prefix):
+            return family
+    return None
+
+
+class _Waiter:
+    """A queued acquirer; ``granted`` is set under the limit's lock."""
+
+    __slots__ = ("event", "future", "granted", "loop")
+
+    def __init__(
+        self,
+        event: Optional[threading.Event] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        future: "Optional[asyncio.Future[None]]" = None,
+    ) -> None:
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None and self.future is not None:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveLimit:
+    """
+    AIMD concurrency limit shared by sync threads and asyncio tasks.
+
+    Every successful call raises the limit by ``increase / limit`` (about
+    ``increase`` per window of in-flight calls); an overload response
+    multiplies it by ``decrease``. Calls that were already in flight when the
+    limit was cut do not cut it again, so one burst of 429s counts once.
+    """
+
+    def __init__(
+        self,
+        initial: float = 8.0,
+        min_limit: float = 1.0,
+        max_limit: float = 256.0,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ) -> None:
+        self.limit = float(initial)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.increase = increase
+        self.decrease = decrease
+        self.in_flight = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = deque()
+
+    # ── acquisition ────────────────────────────────────────────
+
+    def acquire(self) -> int:
+        """Block until a slot is free; returns the generation for :meth:`release`."""
+        with self._lock:
+            if self._has_capacity():
+                self.in_flight += 1
+                return self._generation
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        assert waiter.event is not None
+        waiter.event.wait()
+        return self._generation
+
+    async def async_acquire(self) -> int:
+        """Await a free slot; returns the generation for :meth:`release`."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._has_capacity():
+                self.in_flight += 1
+                return self._generation
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+        assert waiter.future is not None
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    # The slot was handed to us as we were cancelled; pass it on.
+                    self.in_flight -= 1
+                    self._wake_waiters()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+        return self._generation
+
+    def release(self, generation: int, status_code: Optional[int] = None) -> None:
+        """Return a slot and adapt the limit from the call's outcome."""
+        with self._lock:
+            self.in_flight -= 1
+            if status_code in OVERLOAD_STATUSES:
+                if generation >= self._generation:
+                    self.limit = max(self.min_limit, self.limit * self.decrease)
+                    self._generation += 1
+            elif status_code is not None and status_code < 400:
+                self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            self._wake_waiters()
+
+    # ── internals ──────────────────────────────────────────────
+
+    def _has_capacity(self) -> bool:
+        return not self._waiters and self.in_flight < int(self.limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            self.in_flight += 1
+            waiter.wake()
+
+
+class Permit:
+    """A slot in an :class:`AdaptiveLimit`; report the outcome with :meth:`observe`."""
+
+    def __init__(self, limit: Optional[AdaptiveLimit]) -> None:
+        self._limit = limit
+        self._generation = 0
+        self._held = False
+        self._status_code: Optional[int] = None
+
+    def observe(self, status_code: int) -> None:
+        """Record the response status used to adapt the limit on release."""
+        self._status_code = status_code
+
+    def acquire(self) -> "Permit":
+        """Block until the slot is granted."""
+        if self._limit is not None:
+            self._generation = self._limit.acquire()
+            self._held = True
+        return self
+
+    async def async_acquire(self) -> "Permit":
+        """Await the slot without blocking the event loop."""
+        if self._limit is not None:
+            self._generation = await self._limit.async_acquire()
+            self._held = True
+        return self
+
+    def release(self) -> None:
+        """Give the slot back (idempotent)."""
+        if self._limit is not None and self._held:
+            self._held = False
+            self._limit.release(self._generation, self._status_code)
+
+    def __enter__(self) -> "Permit":
+        return self.acquire()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "Permit":
+        return await self.async_acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.release()
+
+
+class AdaptiveConcurrency:
+    """
+    Adaptive concurrency limiter with one AIMD limit per endpoint family
+    (``chat``, ``embeddings``, ``memory``, ``voice``).
+
+    In-flight requests grow additively while calls succeed and are cut
+    multiplicatively on 429/502, so a burst of callers converges on the
+    gateway's sustainable throughput instead of failing together. Each retry
+    attempt takes its own slot, so backoff sleeps never hold capacity.
+
+    Args:
+        initial: Starting limit for each family
+        min_limit: Floor the limit never drops below
+        max_limit: Ceiling the limit never grows above
+        increase: Additive increase per window of successful calls
+        decrease: Multiplicative factor applied on overload
+        limits: Per-family overrides of ``initial``, e.g. ``{"embeddings": 32}``
+
+    Example:
+        >>> from cencori import AdaptiveConcurrency, Cencori
+        >>> limiter = AdaptiveConcurrency(initial=16, limits={"embeddings": 32})
+        >>> cencori = Cencori(concurrency=limiter)
+        >>> limiter.snapshot()  # {'chat': {'limit': ..., 'in_flight': ...}, ...}
+    """
+
+    def __init__(
+        self,
+        initial: float = 8.0,
+        min_limit: float = 1.0,
+        max_limit: float = 256.0,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        limits: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._defaults = {
+            "initial": initial,
+            "min_limit": min_limit,
+            "max_limit": max_limit,
+            "increase": increase,
+            "decrease": decrease,
+        }
+        self._overrides = limits or {}
+        self._families: Dict[str, AdaptiveLimit] = {}
+        self._lock = threading.Lock()
+
+    def family(self, name: str) -> AdaptiveLimit:
+        """Return (creating on first use) the limit for a family."""
+        with self._lock:
+            limit = self._families.get(name)
+            if limit is None:
+                params = dict(self._defaults)
+                if name in self._overrides:
+                    params["initial"] = self._overrides[name]
+                limit = self._families[name] = AdaptiveLimit(**params)
+            return limit
+
+    def permit(self, endpoint: str) -> Permit:
+        """Slot for ``endpoint`` (a no-op permit when its family is unlimited)."""
+        name = endpoint_family(endpoint)
+        return Permit(self.family(name) if name is not None else None)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current limit and in-flight count per family, for inspection."""
+        with self._lock:
+            return {
+                name: {"limit": limit.limit, "in_flight": limit.in_flight}
+                for name, limit in self._families.items()
+            }
@@ -0,0 +1,103 @@
+"""Chat history that keeps each message's JSON encoding for reuse across turns."""
+
+import operator
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .codec import JSONCodec, default_codec
+
+
+class Conversation:
+    """
+    Message history for multi-turn chat that is encoded once per message.
+
+    Passing a plain list to ``ai.chat`` JSON-encodes the whole history on
+    every turn, so a long conversation does quadratic encoding work overall.
+    A ``Conversation`` encodes each message when it is appended and builds
+    the request body by joining the stored bytes, so each turn only encodes
+    what is new. Pass it anywhere ``chat`` / ``chat_stream`` take
+    ``messages``.
+
+    Messages are encoded when appended: treat them as immutable afterwards,
+    since later changes to a message dict are not sent.
+
+    Args:
+        messages: Initial history
+        codec: JSON codec for the stored messages (default: orjson if
+            installed, else the standard library)
+
+    Example:
+        >>> from cencori import Conversation
+        >>> conversation = Conversation([{"role": "system", "content": "Be brief."}])
+        >>> conversation.append({"role": "user", "content": "Hi"})
+        >>> response = cencori.ai.chat(conversation)
+        >>> conversation.append({"role": "assistant", "content": response.content})
+    """
+
+    def __init__(
+        self,
+        messages: Optional[Iterable[Dict[str, Any]]] = None,
+        codec: Optional[JSONCodec] = None,
+    ) -> None:
+        self._codec = codec or default_codec()
+        self._messages: List[Dict[str, Any]] = []
+        self._encoded: List[bytes] = []
+        self._positions: Dict[int, int] = {}
+        self._joined = bytearray()
+        if messages is not None:
+            self.extend(messages)
+
+    def append(self, message: Dict[str, Any]) -> None:
+        """Add a message to the end of the history."""
+        encoded = self._codec.dumps(message)
+        self._positions[id(message)] = len(self._messages)
+        if self._messages:
+            self._joined += b","
+        self._joined += encoded
+        self._messages.append(message)
+        self._encoded.append(encoded)
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """Add several messages in order."""
+        for message in messages:
+            self.append(message)
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """The history as a new list (the message dicts themselves are shared)."""
+        return list(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._messages)
+
+    def encode(self, messages: Optional[List[Dict[str, Any]]] = None) -> bytes:
+        """
+        JSON array of ``messages`` (default: the whole history).
+
+        ``messages`` may be any selection of this conversation's messages,
+        such as a history trimmed by :class:`ContextFitter`; messages that
+        did not come from the conversation are encoded on the spot.
+        """
+        if messages is None:
+            return b"[" + self._joined + b"]"
+        if len(messages) == len(self._messages) and all(
+            map(operator.is_, messages, self._messages)
+        ):
+            return b"[" + self._joined + b"]"
+        return b"[" + b",".join(self._fragment(message) for message in messages) + b"]"
+
+    def body(self, payload: Dict[str, Any]) -> bytes:
+        """``payload`` encoded as JSON, with its ``messages`` joined from the stored bytes."""
+        rest = self._codec.dumps(
+            {key: value for key, value in payload.items() if key != "messages"}
+        )
+        fields = b"," + rest[1:] if len(rest) > 2 else b"}"
+        return b'{"messages":' + self.encode(payload["messages"]) + fields
+
+    def _fragment(self, message: Dict[str, Any]) -> bytes:
+        position = self._positions.get(id(message))
+        if position is not None and self._messages[position] is message:
+            return self._encoded[position]
+        return self._codec.dumps(message)
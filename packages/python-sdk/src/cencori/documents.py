@@ -23,10 +23,13 @@ Example:
     >>> print(answer["answer"])
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, Optional
+
+from .fanout import DEFAULT_CONCURRENCY, ProgressCallback, async_run_many, run_many
+from .types import ItemResult
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient, Cencori
 
 
 class DocumentsModule:
@@ -128,6 +131,24 @@ class DocumentsModule:
             ),
         )
 
+    def extract_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[ItemResult[Dict[str, Any]]]:
+        """
+        Run many :meth:`extract` calls with bounded concurrency.
+
+        ``requests`` holds one dict of :meth:`extract` keyword arguments per call. Results
+        come back as :class:`~cencori.ItemResult` in input order (or as they
+        finish with ``ordered=False``); failures are captured per item.
+        """
+        return run_many(
+            lambda kwargs: self.extract(**kwargs), requests, concurrency, ordered, on_progress
+        )
+
     # ── async variants ─────────────────────────────────────────
 
     async def a_extract(self, **kwargs: Any) -> Dict[str, Any]:
@@ -152,6 +173,20 @@ class DocumentsModule:
             json=self._build_body(question=question, **kwargs),
         )
 
+    def a_extract_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[Dict[str, Any]]]:
+        """Async version of :meth:`extract_many`."""
+
+        async def call(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.a_extract(**kwargs)
+
+        return async_run_many(call, requests, concurrency, ordered, on_progress)
+
     @staticmethod
     def _build_body(
         document_url: Optional[str] = None,
@@ -181,3 +216,97 @@ class DocumentsModule:
         if question is not None:
             body["question"] = question
         return body
+
+
+class AsyncDocumentsModule:
+    """
+    Documents module for :class:`~cencori.AsyncCencori`.
+
+    Same methods as :class:`DocumentsModule`; each one is a coroutine.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+
+    async def extract(
+        self,
+        document_url: Optional[str] = None,
+        document_base64: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        prompt: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Extract text from a PDF or image."""
+        return await self._client._async_request(
+            "POST",
+            "/api/ai/documents/extract",
+            json=DocumentsModule._build_body(
+                document_url=document_url,
+                document_base64=document_base64,
+                mime_type=mime_type,
+                filename=filename,
+                prompt=prompt,
+                model=model,
+            ),
+        )
+
+    async def summarize(
+        self,
+        document_url: Optional[str] = None,
+        document_base64: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Extract then summarize the document."""
+        return await self._client._async_request(
+            "POST",
+            "/api/ai/documents/summarize",
+            json=DocumentsModule._build_body(
+                document_url=document_url,
+                document_base64=document_base64,
+                mime_type=mime_type,
+                filename=filename,
+                model=model,
+            ),
+        )
+
+    async def query(
+        self,
+        question: str,
+        document_url: Optional[str] = None,
+        document_base64: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Extract then answer a question about the document."""
+        if not question:
+            raise ValueError("documents.query requires a `question`")
+        return await self._client._async_request(
+            "POST",
+            "/api/ai/documents/query",
+            json=DocumentsModule._build_body(
+                document_url=document_url,
+                document_base64=document_base64,
+                mime_type=mime_type,
+                filename=filename,
+                model=model,
+                question=question,
+            ),
+        )
+
+    def extract_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[Dict[str, Any]]]:
+        """Run many :meth:`extract` calls with bounded concurrency."""
+
+        async def call(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.extract(**kwargs)
+
+        return async_run_many(call, requests, concurrency, ordered, on_progress)
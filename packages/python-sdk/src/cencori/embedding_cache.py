@@ -0,0 +1,163 @@
+"""Content-addressed embedding cache backed by a memory-mapped float32 file."""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple, cast
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vectors (
+    model TEXT NOT NULL,
+    digest BLOB NOT NULL,
+    offset INTEGER NOT NULL,
+    dims INTEGER NOT NULL,
+    PRIMARY KEY (model, digest)
+) WITHOUT ROWID;
+"""
+
+# SQLite's default limit on host parameters per statement is 999.
+_LOOKUP_CHUNK = 500
+
+_FLOAT_SIZE = array("f").itemsize
+
+
+def text_digest(text: str) -> bytes:
+    """SHA-256 of the UTF-8 text, the cache's content address."""
+    return hashlib.sha256(text.encode()).digest()
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache keyed by ``(model, sha256(text))``.
+
+    Vectors are appended as native-endian float32 to ``vectors.f32`` in
+    ``directory`` and read back through a read-only memory map; a SQLite
+    index (``index.sqlite3``) maps each key to its offset and dimension
+    count. ``ai.embeddings`` sends only the texts missing from the cache and
+    merges cached vectors back in input order. Cached vectors are float32,
+    so they match fresh API values to about 7 significant digits.
+
+    The store is safe to share between threads. Run a single writing
+    process per directory; any number of processes may read.
+
+    Args:
+        directory: Directory holding the vector file and its index (created
+            if missing)
+
+    Example:
+        >>> from cencori import Cencori, EmbeddingCache
+        >>> cencori = Cencori(embedding_cache=EmbeddingCache(".cencori-embeddings"))
+        >>> cencori.ai.embeddings(["a", "b"])  # network
+        >>> cencori.ai.embeddings(["b", "c"])  # only "c" is sent
+    """
+
+    def __init__(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._index = sqlite3.connect(
+            os.path.join(directory, "index.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.executescript(_SCHEMA)
+        path = os.path.join(directory, "vectors.f32")
+        self._writer = open(path, "ab")
+        self._reader = open(path, "rb")
+        self._map: Optional[mmap.mmap] = None
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Cached vectors for ``texts`` in order, with None for each miss."""
+        digests = [text_digest(text) for text in texts]
+        with self._lock:
+            found = self._lookup(model, digests)
+            if not found:
+                return [None] * len(texts)
+            end = max(offset + dims for offset, dims in found.values())
+            floats = self._floats(end)
+            results: List[Optional[List[float]]] = []
+            for digest in digests:
+                entry = found.get(digest)
+                if entry is None or entry[0] + entry[1] > len(floats):
+                    # A miss, or an entry past the complete floats of the file.
+                    results.append(None)
+                else:
+                    offset, dims = entry
+                    results.append(cast(List[float], floats[offset : offset + dims].tolist()))
+            floats.release()
+            return results
+
+    def put_many(
+        self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        """Append vectors for ``texts``; texts already cached keep their first vector."""
+        if len(texts) != len(vectors):
+            raise ValueError("texts and vectors must have the same length")
+        digests = [text_digest(text) for text in texts]
+        with self._lock:
+            indexed = self._lookup(model, digests)
+            # Pad a torn write left by a crash so offsets stay float-aligned.
+            end = self._writer.seek(0, os.SEEK_END)
+            padding = -end % _FLOAT_SIZE
+            start = (end + padding) // _FLOAT_SIZE
+            buffer = array("f")
+            rows: List[Tuple[str, bytes, int, int]] = []
+            for digest, vector in zip(digests, vectors):
+                if digest in indexed:
+                    continue
+                indexed[digest] = (start + len(buffer), len(vector))
+                rows.append((model, digest, start + len(buffer), len(vector)))
+                buffer.extend(vector)
+            if not rows:
+                return
+            self._writer.write(bytes(padding) + buffer.tobytes())
+            self._writer.flush()
+            # Index only after the vectors are written, so a crash never
+            # leaves an entry pointing past the end of the file.
+            self._index.executemany("INSERT OR IGNORE INTO vectors VALUES (?, ?, ?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._index.execute("SELECT COUNT(*) FROM vectors").fetchone()
+            return int(count)
+
+    def close(self) -> None:
+        """Close the index and vector files."""
+        with self._lock:
+            self._index.close()
+            self._writer.close()
+            self._map = None
+            self._reader.close()
+
+    def _lookup(self, model: str, digests: List[bytes]) -> Dict[bytes, Tuple[int, int]]:
+        found: Dict[bytes, Tuple[int, int]] = {}
+        unique = list(dict.fromkeys(digests))
+        for i in range(0, len(unique), _LOOKUP_CHUNK):
+            chunk = unique[i : i + _LOOKUP_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            for digest, offset, dims in self._index.execute(
+                f"SELECT digest, offset, dims FROM vectors WHERE model = ? AND digest IN ({marks})",
+                (model, *chunk),
+            ):
+                found[bytes(digest)] = (offset, dims)
+        return found
+
+    def _floats(self, end: int) -> "memoryview[float]":
+        """
+        Float32 view of the vector file, remapped if it covers fewer than ``end`` floats.
+
+        Only whole floats are viewed: a torn tail left by a crash, or by a
+        writer caught mid-append, is ignored.
+        """
+        if self._map is None or len(self._map) < end * _FLOAT_SIZE:
+            # Earlier maps are released once no view references them.
+            if os.fstat(self._reader.fileno()).st_size == 0:
+                return memoryview(b"").cast("f")
+            self._map = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+        whole = len(self._map) // _FLOAT_SIZE * _FLOAT_SIZE
+        with memoryview(self._map) as view:
+            return view[:whole].cast("f")
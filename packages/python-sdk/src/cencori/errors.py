@@ -48,11 +48,16 @@ class RateLimitError(CencoriError):
     Raised when rate limit is exceeded.
 
     This error occurs when you've made too many requests in a short period.
-    Consider implementing exponential backoff retry logic.
+    The client already retries 429s with backoff (see ``RetryPolicy``); this
+    is raised once those attempts are exhausted.
+
+    Attributes:
+        retry_after: Seconds the server asked to wait, if it said so
     """
 
-    def __init__(self, message: str = "Rate limit exceeded"):
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: Optional[float] = None):
         super().__init__(message, status_code=429, code="RATE_LIMIT_EXCEEDED")
+        self.retry_after = retry_after
 
 
 class SafetyError(CencoriError):
@@ -97,3 +102,66 @@ class ProviderError(CencoriError):
 
     def __init__(self, message: str = "Provider error"):
         super().__init__(message, status_code=502, code="PROVIDER_ERROR")
+
+
+class StreamDecodeError(CencoriError):
+    """
+    Raised when a streamed server-sent event carries malformed JSON.
+
+    Attributes:
+        data: The raw ``data`` field of the offending event
+    """
+
+    def __init__(self, message: str = "Malformed stream event", data: str = ""):
+        super().__init__(message, code="STREAM_DECODE_ERROR")
+        self.data = data
+
+
+class StreamStalledError(CencoriError):
+    """
+    Raised when a stream goes quiet for too long or runs past its deadline.
+
+    Attributes:
+        reason: ``"idle"`` (no bytes for ``timeout`` seconds) or ``"deadline"``
+            (the whole stream took longer than ``timeout`` seconds)
+        timeout: The limit that was exceeded, in seconds
+        endpoint: The streaming endpoint
+    """
+
+    def __init__(
+        self,
+        message: str = "Stream stalled",
+        reason: str = "idle",
+        timeout: Optional[float] = None,
+        endpoint: str = "",
+    ):
+        super().__init__(message, code="STREAM_STALLED")
+        self.reason = reason
+        self.timeout = timeout
+        self.endpoint = endpoint
+
+
+class ContextWindowError(CencoriError):
+    """
+    Raised before sending when a chat payload cannot fit the model's context window.
+
+    Only raised when a :class:`ContextFitter` is configured and even the
+    system messages and the latest turn exceed the window.
+
+    Attributes:
+        model: The model the payload was for
+        tokens: Estimated prompt tokens of the kept messages
+        limit: Prompt tokens that fit once the output budget is set aside
+    """
+
+    def __init__(
+        self,
+        message: str = "Prompt does not fit the context window",
+        model: str = "",
+        tokens: Optional[int] = None,
+        limit: Optional[int] = None,
+    ):
+        super().__init__(message, code="CONTEXT_WINDOW_EXCEEDED")
+        self.model = model
+        self.tokens = tokens
+        self.limit = limit
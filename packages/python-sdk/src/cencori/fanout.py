@@ -0,0 +1,155 @@
+"""Bounded-concurrency fan-out of independent requests."""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Sized,
+    TypeVar,
+)
+
+from .types import ItemResult
+
+I = TypeVar("I")
+T = TypeVar("T")
+
+# Called as ``on_progress(completed, total)`` after every finished item;
+# ``total`` is None when the items are a lazy iterable of unknown length.
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+DEFAULT_CONCURRENCY = 8
+
+
+class _Collector(Generic[T]):
+    """Counts completions and releases results in input or completion order."""
+
+    def __init__(
+        self, total: Optional[int], ordered: bool, on_progress: Optional[ProgressCallback]
+    ) -> None:
+        self.total = total
+        self.ordered = ordered
+        self.on_progress = on_progress
+        self.completed = 0
+        self._next = 0
+        self._buffer: Dict[int, ItemResult[T]] = {}
+
+    def add(self, result: ItemResult[T]) -> Iterator[ItemResult[T]]:
+        self.completed += 1
+        if self.on_progress is not None:
+            self.on_progress(self.completed, self.total)
+        if not self.ordered:
+            yield result
+            return
+        self._buffer[result.index] = result
+        while self._next in self._buffer:
+            yield self._buffer.pop(self._next)
+            self._next += 1
+
+
+def _total(items: Iterable[I]) -> Optional[int]:
+    return len(items) if isinstance(items, Sized) else None
+
+
+def run_many(
+    fn: Callable[[I], T],
+    items: Iterable[I],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Iterator[ItemResult[T]]:
+    """
+    Apply ``fn`` to every item on a thread pool, at most ``concurrency`` at a time.
+
+    Yields one :class:`ItemResult` per item, in input order when ``ordered``
+    or as items finish otherwise. Exceptions raised by ``fn`` are captured on
+    the result instead of aborting the run. ``items`` is consumed lazily: only
+    ``concurrency`` items are in flight at once, and closing the iterator
+    early stops submitting new work.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    collector: _Collector[T] = _Collector(_total(items), ordered, on_progress)
+    entries = enumerate(items)
+
+    def call(index: int, item: I) -> ItemResult[T]:
+        try:
+            return ItemResult(index=index, value=fn(item))
+        except Exception as exc:  # noqa: BLE001 - reported on the item, not raised
+            return ItemResult(index=index, error=exc)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        in_flight: Set["Future[ItemResult[T]]"] = set()
+
+        def submit_next() -> None:
+            entry = next(entries, None)
+            if entry is not None:
+                in_flight.add(pool.submit(call, *entry))
+
+        try:
+            for _ in range(concurrency):
+                submit_next()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.discard(future)
+                    submit_next()
+                    yield from collector.add(future.result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+async def async_run_many(
+    fn: Callable[[I], Awaitable[T]],
+    items: Iterable[I],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
+) -> AsyncIterator[ItemResult[T]]:
+    """
+    Await ``fn`` for every item, at most ``concurrency`` at a time.
+
+    Async counterpart of :func:`run_many`: tasks are created only as slots
+    free up, and closing the iterator cancels the ones still in flight.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    collector: _Collector[T] = _Collector(_total(items), ordered, on_progress)
+    entries = enumerate(items)
+
+    async def call(index: int, item: I) -> ItemResult[T]:
+        try:
+            return ItemResult(index=index, value=await fn(item))
+        except Exception as exc:  # noqa: BLE001 - reported on the item, not raised
+            return ItemResult(index=index, error=exc)
+
+    in_flight: "Set[asyncio.Task[ItemResult[T]]]" = set()
+
+    def submit_next() -> None:
+        entry = next(entries, None)
+        if entry is not None:
+            in_flight.add(asyncio.ensure_future(call(*entry)))
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                in_flight.discard(task)
+                submit_next()
+                for result in collector.add(task.result()):
+                    yield result
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
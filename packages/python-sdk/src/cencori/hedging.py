@@ -0,0 +1,241 @@
+"""Hedged requests: race a duplicate against a slow idempotent call."""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+CHAT_ENDPOINT = "/api/ai/chat"
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Opt-in hedging for idempotent calls.
+
+    Applies to ``chat`` with temperature 0, ``embeddings`` and memory
+    ``search``. When a call has not answered after the ``percentile`` of
+    recent latencies for the same endpoint and model (``initial_delay`` until
+    ``min_samples`` calls have been seen), an identical request is sent and
+    whichever answers first wins. :class:`AsyncCencori` cancels the loser;
+    on :class:`Cencori` the loser finishes in the background and its result
+    is discarded. The duplicate is sent only if both attempts are allowed to
+    run: if the first one fails before the delay, its error is raised.
+
+    ``budget`` caps the extra load: each call earns ``budget`` hedge tokens
+    (up to ``burst``) and each hedge spends one, so over time at most that
+    fraction of calls is duplicated.
+
+    Args:
+        percentile: Latency percentile (0-1) after which to hedge
+        initial_delay: Hedge delay in seconds until enough samples exist
+        min_samples: Samples needed before the percentile is used
+        min_delay: Lower bound on the hedge delay, in seconds
+        window: Recent latencies kept per endpoint and model
+        budget: Hedges earned per call
+        burst: Most hedge tokens that can be saved up
+        base_url: Send the duplicate to this base URL instead
+        alternate_models: Chat only: send the duplicate to another model
+            (e.g. ``{"gpt-4o": "gpt-4o-mini"}``); embeddings always stay on
+            their model because vectors from different models don't mix
+        max_workers: Worker threads for duplicates sent by the sync client
+
+    Example:
+        >>> from cencori import Cencori, HedgePolicy
+        >>> cencori = Cencori(hedging=HedgePolicy(percentile=0.95))
+    """
+
+    percentile: float = 0.95
+    initial_delay: float = 1.0
+    min_samples: int = 20
+    min_delay: float = 0.01
+    window: int = 200
+    budget: float = 0.1
+    burst: float = 10.0
+    base_url: Optional[str] = None
+    alternate_models: Dict[str, str] = field(default_factory=dict)
+    max_workers: int = 32
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+
+
+class Hedger:
+    """Latency tracking and the hedge race for one client."""
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+        self._latencies: Dict[Tuple[str, str], Deque[float]] = {}
+        self._tokens = 1.0
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    @staticmethod
+    def key(endpoint: str, body: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        model = body.get("model") if body else None
+        return endpoint, str(model or "")
+
+    def alternate(self, endpoint: str, body: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """The duplicate's body: the same, or with the chat model swapped."""
+        if endpoint != CHAT_ENDPOINT or not body:
+            return body
+        model = self.policy.alternate_models.get(body.get("model", ""))
+        return body if model is None else {**body, "model": model}
+
+    def delay(self, key: Tuple[str, str]) -> float:
+        """Seconds to wait before hedging a call with this key."""
+        with self._lock:
+            recent = sorted(self._latencies.get(key, ()))
+        if len(recent) < self.policy.min_samples:
+            return self.policy.initial_delay
+        index = min(len(recent) - 1, int(self.policy.percentile * len(recent)))
+        return max(self.policy.min_delay, recent[index])
+
+    def record(self, key: Tuple[str, str], latency: float) -> None:
+        with self._lock:
+            recent = self._latencies.get(key)
+            if recent is None:
+                recent = self._latencies[key] = deque(maxlen=self.policy.window)
+            recent.append(latency)
+
+    def _start(self) -> None:
+        with self._lock:
+            self._tokens = min(self.policy.burst, self._tokens + self.policy.budget)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges += 1
+            return True
+
+    def call(self, key: Tuple[str, str], primary: Callable[[], T], hedge: Callable[[], T]) -> T:
+        """Run ``primary``; start ``hedge`` if it is slow and return the first success."""
+        self._start()
+        delay = self.delay(key)
+        # The primary gets a thread of its own rather than a pool slot, so it
+        # never queues behind other calls' duplicates: that wait would count
+        # towards its latency and throttle unrelated calls to max_workers.
+        first: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+        threading.Thread(
+            target=self._run, args=(first, key, primary), name="cencori-primary", daemon=True
+        ).start()
+        try:
+            return first.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+        if not self._take_token():
+            return first.result()
+
+        second = self._get_executor().submit(self._timed, key, hedge)
+        pending: Set["concurrent.futures.Future[T]"] = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in (first, second):
+                if future in done and future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is second:
+                        self._won()
+                    return future.result()
+            for future in done:
+                error = error or future.exception()
+        assert error is not None
+        raise error
+
+    async def async_call(
+        self,
+        key: Tuple[str, str],
+        primary: Callable[[], Awaitable[T]],
+        hedge: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Async version of :meth:`call`; the losing request is cancelled."""
+        self._start()
+        delay = self.delay(key)
+        first: "asyncio.Future[T]" = asyncio.ensure_future(self._async_timed(key, primary))
+        pending: "Set[asyncio.Future[T]]" = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self._take_token():
+                return await first
+
+            second: "asyncio.Future[T]" = asyncio.ensure_future(self._async_timed(key, hedge))
+            pending.add(second)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (first, second):
+                    if task in done and task.exception() is None:
+                        if task is second:
+                            self._won()
+                        return task.result()
+                for task in done:
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self) -> None:
+        """Shut down the worker threads (running losers finish in the background)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _run(
+        self, future: "concurrent.futures.Future[T]", key: Tuple[str, str], send: Callable[[], T]
+    ) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(self._timed(key, send))
+        except BaseException as exc:  # noqa: BLE001 - handed to the waiting caller
+            future.set_exception(exc)
+
+    def _timed(self, key: Tuple[str, str], send: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        result = send()
+        self.record(key, time.perf_counter() - started)
+        return result
+
+    async def _async_timed(self, key: Tuple[str, str], send: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        result = await send()
+        self.record(key, time.perf_counter() - started)
+        return result
+
+    def _won(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.policy.max_workers, thread_name_prefix="cencori-hedge"
+                )
+            return self._executor
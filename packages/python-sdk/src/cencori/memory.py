@@ -1,5 +1,6 @@
 """Memory module for vector storage and semantic search."""
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .types import (
@@ -12,7 +13,7 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient, Cencori
 
 
 class MemoryModule:
@@ -33,27 +34,10 @@ class MemoryModule:
         Returns:
             Created MemoryNamespace
         """
-        payload: Dict[str, Any] = {"name": options.name}
-        if options.description is not None:
-            payload["description"] = options.description
-        if options.embedding_model is not None:
-            payload["embeddingModel"] = options.embedding_model
-        if options.dimensions is not None:
-            payload["dimensions"] = options.dimensions
-        if options.metadata is not None:
-            payload["metadata"] = options.metadata
-
-        data = self._client._request("POST", "/api/memory/namespaces", json=payload)
-        return MemoryNamespace(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            description=data.get("description"),
-            embedding_model=data.get("embeddingModel", ""),
-            dimensions=data.get("dimensions", 0),
-            metadata=data.get("metadata"),
-            memory_count=data.get("memoryCount"),
-            created_at=data.get("createdAt", ""),
+        data = self._client._request(
+            "POST", "/api/memory/namespaces", json=self._namespace_payload(options)
         )
+        return self._parse_namespace(data)
 
     def list_namespaces(self) -> List[MemoryNamespace]:
         """
@@ -63,19 +47,7 @@ class MemoryModule:
             List of MemoryNamespace objects
         """
         data = self._client._request("GET", "/api/memory/namespaces")
-        return [
-            MemoryNamespace(
-                id=ns.get("id", ""),
-                name=ns.get("name", ""),
-                description=ns.get("description"),
-                embedding_model=ns.get("embeddingModel", ""),
-                dimensions=ns.get("dimensions", 0),
-                metadata=ns.get("metadata"),
-                memory_count=ns.get("memoryCount"),
-                created_at=ns.get("createdAt", ""),
-            )
-            for ns in data.get("namespaces", [])
-        ]
+        return [self._parse_namespace(ns) for ns in data.get("namespaces", [])]
 
     def store(self, options: StoreMemoryOptions) -> Memory:
         """
@@ -87,18 +59,7 @@ class MemoryModule:
         Returns:
             Stored Memory
         """
-        payload: Dict[str, Any] = {
-            "namespace": options.namespace,
-            "content": options.content,
-        }
-        if options.embedding is not None:
-            payload["embedding"] = options.embedding
-        if options.metadata is not None:
-            payload["metadata"] = options.metadata
-        if options.expires_at is not None:
-            payload["expiresAt"] = options.expires_at
-
-        data = self._client._request("POST", "/api/memory/store", json=payload)
+        data = self._client._request("POST", "/api/memory/store", json=self._store_payload(options))
         return self._parse_memory(data)
 
     def search(self, options: SearchMemoryOptions) -> SearchResult:
@@ -111,25 +72,10 @@ class MemoryModule:
         Returns:
             SearchResult with matching memories
         """
-        payload: Dict[str, Any] = {
-            "namespace": options.namespace,
-            "query": options.query,
-        }
-        if options.limit is not None:
-            payload["limit"] = options.limit
-        if options.threshold is not None:
-            payload["threshold"] = options.threshold
-        if options.filter is not None:
-            payload["filter"] = options.filter
-
-        data = self._client._request("POST", "/api/memory/search", json=payload)
-        return SearchResult(
-            results=[self._parse_memory(m) for m in data.get("results", [])],
-            query=data.get("query", options.query),
-            namespace=data.get("namespace", options.namespace),
-            count=data.get("count", 0),
-            latency_ms=data.get("latencyMs", 0),
+        data = self._client._request(
+            "POST", "/api/memory/search", json=self._search_payload(options), hedge=True
         )
+        return self._parse_search(data, options)
 
     def get(self, memory_id: str) -> Memory:
         """
@@ -168,15 +114,7 @@ class MemoryModule:
         Returns:
             List of stored Memory objects
         """
-        results = []
-        for item in items:
-            opts = StoreMemoryOptions(
-                namespace=namespace,
-                content=item["content"],
-                metadata=item.get("metadata"),
-            )
-            results.append(self.store(opts))
-        return results
+        return [self.store(opts) for opts in self._batch_options(namespace, items)]
 
     def delete_by_filter(self, namespace: str, filter: Dict[str, Any]) -> Dict[str, int]:
         """
@@ -190,20 +128,100 @@ class MemoryModule:
         Returns:
             Dict with 'deleted' count
         """
-        search_result = self.search(SearchMemoryOptions(
-            namespace=namespace,
-            query="*",
-            limit=1000,
-            threshold=0,
-            filter=filter,
-        ))
+        search_result = self.search(self._filter_search(namespace, filter))
         deleted = 0
         for mem in search_result.results:
             self.delete(mem.id)
             deleted += 1
         return {"deleted": deleted}
 
-    def _parse_memory(self, data: Dict[str, Any]) -> Memory:
+    @staticmethod
+    def _namespace_payload(options: CreateNamespaceOptions) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"name": options.name}
+        if options.description is not None:
+            payload["description"] = options.description
+        if options.embedding_model is not None:
+            payload["embeddingModel"] = options.embedding_model
+        if options.dimensions is not None:
+            payload["dimensions"] = options.dimensions
+        if options.metadata is not None:
+            payload["metadata"] = options.metadata
+        return payload
+
+    @staticmethod
+    def _parse_namespace(data: Dict[str, Any]) -> MemoryNamespace:
+        return MemoryNamespace(
+            id=data.get("id", ""),
+            name=data.get("name", ""),
+            description=data.get("description"),
+            embedding_model=data.get("embeddingModel", ""),
+            dimensions=data.get("dimensions", 0),
+            metadata=data.get("metadata"),
+            memory_count=data.get("memoryCount"),
+            created_at=data.get("createdAt", ""),
+        )
+
+    @staticmethod
+    def _store_payload(options: StoreMemoryOptions) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "namespace": options.namespace,
+            "content": options.content,
+        }
+        if options.embedding is not None:
+            payload["embedding"] = options.embedding
+        if options.metadata is not None:
+            payload["metadata"] = options.metadata
+        if options.expires_at is not None:
+            payload["expiresAt"] = options.expires_at
+        return payload
+
+    @staticmethod
+    def _search_payload(options: SearchMemoryOptions) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "namespace": options.namespace,
+            "query": options.query,
+        }
+        if options.limit is not None:
+            payload["limit"] = options.limit
+        if options.threshold is not None:
+            payload["threshold"] = options.threshold
+        if options.filter is not None:
+            payload["filter"] = options.filter
+        return payload
+
+    @staticmethod
+    def _parse_search(data: Dict[str, Any], options: SearchMemoryOptions) -> SearchResult:
+        return SearchResult(
+            results=[MemoryModule._parse_memory(m) for m in data.get("results", [])],
+            query=data.get("query", options.query),
+            namespace=data.get("namespace", options.namespace),
+            count=data.get("count", 0),
+            latency_ms=data.get("latencyMs", 0),
+        )
+
+    @staticmethod
+    def _batch_options(namespace: str, items: List[Dict[str, Any]]) -> List[StoreMemoryOptions]:
+        return [
+            StoreMemoryOptions(
+                namespace=namespace,
+                content=item["content"],
+                metadata=item.get("metadata"),
+            )
+            for item in items
+        ]
+
+    @staticmethod
+    def _filter_search(namespace: str, filter: Dict[str, Any]) -> SearchMemoryOptions:
+        return SearchMemoryOptions(
+            namespace=namespace,
+            query="*",
+            limit=1000,
+            threshold=0,
+            filter=filter,
+        )
+
+    @staticmethod
+    def _parse_memory(data: Dict[str, Any]) -> Memory:
         return Memory(
             id=data.get("id", ""),
             namespace=data.get("namespace", ""),
@@ -214,3 +232,64 @@ class MemoryModule:
             created_at=data.get("createdAt", ""),
             updated_at=data.get("updatedAt"),
         )
+
+
+class AsyncMemoryModule:
+    """
+    Memory module for :class:`~cencori.AsyncCencori`.
+
+    Same methods as :class:`MemoryModule`; each one is a coroutine. The
+    client-side batch helpers issue their requests concurrently.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+
+    async def create_namespace(self, options: CreateNamespaceOptions) -> MemoryNamespace:
+        """Create a new memory namespace."""
+        data = await self._client._async_request(
+            "POST", "/api/memory/namespaces", json=MemoryModule._namespace_payload(options)
+        )
+        return MemoryModule._parse_namespace(data)
+
+    async def list_namespaces(self) -> List[MemoryNamespace]:
+        """List all memory namespaces for the project."""
+        data = await self._client._async_request("GET", "/api/memory/namespaces")
+        return [MemoryModule._parse_namespace(ns) for ns in data.get("namespaces", [])]
+
+    async def store(self, options: StoreMemoryOptions) -> Memory:
+        """Store a memory in a namespace."""
+        data = await self._client._async_request(
+            "POST", "/api/memory/store", json=MemoryModule._store_payload(options)
+        )
+        return MemoryModule._parse_memory(data)
+
+    async def search(self, options: SearchMemoryOptions) -> SearchResult:
+        """Semantic search across memories in a namespace."""
+        data = await self._client._async_request(
+            "POST", "/api/memory/search", json=MemoryModule._search_payload(options), hedge=True
+        )
+        return MemoryModule._parse_search(data, options)
+
+    async def get(self, memory_id: str) -> Memory:
+        """Get a memory by ID."""
+        data = await self._client._async_request("GET", f"/api/memory/{memory_id}")
+        return MemoryModule._parse_memory(data)
+
+    async def delete(self, memory_id: str) -> Dict[str, Any]:
+        """Delete a memory by ID."""
+        return await self._client._async_request("DELETE", f"/api/memory/{memory_id}")
+
+    async def store_batch(self, namespace: str, items: List[Dict[str, Any]]) -> List[Memory]:
+        """Store multiple memories concurrently; results keep the input order."""
+        return list(
+            await asyncio.gather(
+                *(self.store(opts) for opts in MemoryModule._batch_options(namespace, items))
+            )
+        )
+
+    async def delete_by_filter(self, namespace: str, filter: Dict[str, Any]) -> Dict[str, int]:
+        """Delete all memories in a namespace matching a filter."""
+        search_result = await self.search(MemoryModule._filter_search(namespace, filter))
+        await asyncio.gather(*(self.delete(mem.id) for mem in search_result.results))
+        return {"deleted": len(search_result.results)}
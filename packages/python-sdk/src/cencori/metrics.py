@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict
 from urllib.parse import quote
 
 from .types import (
@@ -11,7 +11,7 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient, Cencori
 
 
 class MetricsModule:
@@ -32,9 +32,15 @@ class MetricsModule:
         Returns:
             MetricsResponse object
         """
-        path = f"/v1/metrics?period={quote(period, safe='')}"
-        data = self._client._request("GET", path)
+        data = self._client._request("GET", self._path(period))
+        return self._parse(data)
 
+    @staticmethod
+    def _path(period: str) -> str:
+        return f"/v1/metrics?period={quote(period, safe='')}"
+
+    @staticmethod
+    def _parse(data: Dict[str, Any]) -> MetricsResponse:
         return MetricsResponse(
             period=data["period"],
             start_date=data["start_date"],
@@ -46,3 +52,17 @@ class MetricsModule:
             providers={k: Breakdown(**v) for k, v in data.get("providers", {}).items()},
             models={k: Breakdown(**v) for k, v in data.get("models", {}).items()},
         )
+
+
+class AsyncMetricsModule:
+    """
+    Metrics module for :class:`~cencori.AsyncCencori`.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+
+    async def get(self, period: str) -> MetricsResponse:
+        """Get metrics for a specific period (e.g. "24h", "7d", "30d")."""
+        data = await self._client._async_request("GET", MetricsModule._path(period))
+        return MetricsModule._parse(data)
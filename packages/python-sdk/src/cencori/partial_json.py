@@ -0,0 +1,161 @@
+"""Incremental parsing of a JSON document that is still arriving."""
+
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_DELIMITERS = frozenset(",:]} \t\r\n")
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class PartialJSONParser:
+    """
+    Turns a growing JSON text into progressively more complete values.
+
+    Each character is scanned once: the parser tracks open containers,
+    strings and bare tokens, and remembers the last point where the text
+    can be closed into valid JSON. :meth:`update` closes the text there
+    (finishing an in-progress string value, dropping a dangling key, comma
+    or half-read number) and decodes it. Values only grow: a field appears
+    once its key is complete, numbers and ``true``/``false``/``null`` once
+    they are followed by a delimiter, and string values grow as they stream.
+
+    Example:
+        >>> parser = PartialJSONParser()
+        >>> parser.update('{"title": "Hel')
+        {'title': 'Hel'}
+        >>> parser.update('{"title": "Hello", "tags": ["a", "b')
+        {'title': 'Hello', 'tags': ['a', 'b']}
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._text = ""
+        self._stack: List[str] = []  # open "{" / "["
+        self._expect: List[str] = []  # per open container: key, colon, value or comma
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = -1  # index of the backslash of an unfinished escape
+        self._token = False  # inside a number or literal
+        self._safe = 0  # text[:safe] + closers is valid JSON
+        self._last: Optional[Tuple[int, str]] = None
+
+    def update(self, text: str) -> Optional[Any]:
+        """
+        Parse ``text``, the whole document so far.
+
+        Returns the new partial value, or None if it has not changed since
+        the last call. If ``text`` does not extend the previous text, parsing
+        starts over.
+        """
+        if not text.startswith(self._text):
+            self._reset()
+        start = len(self._text)
+        self._text = text
+        self._scan(start)
+        return self._snapshot()
+
+    def _scan(self, i: int) -> None:
+        text = self._text
+        end = len(text)
+        while i < end:
+            if self._in_string:
+                i = self._scan_string(i)
+                continue
+            c = text[i]
+            if self._token:
+                if c not in _DELIMITERS:
+                    i += 1
+                    continue
+                self._token = False
+                self._value_done(i)
+            if c in " \t\r\n":
+                pass
+            elif c == "{" or c == "[":
+                self._stack.append(c)
+                self._expect.append("key" if c == "{" else "value")
+                self._safe = i + 1
+            elif c == "}" or c == "]":
+                if self._stack:
+                    self._stack.pop()
+                    self._expect.pop()
+                self._value_done(i + 1)
+            elif c == '"':
+                self._in_string = True
+                self._string_is_key = bool(self._expect) and self._expect[-1] == "key"
+            elif c == ",":
+                if self._stack:
+                    self._expect[-1] = "key" if self._stack[-1] == "{" else "value"
+            elif c == ":":
+                if self._expect:
+                    self._expect[-1] = "value"
+            else:
+                self._token = True
+            i += 1
+
+    def _scan_string(self, i: int) -> int:
+        text = self._text
+        if self._escape >= 0:
+            # "\uXXXX" needs four more characters, other escapes one.
+            needed = 6 if text[self._escape + 1 : self._escape + 2] == "u" else 2
+            if len(text) - self._escape < needed:
+                return len(text)
+            i = self._escape + needed
+            self._escape = -1
+        match = _STRING_SPECIAL.search(text, i)
+        if match is None:
+            return len(text)
+        i = match.start()
+        if text[i] == "\\":
+            self._escape = i
+            return i + 1
+        self._in_string = False
+        if self._string_is_key:
+            self._expect[-1] = "colon"
+        else:
+            self._value_done(i + 1)
+        return i + 1
+
+    def _value_done(self, end: int) -> None:
+        if self._expect:
+            self._expect[-1] = "comma"
+        self._safe = end
+
+    def _snapshot(self) -> Optional[Any]:
+        closers = "".join(_CLOSERS[c] for c in reversed(self._stack))
+        if self._in_string and not self._string_is_key:
+            end = self._escape if self._escape >= 0 else len(self._text)
+            cut = _before_high_surrogate(self._text, end)
+            candidate = self._text[:cut] + '"' + closers
+            key = (cut, '"' + closers)
+        elif self._safe:
+            candidate = self._text[: self._safe] + closers
+            key = (self._safe, closers)
+        else:
+            return None
+        if key == self._last:
+            return None
+        try:
+            value = json.loads(candidate)
+        except ValueError:
+            return None  # malformed input; the final full parse reports it
+        self._last = key
+        return value
+
+
+def _before_high_surrogate(text: str, end: int) -> int:
+    """``end``, moved back before an escaped high surrogate still awaiting its pair."""
+    start = end - 6
+    if start < 0 or text[start : start + 2] != "\\u":
+        return end
+    try:
+        code = int(text[start + 2 : end], 16)
+    except ValueError:
+        return end
+    backslashes = start - len(text[:start].rstrip("\\"))
+    if 0xD800 <= code <= 0xDBFF and backslashes % 2 == 0:
+        return start
+    return end
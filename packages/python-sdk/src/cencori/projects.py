@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, List, NoReturn
 from .types import CreateProjectParams, Project
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient
 
 
 _MANAGEMENT_AUTH_ERROR = (
@@ -15,7 +15,7 @@ _MANAGEMENT_AUTH_ERROR = (
 class ProjectsModule:
     """Project management reserved for a future management-auth API."""
 
-    def __init__(self, client: "Cencori") -> None:
+    def __init__(self, client: "BaseClient") -> None:
         self._client = client
 
     @staticmethod
@@ -0,0 +1,241 @@
+"""Speculative races: one chat request sent to several models at once."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .accumulator import StreamAccumulator
+from .errors import ProviderError
+from .routing import ModelRouter
+from .timing import AsyncTimedStream, TimedStream
+from .types import RaceResult, StreamChunk
+
+
+def race(
+    models: Sequence[str],
+    open_stream: Callable[[str], TimedStream[StreamChunk]],
+    stream: bool,
+    grace: float = 0.0,
+    router: Optional[ModelRouter] = None,
+) -> RaceResult[Any]:
+    """
+    Stream ``open_stream(model)`` for every model on its own thread; the first to finish wins.
+
+    With ``stream`` the finish line is the first token and the winner's value
+    is its stream, resumed from that token; otherwise it is the complete
+    response. Once the race is decided (after ``grace`` seconds, during which
+    a runner-up may finish and set the margin) the other entrants close their
+    streams at their next chunk. Threads cannot be interrupted mid-read, so
+    a loser that is still waiting for its first byte closes when it arrives.
+    """
+    candidates = _candidates(models)
+    stop = threading.Event()
+    lock = threading.Lock()
+    finishes: List[Tuple[float, str, Any]] = []
+    errors: Dict[str, Exception] = {}
+    # The raw streams: a loser's resumed wrapper may never have started, and
+    # closing an unstarted generator would not close what it wraps.
+    streams: Dict[str, TimedStream[StreamChunk]] = {}
+    started = time.perf_counter()
+
+    def run(model: str) -> None:
+        chunks = streams[model] = open_stream(model)
+        try:
+            accumulator = StreamAccumulator(model)
+            seen: List[StreamChunk] = []
+            for chunk in chunks:
+                if stop.is_set():
+                    break
+                _check(chunk)
+                if not stream:
+                    accumulator.add(chunk)
+                    continue
+                seen.append(chunk)
+                if chunk.delta or chunk.tool_calls:
+                    break
+        except BaseException:
+            chunks.close()
+            raise
+        value: Any = (
+            TimedStream(_resume(seen, chunks), chunks.timer) if stream else accumulator.response()
+        )
+        # Decided under the lock so nothing is added after the race is called.
+        with lock:
+            late = stop.is_set()
+            if not late:
+                finishes.append((time.perf_counter() - started, model, value))
+        if late:
+            chunks.close()
+
+    executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="cencori-race")
+    futures: Dict["Future[None]", str] = {
+        executor.submit(run, model): model for model in candidates
+    }
+    try:
+        pending: Set["Future[None]"] = set(futures)
+        deadline: Optional[float] = None
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                _failed(futures[future], future.exception(), errors)
+            if finishes and deadline is None:
+                deadline = time.perf_counter() + grace
+    finally:
+        with lock:
+            stop.set()
+            finishes.sort(key=lambda finish: finish[0])
+        executor.shutdown(wait=False)
+    if stream:
+        for _, model, _ in finishes[1:]:
+            streams[model].close()
+    return _result(candidates, finishes, errors, stream, router)
+
+
+async def async_race(
+    models: Sequence[str],
+    open_stream: Callable[[str], AsyncTimedStream[StreamChunk]],
+    stream: bool,
+    grace: float = 0.0,
+    router: Optional[ModelRouter] = None,
+) -> RaceResult[Any]:
+    """Async version of :func:`race`; losers are cancelled and closed before it returns."""
+    candidates = _candidates(models)
+    streams: Dict[str, AsyncTimedStream[StreamChunk]] = {}
+    started = time.perf_counter()
+
+    async def run(model: str) -> Tuple[float, Any]:
+        chunks = streams[model] = open_stream(model)
+        try:
+            accumulator = StreamAccumulator(model)
+            seen: List[StreamChunk] = []
+            async for chunk in chunks:
+                _check(chunk)
+                if not stream:
+                    accumulator.add(chunk)
+                    continue
+                seen.append(chunk)
+                if chunk.delta or chunk.tool_calls:
+                    break
+        except BaseException:
+            await chunks.aclose()
+            raise
+        finished = time.perf_counter() - started
+        if stream:
+            return finished, AsyncTimedStream(_aresume(seen, chunks), chunks.timer)
+        return finished, accumulator.response()
+
+    tasks: "Dict[asyncio.Future[Tuple[float, Any]], str]" = {
+        asyncio.ensure_future(run(model)): model for model in candidates
+    }
+    finishes: List[Tuple[float, str, Any]] = []
+    errors: Dict[str, Exception] = {}
+    pending: "Set[asyncio.Future[Tuple[float, Any]]]" = set(tasks)
+    try:
+        deadline: Optional[float] = None
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    elapsed, value = task.result()
+                    finishes.append((elapsed, tasks[task], value))
+                _failed(tasks[task], error, errors)
+            if finishes and deadline is None:
+                deadline = time.perf_counter() + grace
+    finally:
+        for task in pending:
+            task.cancel()
+        # Wait for the cancelled requests to close so their connections are free.
+        cancelled = list(pending)
+        late = await asyncio.gather(*cancelled, return_exceptions=True)
+        finishes.sort(key=lambda finish: finish[0])
+    if stream:
+        # Entrants that reached their first token before being cancelled.
+        losers = [finish[1] for finish in finishes[1:]] + [
+            tasks[task] for task, outcome in zip(cancelled, late) if isinstance(outcome, tuple)
+        ]
+        for model in losers:
+            await streams[model].aclose()
+    return _result(candidates, finishes, errors, stream, router)
+
+
+def _candidates(models: Sequence[str]) -> List[str]:
+    candidates = list(dict.fromkeys(models))
+    if not candidates:
+        raise ValueError("models must name at least one candidate")
+    return candidates
+
+
+def _check(chunk: StreamChunk) -> None:
+    if chunk.error is not None:
+        raise ProviderError(chunk.error)
+
+
+def _failed(model: str, error: Optional[BaseException], errors: Dict[str, Exception]) -> None:
+    if error is None:
+        return
+    if not isinstance(error, Exception):
+        raise error
+    errors[model] = error
+
+
+def _result(
+    candidates: List[str],
+    finishes: List[Tuple[float, str, Any]],
+    errors: Dict[str, Exception],
+    stream: bool,
+    router: Optional[ModelRouter],
+) -> RaceResult[Any]:
+    if router is not None:
+        for model in errors:
+            router.record(model, None, ok=False)
+        if not stream:
+            # Time to first token is not comparable with the router's call latencies.
+            for elapsed, model, _ in finishes:
+                router.record(model, elapsed, ok=True)
+    if not finishes:
+        raise next(errors[model] for model in candidates if model in errors)
+    elapsed, model, value = finishes[0]
+    margin = finishes[1][0] - elapsed if len(finishes) > 1 else None
+    return RaceResult(model=model, value=value, elapsed_s=elapsed, margin_s=margin, errors=errors)
+
+
+def _resume(seen: List[StreamChunk], rest: TimedStream[StreamChunk]) -> Iterator[StreamChunk]:
+    try:
+        yield from seen
+        yield from rest
+    finally:
+        rest.close()
+
+
+async def _aresume(
+    seen: List[StreamChunk], rest: AsyncTimedStream[StreamChunk]
+) -> AsyncIterator[StreamChunk]:
+    try:
+        for chunk in seen:
+            yield chunk
+        async for chunk in rest:
+            yield chunk
+    finally:
+        await rest.aclose()
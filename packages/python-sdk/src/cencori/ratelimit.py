@@ -0,0 +1,137 @@
+"""Local token-bucket pacing of requests and tokens per API key and model."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .tokens import estimate_message_tokens
+
+
+@dataclass
+class RateLimit:
+    """
+    Per-minute budget for one (API key, model) pair.
+
+    Args:
+        requests_per_minute: Requests allowed per minute (None for unlimited)
+        tokens_per_minute: Estimated prompt + completion tokens per minute
+            (None for unlimited)
+    """
+
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+
+class TokenBucket:
+    """
+    Token bucket that refills continuously up to one minute of budget.
+
+    :meth:`reserve` charges the bucket immediately, letting it go negative, and
+    returns how long the caller must wait for the debt to refill. Reserving up
+    front keeps waiters first-come-first-served without a queue.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Charge ``amount`` and return the seconds to wait before proceeding."""
+        with self._lock:
+            self._refill()
+            self.tokens -= amount
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self, amount: float) -> None:
+        """Give back ``amount`` (negative to charge more), e.g. after real usage is known."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Client-side scheduler that paces chat calls against per-minute budgets.
+
+    Budgets are tracked per (API key, model): ``models`` overrides the
+    ``default`` budget for specific models. When a bucket is empty the caller
+    waits (``time.sleep`` / ``asyncio.sleep``) instead of being rejected, so
+    batch jobs run at a flat rate under the provider quota rather than
+    bursting into 429s. Token charges are estimated before the call and
+    corrected with the reported usage afterwards.
+
+    Example:
+        >>> from cencori import Cencori, RateLimit, RateLimiter
+        >>> limiter = RateLimiter(
+        ...     default=RateLimit(requests_per_minute=500, tokens_per_minute=200_000),
+        ...     models={"gpt-4o": RateLimit(requests_per_minute=60)},
+        ... )
+        >>> cencori = Cencori(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        models: Optional[Dict[str, RateLimit]] = None,
+    ) -> None:
+        self._default = default or RateLimit()
+        self._models = models or {}
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, api_key: str, model: str, tokens: int) -> None:
+        """Block until one request and ``tokens`` fit the budget."""
+        delay = self._reserve(api_key, model, tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self, api_key: str, model: str, tokens: int) -> None:
+        """Await until one request and ``tokens`` fit the budget."""
+        delay = self._reserve(api_key, model, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def settle(self, api_key: str, model: str, estimated: int, actual: int) -> None:
+        """Correct the token bucket once the real usage of a call is known."""
+        bucket = self._bucket(api_key, model, "tokens")
+        if bucket is not None and actual > 0:
+            bucket.refund(estimated - actual)
+
+    def _reserve(self, api_key: str, model: str, tokens: int) -> float:
+        delay = 0.0
+        requests = self._bucket(api_key, model, "requests")
+        if requests is not None:
+            delay = requests.reserve(1)
+        token_bucket = self._bucket(api_key, model, "tokens")
+        if token_bucket is not None:
+            delay = max(delay, token_bucket.reserve(tokens))
+        return delay
+
+    def _bucket(self, api_key: str, model: str, kind: str) -> Optional[TokenBucket]:
+        limit = self._models.get(model, self._default)
+        per_minute = limit.requests_per_minute if kind == "requests" else limit.tokens_per_minute
+        if per_minute is None:
+            return None
+        key = (api_key, model, kind)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(per_minute)
+            return bucket
+
+
+def estimate_tokens(
+    messages: List[Dict[str, Any]], max_tokens: Optional[int] = None, model: str = ""
+) -> int:
+    """Token estimate for a chat call: prompt tokens for ``model`` plus the output budget."""
+    return estimate_message_tokens(messages, model) + (max_tokens or 0)
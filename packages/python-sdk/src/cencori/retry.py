@@ -0,0 +1,150 @@
+"""Retry policy with exponential backoff, full jitter and Retry-After support."""
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+from .errors import CencoriError, StreamStalledError
+
+# Transport failures that are safe to retry: the request either never reached
+# the server or the server stopped answering.
+RETRYABLE_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.PoolTimeout,
+)
+
+# Statuses that mean "try again later" rather than "this request is wrong".
+TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_transient(exc: BaseException) -> bool:
+    """
+    Whether a call that raised ``exc`` could succeed if sent again later.
+
+    True for timeouts and connection failures, stalled streams, and 408/429/5xx
+    responses (i.e. what is left after the client's own retries give up);
+    False for errors in the request itself, such as 400, 401 or 402.
+    """
+    if isinstance(exc, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+        return True
+    if isinstance(exc, StreamStalledError):
+        return True
+    return isinstance(exc, CencoriError) and exc.status_code in TRANSIENT_STATUSES
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy applied by the client to every request.
+
+    Failed attempts are retried after ``random.uniform(0, min(max_backoff,
+    initial_backoff * 2 ** attempt))`` seconds ("full jitter"). When the server
+    sends ``Retry-After`` that delay is used instead. ``deadline`` bounds the
+    total time spent on one call across all attempts, including backoff.
+
+    Args:
+        max_attempts: Total attempts per call, including the first (1 disables retries)
+        initial_backoff: Backoff ceiling for the first retry, in seconds
+        max_backoff: Upper bound for any single computed backoff, in seconds
+        retry_statuses: HTTP status codes that trigger a retry
+        retry_on_timeout: Retry connect/read timeouts and connection errors
+        deadline: Overall per-call budget in seconds (None for no limit)
+
+    Example:
+        >>> from cencori import Cencori, RetryPolicy
+        >>> cencori = Cencori(retry=RetryPolicy(max_attempts=5, deadline=20.0))
+    """
+
+    max_attempts: int = 3
+    initial_backoff: float = 0.5
+    max_backoff: float = 8.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    retry_on_timeout: bool = True
+    deadline: Optional[float] = None
+
+    def start(self) -> "RetryState":
+        """Begin tracking attempts for a single call."""
+        return RetryState(self)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter backoff before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.max_backoff, self.initial_backoff * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+class RetryState:
+    """Attempt counter and deadline for one call under a :class:`RetryPolicy`."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.attempt = 0
+        self._deadline_at = (
+            time.monotonic() + policy.deadline if policy.deadline is not None else None
+        )
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the call deadline (None if unbounded)."""
+        if self._deadline_at is None:
+            return None
+        return max(0.0, self._deadline_at - time.monotonic())
+
+    def timeout(self, default: float) -> float:
+        """Per-attempt timeout, capped by the remaining deadline."""
+        remaining = self.remaining()
+        return default if remaining is None else min(default, remaining)
+
+    def next_delay(
+        self,
+        response: Optional[httpx.Response] = None,
+        exc: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Returns the delay in seconds before the next attempt, or None when the
+        failure is not retryable, attempts are exhausted, or the deadline would
+        be exceeded.
+        """
+        if response is not None:
+            if response.status_code not in self.policy.retry_statuses:
+                return None
+        elif exc is not None:
+            if not (self.policy.retry_on_timeout and isinstance(exc, RETRYABLE_EXCEPTIONS)):
+                return None
+        else:
+            return None
+
+        if self.attempt + 1 >= self.policy.max_attempts:
+            return None
+
+        retry_after = parse_retry_after(response) if response is not None else None
+        delay = retry_after if retry_after is not None else self.policy.backoff(self.attempt)
+
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        self.attempt += 1
+        return delay
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
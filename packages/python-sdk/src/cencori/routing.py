@@ -0,0 +1,212 @@
+"""Latency- and error-aware selection among candidate models."""
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from .errors import ProviderError, RateLimitError
+from .retry import RetryPolicy, is_transient
+from .types import ModelScore
+
+T = TypeVar("T")
+
+# Per-candidate attempts leave 429 and 502 to the router, which moves on to the
+# next model instead of backing off on the degraded one.
+ROUTED_RETRY = RetryPolicy(retry_statuses=frozenset({503, 504}))
+
+
+@dataclass
+class _ModelState:
+    latency_s: Optional[float] = None
+    error_rate: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    last_failure: float = -math.inf
+
+
+class ModelRouter:
+    """
+    Sends each call to the best-scoring healthy model in a candidate list.
+
+    For every model the router keeps an exponentially weighted moving average
+    (EWMA) of successful call latency and of the failure rate. A model's
+    score is ``latency * (1 + error_penalty * error_rate)``; lower is better.
+    Models not tried yet go first, in candidate order, so they get measured;
+    ties also keep candidate order. A model whose error rate reaches
+    ``error_threshold`` is unhealthy for ``cooldown`` seconds after its last
+    failure, then gets traffic again so it can recover. Only failures of the
+    model's service count against it: :class:`ProviderError`,
+    :class:`RateLimitError` and any other transient failure left after
+    retries (timeouts, connection errors, 429, 5xx). On those the call falls
+    back to the next model; other errors (bad requests, safety blocks,
+    prompts too large for the window) are raised straight away and leave
+    the model's stats alone.
+
+    ``send`` gets the model and a :class:`RoutedAttempt`. The call's latency
+    is measured from :meth:`RoutedAttempt.restart` (or from the start of the
+    attempt) to its return; an attempt answered without reaching the model,
+    such as a response-cache hit, calls :meth:`RoutedAttempt.discard` and is
+    not counted at all.
+
+    With probability ``explore`` a random other healthy candidate goes first,
+    so a model that was slow once is re-measured now and then.
+
+    Args:
+        alpha: EWMA weight of the newest observation (0-1)
+        error_threshold: Error rate at which a model is taken out of rotation
+        error_penalty: How strongly the error rate inflates the score
+        cooldown: Seconds an unhealthy model sits out after its last failure
+        explore: Probability of trying a random non-best healthy model first
+        retry: Retry policy for each candidate attempt (default: retries
+            transport errors, 503 and 504; 429 and 502 fall back instead)
+
+    Example:
+        >>> response = cencori.ai.chat(messages, models=["gpt-4o-mini", "gemini-2.5-flash"])
+        >>> cencori.router.scores()["gpt-4o-mini"].latency_s
+    """
+
+    fallback_on: Tuple[Type[BaseException], ...] = (ProviderError, RateLimitError)
+
+    def __init__(
+        self,
+        alpha: float = 0.3,
+        error_threshold: float = 0.5,
+        error_penalty: float = 4.0,
+        cooldown: float = 30.0,
+        explore: float = 0.05,
+        retry: Optional[RetryPolicy] = None,
+    ) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.error_penalty = error_penalty
+        self.cooldown = cooldown
+        self.explore = explore
+        self.retry = retry or ROUTED_RETRY
+        self._lock = threading.Lock()
+        self._models: Dict[str, _ModelState] = {}
+
+    def record(self, model: str, latency_s: Optional[float], ok: bool) -> None:
+        """Fold one call's outcome in (``latency_s`` counts only for successes)."""
+        with self._lock:
+            state = self._models.setdefault(model, _ModelState())
+            state.requests += 1
+            state.error_rate += self.alpha * ((0.0 if ok else 1.0) - state.error_rate)
+            if not ok:
+                state.failures += 1
+                state.last_failure = time.monotonic()
+            elif latency_s is not None:
+                if state.latency_s is None:
+                    state.latency_s = latency_s
+                else:
+                    state.latency_s += self.alpha * (latency_s - state.latency_s)
+
+    def scores(self) -> Dict[str, ModelScore]:
+        """Current score of every model seen so far."""
+        with self._lock:
+            now = time.monotonic()
+            return {model: self._score(model, state, now) for model, state in self._models.items()}
+
+    def order(self, models: Sequence[str]) -> List[str]:
+        """Candidates in the order they would be tried: healthy by score, then unhealthy."""
+        if not models:
+            raise ValueError("models must name at least one candidate")
+        with self._lock:
+            now = time.monotonic()
+            ranked = []
+            for position, model in enumerate(dict.fromkeys(models)):
+                score = self._score(model, self._models.get(model, _ModelState()), now)
+                ranked.append((not score.healthy, score.requests > 0, score.score, position, model))
+        ranked.sort()
+        ordered = [entry[-1] for entry in ranked]
+        healthy = sum(1 for entry in ranked if not entry[0])
+        if healthy > 1 and random.random() < self.explore:
+            ordered.insert(0, ordered.pop(random.randrange(1, healthy)))
+        return ordered
+
+    def call(self, models: Sequence[str], send: Callable[[str, "RoutedAttempt"], T]) -> T:
+        """Run ``send(model, attempt)`` on the best candidate, falling back on provider errors."""
+        last: Optional[BaseException] = None
+        for model in self.order(models):
+            attempt = RoutedAttempt()
+            try:
+                result = send(model, attempt)
+            except Exception as exc:
+                if not self._failed(model, exc):
+                    raise
+                last = exc
+                continue
+            self._succeeded(model, attempt)
+            return result
+        assert last is not None
+        raise last
+
+    async def async_call(
+        self, models: Sequence[str], send: Callable[[str, "RoutedAttempt"], Awaitable[T]]
+    ) -> T:
+        """Async version of :meth:`call`."""
+        last: Optional[BaseException] = None
+        for model in self.order(models):
+            attempt = RoutedAttempt()
+            try:
+                result = await send(model, attempt)
+            except Exception as exc:
+                if not self._failed(model, exc):
+                    raise
+                last = exc
+                continue
+            self._succeeded(model, attempt)
+            return result
+        assert last is not None
+        raise last
+
+    def _succeeded(self, model: str, attempt: "RoutedAttempt") -> None:
+        if attempt.started is not None:
+            self.record(model, time.perf_counter() - attempt.started, ok=True)
+
+    def _failed(self, model: str, exc: Exception) -> bool:
+        """Record a failure of the model's service; True if the next candidate should be tried."""
+        if not (isinstance(exc, self.fallback_on) or is_transient(exc)):
+            return False
+        self.record(model, None, ok=False)
+        return True
+
+    def _score(self, model: str, state: _ModelState, now: float) -> ModelScore:
+        healthy = (
+            state.error_rate < self.error_threshold or now - state.last_failure >= self.cooldown
+        )
+        if state.latency_s is None:
+            # Never succeeded: untried models rank first, failed-only ones last.
+            score = 0.0 if state.requests == 0 else math.inf
+        else:
+            score = state.latency_s * (1 + self.error_penalty * state.error_rate)
+        return ModelScore(
+            model=model,
+            latency_s=state.latency_s,
+            error_rate=state.error_rate,
+            requests=state.requests,
+            failures=state.failures,
+            healthy=healthy,
+            score=score,
+        )
+
+
+class RoutedAttempt:
+    """The clock of one routed attempt, which the attempt can correct."""
+
+    __slots__ = ("started",)
+
+    def __init__(self) -> None:
+        self.started: Optional[float] = time.perf_counter()
+
+    def restart(self) -> None:
+        """Measure from now, leaving out local waits such as rate-limit pacing."""
+        self.started = time.perf_counter()
+
+    def discard(self) -> None:
+        """Answered without reaching the model: record nothing for this attempt."""
+        self.started = None
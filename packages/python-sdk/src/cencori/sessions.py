@@ -1,9 +1,11 @@
 """Sessions module for durable execution sessions."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional
 
 import httpx
 
+from .sse import aiter_events, iter_events
+from .timing import AsyncTimedStream, StreamTimer, TimedStream
 from .types import (
     ApproveRejectParams,
     CreateSessionParams,
@@ -15,7 +17,7 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient, Cencori
 
 
 class SessionsModule:
@@ -36,13 +38,7 @@ class SessionsModule:
         Returns:
             Created Session
         """
-        payload: Dict[str, Any] = {}
-        if params is not None:
-            if params.agent_id is not None:
-                payload["agent_id"] = params.agent_id
-            if params.metadata is not None:
-                payload["metadata"] = params.metadata
-
+        payload = self._create_payload(params)
         data = self._client._request("POST", "/v1/sessions", json=payload or None)
         return self._parse_session(data)
 
@@ -56,34 +52,8 @@ class SessionsModule:
         Returns:
             Dict with 'data' list and 'pagination'
         """
-        path = "/v1/sessions"
-        if params is not None:
-            query = []
-            if params.page is not None:
-                query.append(f"page={params.page}")
-            if params.limit is not None:
-                query.append(f"limit={params.limit}")
-            if params.status is not None:
-                query.append(f"status={params.status}")
-            if params.agent_id is not None:
-                query.append(f"agent_id={params.agent_id}")
-            if query:
-                path += "?" + "&".join(query)
-
-        data = self._client._request("GET", path)
-        pagination = None
-        if "pagination" in data:
-            p = data["pagination"]
-            pagination = Pagination(
-                page=p.get("page", 0),
-                limit=p.get("limit", 0),
-                total=p.get("total", 0),
-                total_pages=p.get("total_pages", 0),
-            )
-        return {
-            "data": [self._parse_session(s) for s in data.get("data", [])],
-            "pagination": pagination,
-        }
+        data = self._client._request("GET", self._list_path(params))
+        return self._parse_list(data)
 
     def get(self, session_id: str) -> Session:
         """
@@ -121,16 +91,50 @@ class SessionsModule:
         Returns:
             httpx.Response object (body can be streamed)
         """
-        url = f"{self._client._base_url}/v1/sessions/{session_id}/turns"
-        headers = {
-            "Content-Type": "application/json",
-            "CENCORI_API_KEY": self._client._api_key,
-        }
+        payload = self._turn_params_to_dict(params)
+        return self._client._get_http_client().request(
+            "POST",
+            f"{self._client._base_url}/v1/sessions/{session_id}/turns",
+            json=payload,
+            headers=self._client._headers(),
+        )
 
+    def stream_turn(self, session_id: str, params: TurnParams) -> TimedStream[Dict[str, Any]]:
+        """
+        Submit a turn and stream its events.
+
+        Args:
+            session_id: The session ID
+            params: Turn parameters
+
+        Returns:
+            Iterator of dicts with 'type' (e.g. ``output_text.delta``,
+            ``turn.completed``) and 'data' keys; its ``timing`` holds the
+            first-token and inter-token latencies once the turn ends
+
+        Example:
+            >>> turn = cencori.sessions.stream_turn(session.id, TurnParams(input="Hi"))
+            >>> for event in turn:
+            ...     if event["type"] == "output_text.delta":
+            ...         print(event["data"]["delta"], end="")
+            >>> turn.timing.ttft_s
+        """
+        path = f"/v1/sessions/{session_id}/turns"
+        timer = StreamTimer(params.model or "", path, self._client.stream_stats)
+        return TimedStream(self._turn_events(path, params, timer), timer)
+
+    def _turn_events(
+        self, path: str, params: TurnParams, timer: StreamTimer
+    ) -> Iterator[Dict[str, Any]]:
+        timer.start()
         payload = self._turn_params_to_dict(params)
-        client = httpx.Client(timeout=self._client._timeout)
-        response = client.request("POST", url, json=payload, headers=headers)
-        return response
+        with self._client._stream("POST", path, json=payload, timer=timer) as response:
+            for event in iter_events(timer.body(response.iter_bytes())):
+                if not event.data.strip():
+                    continue
+                if event.event == "output_text.delta":
+                    timer.token()
+                yield {"type": event.event, "data": event.json(self._client._codec.loads)}
 
     def get_events(
         self,
@@ -151,6 +155,77 @@ class SessionsModule:
         Returns:
             Dict with 'data' list and 'pagination'
         """
+        path = self._events_path(session_id, page, limit, turn_number)
+        data = self._client._request("GET", path)
+        return self._parse_events(data)
+
+    def approve(self, session_id: str, params: ApproveRejectParams) -> httpx.Response:
+        """
+        Approve a pending action in a session. Returns raw HTTP response for streaming.
+
+        Args:
+            session_id: The session ID
+            params: Approve parameters
+
+        Returns:
+            httpx.Response object
+        """
+        payload = self._action_payload(params)
+        return self._client._get_http_client().request(
+            "POST",
+            f"{self._client._base_url}/v1/sessions/{session_id}/approve",
+            json=payload,
+            headers=self._client._headers(),
+        )
+
+    def reject(self, session_id: str, params: ApproveRejectParams) -> Dict[str, Any]:
+        """
+        Reject a pending action in a session.
+
+        Args:
+            session_id: The session ID
+            params: Reject parameters
+
+        Returns:
+            Response with id, action_id, resolution, status
+        """
+        payload = self._action_payload(params)
+        return self._client._request("POST", f"/v1/sessions/{session_id}/reject", json=payload)
+
+    @staticmethod
+    def _create_payload(params: Optional[CreateSessionParams]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
+        if params is not None:
+            if params.agent_id is not None:
+                payload["agent_id"] = params.agent_id
+            if params.metadata is not None:
+                payload["metadata"] = params.metadata
+        return payload
+
+    @staticmethod
+    def _list_path(params: Optional[SessionListParams]) -> str:
+        path = "/v1/sessions"
+        if params is not None:
+            query = []
+            if params.page is not None:
+                query.append(f"page={params.page}")
+            if params.limit is not None:
+                query.append(f"limit={params.limit}")
+            if params.status is not None:
+                query.append(f"status={params.status}")
+            if params.agent_id is not None:
+                query.append(f"agent_id={params.agent_id}")
+            if query:
+                path += "?" + "&".join(query)
+        return path
+
+    @staticmethod
+    def _events_path(
+        session_id: str,
+        page: Optional[int],
+        limit: Optional[int],
+        turn_number: Optional[int],
+    ) -> str:
         path = f"/v1/sessions/{session_id}/events"
         query = []
         if page is not None:
@@ -161,17 +236,29 @@ class SessionsModule:
             query.append(f"turn_number={turn_number}")
         if query:
             path += "?" + "&".join(query)
+        return path
+
+    @staticmethod
+    def _parse_pagination(data: Dict[str, Any]) -> Optional[Pagination]:
+        if "pagination" not in data:
+            return None
+        p = data["pagination"]
+        return Pagination(
+            page=p.get("page", 0),
+            limit=p.get("limit", 0),
+            total=p.get("total", 0),
+            total_pages=p.get("total_pages", 0),
+        )
 
-        data = self._client._request("GET", path)
-        pagination = None
-        if "pagination" in data:
-            p = data["pagination"]
-            pagination = Pagination(
-                page=p.get("page", 0),
-                limit=p.get("limit", 0),
-                total=p.get("total", 0),
-                total_pages=p.get("total_pages", 0),
-            )
+    @staticmethod
+    def _parse_list(data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "data": [SessionsModule._parse_session(s) for s in data.get("data", [])],
+            "pagination": SessionsModule._parse_pagination(data),
+        }
+
+    @staticmethod
+    def _parse_events(data: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "data": [
                 SessionEvent(
@@ -185,51 +272,18 @@ class SessionsModule:
                 )
                 for e in data.get("data", [])
             ],
-            "pagination": pagination,
+            "pagination": SessionsModule._parse_pagination(data),
         }
 
-    def approve(self, session_id: str, params: ApproveRejectParams) -> httpx.Response:
-        """
-        Approve a pending action in a session. Returns raw HTTP response for streaming.
-
-        Args:
-            session_id: The session ID
-            params: Approve parameters
-
-        Returns:
-            httpx.Response object
-        """
-        url = f"{self._client._base_url}/v1/sessions/{session_id}/approve"
-        headers = {
-            "Content-Type": "application/json",
-            "CENCORI_API_KEY": self._client._api_key,
-        }
-        payload: Dict[str, Any] = {"action_id": params.action_id}
-        if params.tool_results is not None:
-            payload["tool_results"] = params.tool_results
-
-        client = httpx.Client(timeout=self._client._timeout)
-        response = client.request("POST", url, json=payload, headers=headers)
-        return response
-
-    def reject(self, session_id: str, params: ApproveRejectParams) -> Dict[str, Any]:
-        """
-        Reject a pending action in a session.
-
-        Args:
-            session_id: The session ID
-            params: Reject parameters
-
-        Returns:
-            Response with id, action_id, resolution, status
-        """
+    @staticmethod
+    def _action_payload(params: ApproveRejectParams) -> Dict[str, Any]:
         payload: Dict[str, Any] = {"action_id": params.action_id}
         if params.tool_results is not None:
             payload["tool_results"] = params.tool_results
+        return payload
 
-        return self._client._request("POST", f"/v1/sessions/{session_id}/reject", json=payload)
-
-    def _parse_session(self, data: Dict[str, Any]) -> Session:
+    @staticmethod
+    def _parse_session(data: Dict[str, Any]) -> Session:
         return Session(
             id=data.get("id", ""),
             status=data.get("status", ""),
@@ -241,7 +295,8 @@ class SessionsModule:
             total_cost=data.get("total_cost", 0.0),
         )
 
-    def _turn_params_to_dict(self, params: TurnParams) -> Dict[str, Any]:
+    @staticmethod
+    def _turn_params_to_dict(params: TurnParams) -> Dict[str, Any]:
         payload: Dict[str, Any] = {"input": params.input}
         if params.tools is not None:
             payload["tools"] = params.tools
@@ -264,3 +319,95 @@ class SessionsModule:
         if params.pause_on_tool_calls is not None:
             payload["pause_on_tool_calls"] = params.pause_on_tool_calls
         return payload
+
+
+class AsyncSessionsModule:
+    """
+    Sessions module for :class:`~cencori.AsyncCencori`.
+
+    Same methods as :class:`SessionsModule`; each one is a coroutine except
+    ``stream_turn``, which returns an async iterator. ``submit_turn`` and
+    ``approve`` return the ``httpx.Response`` from the async pool.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+
+    async def create(self, params: Optional[CreateSessionParams] = None) -> Session:
+        """Create a new session."""
+        payload = SessionsModule._create_payload(params)
+        data = await self._client._async_request("POST", "/v1/sessions", json=payload or None)
+        return SessionsModule._parse_session(data)
+
+    async def list(self, params: Optional[SessionListParams] = None) -> Dict[str, Any]:
+        """List sessions with optional filtering."""
+        data = await self._client._async_request("GET", SessionsModule._list_path(params))
+        return SessionsModule._parse_list(data)
+
+    async def get(self, session_id: str) -> Session:
+        """Get a session by ID."""
+        data = await self._client._async_request("GET", f"/v1/sessions/{session_id}")
+        return SessionsModule._parse_session(data)
+
+    async def delete(self, session_id: str) -> Dict[str, Any]:
+        """Delete a session by ID."""
+        return await self._client._async_request("DELETE", f"/v1/sessions/{session_id}")
+
+    async def submit_turn(self, session_id: str, params: TurnParams) -> httpx.Response:
+        """Submit a turn in a session and return the raw HTTP response."""
+        client = self._client._get_async_http_client()
+        return await client.request(
+            "POST",
+            f"{self._client._base_url}/v1/sessions/{session_id}/turns",
+            json=SessionsModule._turn_params_to_dict(params),
+            headers=self._client._headers(),
+        )
+
+    def stream_turn(self, session_id: str, params: TurnParams) -> AsyncTimedStream[Dict[str, Any]]:
+        """Submit a turn and stream its events; see :meth:`SessionsModule.stream_turn`."""
+        path = f"/v1/sessions/{session_id}/turns"
+        timer = StreamTimer(params.model or "", path, self._client.stream_stats)
+        return AsyncTimedStream(self._turn_events(path, params, timer), timer)
+
+    async def _turn_events(
+        self, path: str, params: TurnParams, timer: StreamTimer
+    ) -> AsyncIterator[Dict[str, Any]]:
+        timer.start()
+        payload = SessionsModule._turn_params_to_dict(params)
+        async with self._client._async_stream("POST", path, json=payload, timer=timer) as response:
+            async for event in aiter_events(timer.abody(response.aiter_bytes())):
+                if not event.data.strip():
+                    continue
+                if event.event == "output_text.delta":
+                    timer.token()
+                yield {"type": event.event, "data": event.json(self._client._codec.loads)}
+
+    async def get_events(
+        self,
+        session_id: str,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        turn_number: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get events for a session."""
+        path = SessionsModule._events_path(session_id, page, limit, turn_number)
+        data = await self._client._async_request("GET", path)
+        return SessionsModule._parse_events(data)
+
+    async def approve(self, session_id: str, params: ApproveRejectParams) -> httpx.Response:
+        """Approve a pending action in a session and return the raw HTTP response."""
+        client = self._client._get_async_http_client()
+        return await client.request(
+            "POST",
+            f"{self._client._base_url}/v1/sessions/{session_id}/approve",
+            json=SessionsModule._action_payload(params),
+            headers=self._client._headers(),
+        )
+
+    async def reject(self, session_id: str, params: ApproveRejectParams) -> Dict[str, Any]:
+        """Reject a pending action in a session."""
+        return await self._client._async_request(
+            "POST",
+            f"/v1/sessions/{session_id}/reject",
+            json=SessionsModule._action_payload(params),
+        )
@@ -0,0 +1,170 @@
+"""
+Incremental server-sent events parser shared by every streaming endpoint.
+
+Works on raw response bytes: lines are split on ``\\r\\n``, ``\\n`` or ``\\r``
+(also across chunk boundaries) before any decoding, ``data`` fields spanning
+several lines are joined with ``\\n``, and ``event`` / ``id`` / ``retry`` are
+handled as in the WHATWG EventSource specification. An event whose data is
+empty carries nothing to decode and is not dispatched.
+"""
+
+import json
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from .errors import StreamDecodeError
+
+DONE = "[DONE]"
+
+_BOM = b"\xef\xbb\xbf"
+
+
+class ServerSentEvent(NamedTuple):
+    """One dispatched event."""
+
+    data: str
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+    def json(self, loads: Callable[[str], Any] = json.loads) -> Any:
+        """Decode ``data`` with ``loads``, raising :class:`StreamDecodeError` if malformed."""
+        try:
+            return loads(self.data)
+        except ValueError:
+            raise StreamDecodeError(
+                f"Malformed JSON in {self.event!r} stream event", data=self.data
+            ) from None
+
+
+# Builds a ServerSentEvent without the generated __new__'s keyword handling,
+# which costs more than the rest of the per-event work on the fast path.
+_new_event = tuple.__new__
+
+
+class SSEDecoder:
+    """
+    Push parser: feed response chunks, get back the events they complete.
+
+    Example:
+        >>> decoder = SSEDecoder()
+        >>> decoder.feed(b'data: {"a"')
+        []
+        >>> decoder.feed(b': 1}\\n\\n')
+        [ServerSentEvent(data='{"a": 1}', event='message', id=None, retry=None)]
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._skip_lf = False  # previous chunk ended on the "\r" of a possible "\r\n"
+        self._started = False
+        self._data: List[str] = []
+        self._event = ""
+        self._last_id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """Parse ``chunk`` and return the events it completes, in order."""
+        if self._skip_lf:
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        buffer = self._buffer + chunk if self._buffer else chunk
+        if not self._started:
+            if _BOM.startswith(buffer):  # too short to tell yet
+                self._buffer = buffer
+                return []
+            self._started = True
+            if buffer.startswith(_BOM):
+                buffer = buffer[3:]
+        if not buffer:
+            return []
+        if b"\r" in buffer or self._data or self._event:
+            return self._feed_lines(buffer)
+
+        # Fast path for "\n"-only streams: cut at the last event boundary,
+        # decode every complete event at once and keep the unfinished one as
+        # raw bytes, so nothing is left half-parsed between chunks.
+        end = buffer.rfind(b"\n\n")
+        if end < 0:
+            self._buffer = buffer
+            return []
+        self._buffer = buffer[end + 2 :]
+        events: List[ServerSentEvent] = []
+        last_id, retry = self._last_id, self._retry
+        for block in buffer[:end].decode("utf-8", "replace").split("\n\n"):
+            if block[:6] == "data: " and "\n" not in block:
+                if len(block) > 6:
+                    events.append(
+                        _new_event(ServerSentEvent, (block[6:], "message", last_id, retry))
+                    )
+            else:
+                for line in block.split("\n"):
+                    self._line(line, events)
+                self._line("", events)
+                last_id, retry = self._last_id, self._retry
+        return events
+
+    def _feed_lines(self, buffer: bytes) -> List[ServerSentEvent]:
+        lines = buffer.splitlines()
+        last = buffer[-1:]
+        if last == b"\n" or last == b"\r":
+            self._buffer = b""
+            self._skip_lf = last == b"\r"
+        else:
+            self._buffer = lines.pop()  # incomplete final line
+        events: List[ServerSentEvent] = []
+        for line in lines:
+            self._line(line.decode("utf-8", "replace"), events)
+        return events
+
+    def _line(self, line: str, events: List[ServerSentEvent]) -> None:
+        if not line:
+            if self._data and self._data != [""]:
+                events.append(
+                    ServerSentEvent(
+                        "\n".join(self._data), self._event or "message", self._last_id, self._retry
+                    )
+                )
+            self._data = []
+            self._event = ""
+            return
+        if line[0] == ":":  # comment
+            return
+        name, _, value = line.partition(":")
+        if value[:1] == " ":
+            value = value[1:]
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value
+        elif name == "id":
+            if "\0" not in value:
+                self._last_id = value
+        elif name == "retry":
+            if value.isascii() and value.isdigit():
+                self._retry = int(value)
+
+
+def iter_events(chunks: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+    """Events from an iterable of raw byte chunks (e.g. ``response.iter_bytes()``)."""
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+
+
+async def aiter_events(chunks: AsyncIterable[bytes]) -> AsyncIterator[ServerSentEvent]:
+    """Events from an async iterable of raw byte chunks."""
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
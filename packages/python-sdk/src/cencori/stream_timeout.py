@@ -0,0 +1,184 @@
+"""Idle-gap and total-deadline limits for long-lived streams."""
+
+import asyncio
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, Optional
+
+import httpx
+
+from .errors import StreamStalledError
+
+
+@dataclass
+class StreamTimeout:
+    """
+    How long a stream may stay silent, and how long it may run in total.
+
+    ``idle`` bounds the wait for the response headers and every gap between
+    body chunks (server heartbeats count as activity), so a stalled provider
+    frees the caller quickly while a long, steadily streaming answer keeps
+    going. ``total`` is an optional deadline for the whole stream: once less
+    than ``idle`` is left, each read waits only until the deadline. Either
+    limit raises :class:`StreamStalledError`; a stall before the first byte
+    is retried like any other timeout.
+
+    Args:
+        idle: Longest gap without any bytes, in seconds (None: no limit)
+        total: Deadline for the whole stream, in seconds (None: no limit)
+
+    Example:
+        >>> from cencori import Cencori, StreamTimeout
+        >>> cencori = Cencori(stream_timeout=StreamTimeout(idle=15, total=600))
+    """
+
+    idle: Optional[float] = 60.0
+    total: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        for name in ("idle", "total"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+
+    def httpx_timeout(self, connect: float) -> httpx.Timeout:
+        """Request timeouts: ``connect`` for connecting, the tighter limit for reads."""
+        limits = [t for t in (self.idle, self.total) if t is not None]
+        return httpx.Timeout(connect, read=min(limits) if limits else None)
+
+    def deadline(self) -> Optional[float]:
+        """Monotonic time at which a stream starting now must finish."""
+        return None if self.total is None else time.monotonic() + self.total
+
+    def read_budget(self, deadline: Optional[float]) -> Optional[float]:
+        """
+        Seconds until ``deadline`` when that is sooner than the idle limit.
+
+        Reads already time out after ``idle``; past this point the deadline is
+        the tighter bound on the next read. None while ``idle`` still is.
+        """
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        return remaining if self.idle is None or remaining < self.idle else None
+
+    def stalled(self, endpoint: str, read_timed_out: bool = False) -> StreamStalledError:
+        """The error for a read that timed out, or for an expired deadline."""
+        if (
+            read_timed_out
+            and self.idle is not None
+            and (self.total is None or self.idle <= self.total)
+        ):
+            message = f"Stream from {endpoint} sent nothing for {self.idle:g}s"
+            return StreamStalledError(message, reason="idle", timeout=self.idle, endpoint=endpoint)
+        message = f"Stream from {endpoint} ran past its {self.total:g}s deadline"
+        return StreamStalledError(message, reason="deadline", timeout=self.total, endpoint=endpoint)
+
+
+class WatchedStream(httpx.SyncByteStream):
+    """
+    Response body that enforces a :class:`StreamTimeout` while it is read.
+
+    A blocking read's timeout is fixed when the body starts, so near the
+    deadline a watchdog shuts the connection's socket down instead, which
+    ends the pending read. Transports without a socket (e.g. HTTP/2, which
+    shares one between streams) fall back to checking between chunks.
+    """
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream,
+        timeout: StreamTimeout,
+        endpoint: str,
+        deadline: Optional[float],
+        network_stream: Any = None,
+    ) -> None:
+        self._stream = stream
+        self._timeout = timeout
+        self._endpoint = endpoint
+        self._deadline = deadline
+        self._socket: Optional[socket.socket] = (
+            network_stream.get_extra_info("socket") if network_stream is not None else None
+        )
+        self._watchdog: Optional[threading.Timer] = None
+        self._expired = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            self._watch()
+            for chunk in self._stream:
+                self._watch()
+                yield chunk
+        except httpx.ReadTimeout as exc:
+            raise self._timeout.stalled(self._endpoint, read_timed_out=not self._expired) from exc
+        except httpx.TransportError as exc:
+            if self._expired:
+                raise self._timeout.stalled(self._endpoint) from exc
+            raise
+        finally:
+            if self._watchdog is not None:
+                self._watchdog.cancel()
+
+    def _watch(self) -> None:
+        """Raise past the deadline; arm the watchdog once it is nearer than ``idle``."""
+        budget = self._timeout.read_budget(self._deadline)
+        if budget is None:
+            return
+        if budget <= 0:
+            self._expired = True
+            raise self._timeout.stalled(self._endpoint)
+        if self._watchdog is None and self._socket is not None:
+            self._watchdog = threading.Timer(budget, self._expire)
+            self._watchdog.daemon = True
+            self._watchdog.start()
+
+    def _expire(self) -> None:
+        self._expired = True
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)  # type: ignore[union-attr]
+        except OSError:
+            pass  # already closed
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class AsyncWatchedStream(httpx.AsyncByteStream):
+    """Async form of :class:`WatchedStream`."""
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        timeout: StreamTimeout,
+        endpoint: str,
+        deadline: Optional[float],
+    ) -> None:
+        self._stream = stream
+        self._timeout = timeout
+        self._endpoint = endpoint
+        self._deadline = deadline
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        chunks = self._stream.__aiter__()
+        try:
+            while True:
+                budget = self._timeout.read_budget(self._deadline)
+                if budget is None:
+                    chunk = await chunks.__anext__()
+                elif budget <= 0:
+                    raise self._timeout.stalled(self._endpoint)
+                else:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), budget)
+                    except asyncio.TimeoutError as exc:
+                        raise self._timeout.stalled(self._endpoint) from exc
+                yield chunk
+        except StopAsyncIteration:
+            return
+        except httpx.ReadTimeout as exc:
+            raise self._timeout.stalled(self._endpoint, read_timed_out=True) from exc
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
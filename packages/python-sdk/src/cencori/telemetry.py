@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Optional
 from .types import WebTelemetryPayload
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient, Cencori
 
 
 class TelemetryModule:
@@ -33,3 +33,21 @@ class TelemetryModule:
             self._client._request("POST", "/api/v1/telemetry/web", json=payload.__dict__)
         except Exception:
             pass
+
+
+class AsyncTelemetryModule:
+    """
+    Telemetry module for :class:`~cencori.AsyncCencori`. Never throws.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+
+    async def report_web_request(self, payload: WebTelemetryPayload) -> None:
+        """Report a web request to the Cencori dashboard; errors are swallowed."""
+        try:
+            await self._client._async_request(
+                "POST", "/api/v1/telemetry/web", json=payload.__dict__
+            )
+        except Exception:
+            pass
@@ -0,0 +1,231 @@
+"""Latency instrumentation for streaming calls."""
+
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+from .types import StreamStatsSummary, StreamTiming
+
+T = TypeVar("T")
+
+DEFAULT_STATS_WINDOW = 256
+
+
+class StreamTimer:
+    """
+    Records the phases of one stream on the monotonic ``time.perf_counter``.
+
+    Offsets are measured from :meth:`start`, which the streaming method calls
+    once local pacing is done and the request is about to go out, so retries
+    count toward every phase.
+    """
+
+    def __init__(self, model: str, endpoint: str, stats: Optional["StreamStats"] = None) -> None:
+        self.timing = StreamTiming(model=model, endpoint=endpoint)
+        self._stats = stats
+        self._started: Optional[float] = None
+        self._last_token: Optional[float] = None
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - cast(float, self._started)
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpx ``trace`` extension: the connection is ready once request headers go out."""
+        if name.endswith("send_request_headers.started") and self.timing.connect_s is None:
+            self.timing.connect_s = self._elapsed()
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        """Async form of :meth:`trace`."""
+        self.trace(name, info)
+
+    def headers(self) -> None:
+        """Response headers arrived."""
+        self.timing.headers_s = self._elapsed()
+
+    def body(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Pass body chunks through, noting when the first one arrives."""
+        for chunk in chunks:
+            if self.timing.ttfb_s is None:
+                self.timing.ttfb_s = self._elapsed()
+            yield chunk
+
+    async def abody(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Async form of :meth:`body`."""
+        async for chunk in chunks:
+            if self.timing.ttfb_s is None:
+                self.timing.ttfb_s = self._elapsed()
+            yield chunk
+
+    def token(self) -> None:
+        """A content delta arrived."""
+        now = time.perf_counter()
+        if self._last_token is None:
+            self.timing.ttft_s = now - cast(float, self._started)
+        else:
+            self.timing.token_gaps_s.append(now - self._last_token)
+        self._last_token = now
+        self.timing.tokens += 1
+
+    def finish(self, completed: bool) -> None:
+        """
+        Close the timing; only the first call counts.
+
+        Completed streams are added to the per-model stats; failed or
+        abandoned ones keep their timing but are left out.
+        """
+        if self._started is None or self.timing.total_s is not None:
+            return
+        self.timing.total_s = self._elapsed()
+        if completed and self._stats is not None:
+            self._stats.record(self.timing)
+
+
+class TimedStream(Iterator[T]):
+    """
+    Iterator returned by the streaming methods.
+
+    Iterates exactly like the underlying generator; ``timing`` fills in as
+    the stream progresses and is complete once iteration ends.
+
+    Example:
+        >>> stream = cencori.ai.chat_stream(messages=[...])
+        >>> for chunk in stream:
+        ...     print(chunk.delta, end="")
+        >>> stream.timing.ttft_s, stream.timing.tokens_per_s
+    """
+
+    def __init__(self, chunks: Iterator[T], timer: StreamTimer) -> None:
+        self._chunks = chunks
+        self._timer = timer
+        self.timing = timer.timing
+
+    @property
+    def timer(self) -> StreamTimer:
+        """The timer recording this stream, to carry over when it is wrapped."""
+        return self._timer
+
+    def __iter__(self) -> "TimedStream[T]":
+        return self
+
+    def __next__(self) -> T:
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            self._timer.finish(True)
+            raise
+        except BaseException:
+            self._timer.finish(False)
+            raise
+
+    def close(self) -> None:
+        """Stop the stream early and close the upstream response."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+        self._timer.finish(False)
+
+
+class AsyncTimedStream(AsyncIterator[T]):
+    """Async form of :class:`TimedStream`."""
+
+    def __init__(self, chunks: AsyncIterator[T], timer: StreamTimer) -> None:
+        self._chunks = chunks
+        self._timer = timer
+        self.timing = timer.timing
+
+    @property
+    def timer(self) -> StreamTimer:
+        """The timer recording this stream, to carry over when it is wrapped."""
+        return self._timer
+
+    def __aiter__(self) -> "AsyncTimedStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._timer.finish(True)
+            raise
+        except BaseException:
+            self._timer.finish(False)
+            raise
+
+    async def aclose(self) -> None:
+        """Stop the stream early and close the upstream response."""
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        self._timer.finish(False)
+
+
+class StreamStats:
+    """
+    Per-model rolling latency statistics over completed streams.
+
+    Keeps the last ``window`` streams per model. Available as
+    ``cencori.stream_stats``.
+
+    Example:
+        >>> summary = cencori.stream_stats.summary("gpt-4o")
+        >>> summary.ttft_p95_s, summary.tokens_per_s
+    """
+
+    def __init__(self, window: int = DEFAULT_STATS_WINDOW) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self._timings: Dict[str, Deque[StreamTiming]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def record(self, timing: StreamTiming) -> None:
+        """Add one completed stream."""
+        with self._lock:
+            recent = self._timings.get(timing.model)
+            if recent is None:
+                recent = self._timings[timing.model] = deque(maxlen=self.window)
+            recent.append(timing)
+            self._counts[timing.model] = self._counts.get(timing.model, 0) + 1
+
+    def models(self) -> List[str]:
+        """Models with at least one recorded stream."""
+        with self._lock:
+            return list(self._timings)
+
+    def summary(self, model: str) -> Optional[StreamStatsSummary]:
+        """Percentiles over the model's recent streams, or None if there are none."""
+        with self._lock:
+            recent = list(self._timings.get(model, ()))
+            total = self._counts.get(model, 0)
+        if not recent:
+            return None
+        ttfts = sorted(t.ttft_s for t in recent if t.ttft_s is not None)
+        rates = sorted(r for r in (t.tokens_per_s for t in recent) if r is not None)
+        gaps = sorted(gap for t in recent for gap in t.token_gaps_s)
+        return StreamStatsSummary(
+            model=model,
+            streams=total,
+            ttft_p50_s=_percentile(ttfts, 0.50),
+            ttft_p95_s=_percentile(ttfts, 0.95),
+            tokens_per_s=_percentile(rates, 0.50),
+            token_gap_p95_s=_percentile(gaps, 0.95),
+        )
+
+
+def _percentile(ordered: List[float], q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
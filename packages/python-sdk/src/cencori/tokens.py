@@ -0,0 +1,270 @@
+"""Local token estimates and fitting chat history into a model's context window."""
+
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from .errors import ContextWindowError
+
+
+@dataclass(frozen=True)
+class TokenProfile:
+    """
+    How one model family tokenizes text, approximately, and its context window.
+
+    Args:
+        chars_per_token: ASCII characters per token for typical English and code
+        non_ascii_tokens: Tokens per non-ASCII character (CJK is close to one
+            each; accented Latin text is cheaper, so this errs high)
+        message_tokens: Per-message overhead of the chat template
+        image_tokens: Flat cost of one image part
+        context_window: Prompt plus output tokens the model accepts (None
+            if unknown)
+    """
+
+    chars_per_token: float = 4.0
+    non_ascii_tokens: float = 1.0
+    message_tokens: int = 4
+    image_tokens: int = 1000
+    context_window: Optional[int] = None
+
+
+DEFAULT_PROFILE = TokenProfile()
+
+# First matching prefix wins, so specific names come before their family.
+MODEL_PROFILES: List[Tuple[str, TokenProfile]] = [
+    ("gpt-4.1", TokenProfile(4.0, 1.0, 3, 765, 1_047_576)),
+    ("gpt-4o", TokenProfile(4.0, 1.0, 3, 765, 128_000)),
+    ("gpt-4-turbo", TokenProfile(3.8, 1.2, 3, 765, 128_000)),
+    ("gpt-4", TokenProfile(3.8, 1.2, 3, 765, 8_192)),
+    ("gpt-3.5", TokenProfile(3.8, 1.2, 4, 765, 16_385)),
+    ("o1", TokenProfile(4.0, 1.0, 3, 765, 200_000)),
+    ("o3", TokenProfile(4.0, 1.0, 3, 765, 200_000)),
+    ("o4", TokenProfile(4.0, 1.0, 3, 765, 200_000)),
+    ("claude", TokenProfile(3.5, 1.3, 5, 1600, 200_000)),
+    ("gemini-1.5-pro", TokenProfile(4.0, 1.0, 4, 258, 2_097_152)),
+    ("gemini", TokenProfile(4.0, 1.0, 4, 258, 1_048_576)),
+    ("mistral", TokenProfile(3.5, 1.3, 4, 1000, 32_000)),
+    ("llama", TokenProfile(3.8, 1.2, 4, 1000, 128_000)),
+    ("deepseek", TokenProfile(3.6, 0.7, 4, 1000, 64_000)),
+]
+
+
+def profile_for(model: str) -> TokenProfile:
+    """The profile of ``model``'s family (provider prefixes like ``openai/`` are ignored)."""
+    name = model.rsplit("/", 1)[-1].lower()
+    for prefix, profile in MODEL_PROFILES:
+        if name.startswith(prefix):
+            return profile
+    return DEFAULT_PROFILE
+
+
+def estimate_text_tokens(text: str, model: str = "") -> int:
+    """Approximate token count of ``text`` for ``model``."""
+    return math.ceil(_text_tokens(text, profile_for(model)))
+
+
+def estimate_message_tokens(
+    messages: Sequence[Any], model: str = "", tools: Optional[List[Any]] = None
+) -> int:
+    """
+    Approximate prompt tokens of a chat request.
+
+    Counts text content, tool calls and tool definitions with ``model``'s
+    profile, plus the per-message overhead and a flat cost per image. Runs
+    in a few microseconds per message, so it is cheap enough to call before
+    every request; expect it to be within roughly 10-20% of the provider's
+    count for prose.
+    """
+    profile = profile_for(model)
+    total = sum(_message_tokens(message, profile) for message in messages)
+    if tools:
+        total += _text_tokens(json.dumps(tools, default=vars), profile)
+    return math.ceil(total)
+
+
+class ContextFitter:
+    """
+    Trims the oldest turns so a chat or RAG payload fits the model's window.
+
+    The estimate of the messages (and tool definitions) plus the output
+    budget (``max_tokens``, or ``reserve`` when the call sets none) must fit
+    in the window less a ``margin`` fraction, which absorbs estimate error.
+    System and developer messages and the last turn are always kept; older
+    turns are dropped whole, oldest first, so a tool call is never separated
+    from its result. With ``summarize``, ``summary_tokens`` are kept free
+    when choosing which turns to drop; the dropped turns are then passed to
+    it once and the returned text is kept in their place as one system
+    message, or left out if it is larger than the room that is left.
+
+    If even the kept messages don't fit, :class:`ContextWindowError` is raised
+    before anything is sent. Models with no known window are sent as is.
+    Retrieved memory added by the RAG endpoint is not counted; leave room
+    for it with ``margin``.
+
+    Args:
+        reserve: Output tokens to leave room for when ``max_tokens`` is unset
+        margin: Fraction of the window kept free
+        summarize: Called as ``summarize(dropped_messages)``; returns the text
+            that replaces them. Runs synchronously, also on
+            :class:`AsyncCencori`
+        summary_tokens: Room to leave for the summary when trimming
+        windows: Context windows by model name or prefix, overriding the
+            built-in table (e.g. ``{"my-finetune": 16_000}``)
+
+    Example:
+        >>> from cencori import Cencori, ContextFitter
+        >>> cencori = Cencori(context_fitter=ContextFitter(reserve=2048))
+    """
+
+    def __init__(
+        self,
+        reserve: int = 1024,
+        margin: float = 0.05,
+        summarize: Optional[Callable[[List[Dict[str, Any]]], str]] = None,
+        windows: Optional[Dict[str, int]] = None,
+        summary_tokens: int = 256,
+    ) -> None:
+        if not 0 <= margin < 1:
+            raise ValueError("margin must be in [0, 1)")
+        self.reserve = reserve
+        self.margin = margin
+        self.summarize = summarize
+        self.summary_tokens = summary_tokens
+        self.windows = dict(windows or {})
+
+    def window(self, model: str) -> Optional[int]:
+        """Context window of ``model``, or None if unknown."""
+        name = model.rsplit("/", 1)[-1]
+        for prefix in sorted(self.windows, key=len, reverse=True):
+            if model.startswith(prefix) or name.startswith(prefix):
+                return self.windows[prefix]
+        return profile_for(model).context_window
+
+    def fit(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return ``messages`` (the same list if nothing had to go) trimmed to fit.
+
+        Raises:
+            ContextWindowError: If the system messages and the last turn alone
+                are too large
+        """
+        window = self.window(model)
+        if window is None:
+            return messages
+        profile = profile_for(model)
+        budget = int(window * (1 - self.margin)) - (max_tokens or self.reserve)
+        if tools:
+            budget -= math.ceil(_text_tokens(json.dumps(tools, default=vars), profile))
+        costs = [_message_tokens(message, profile) for message in messages]
+        if sum(costs) <= budget:
+            return messages
+
+        pinned = [i for i, message in enumerate(messages) if _role(message) in _PINNED_ROLES]
+        turns = _turns(messages, set(pinned))
+        fixed = sum(costs[i] for i in pinned)
+        kept = sum(costs[i] for turn in turns for i in turn)
+        room = budget - (self.summary_tokens if self.summarize is not None else 0)
+        dropped: List[int] = []
+        while fixed + kept > room and len(turns) > 1:
+            kept -= self._drop(turns, dropped, costs)
+
+        summary: Optional[Dict[str, Any]] = None
+        if dropped and self.summarize is not None:
+            text = self.summarize([messages[i] for i in dropped])
+            summary = {"role": "system", "content": text}
+            if fixed + kept + _message_tokens(summary, profile) > budget:
+                # Dropping more would lose turns the summary doesn't cover: send without it.
+                summary = None
+
+        needed = math.ceil(fixed + kept)
+        if needed > budget:
+            raise ContextWindowError(
+                f"Prompt needs ~{needed} tokens but {model} leaves room for {max(budget, 0)}",
+                model=model,
+                tokens=needed,
+                limit=max(budget, 0),
+            )
+        return _assemble(messages, set(dropped), summary)
+
+    @staticmethod
+    def _drop(turns: List[List[int]], dropped: List[int], costs: List[float]) -> float:
+        """Move the oldest turn to ``dropped``; returns its cost."""
+        turn = turns.pop(0)
+        dropped.extend(turn)
+        return sum(costs[i] for i in turn)
+
+
+_PINNED_ROLES = ("system", "developer")
+
+
+def _role(message: Any) -> str:
+    if isinstance(message, dict):
+        return str(message.get("role", ""))
+    return str(getattr(message, "role", ""))
+
+
+def _turns(messages: Sequence[Any], pinned: Set[int]) -> List[List[int]]:
+    """Indices of non-pinned messages grouped into turns, each starting at a user message."""
+    turns: List[List[int]] = []
+    for i, message in enumerate(messages):
+        if i in pinned:
+            continue
+        if not turns or _role(message) == "user":
+            turns.append([])
+        turns[-1].append(i)
+    return turns
+
+
+def _assemble(
+    messages: List[Dict[str, Any]], dropped: Set[int], summary: Optional[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    fitted: List[Dict[str, Any]] = []
+    for i, message in enumerate(messages):
+        if i in dropped:
+            continue
+        if summary is not None and _role(message) not in _PINNED_ROLES:
+            # The summary goes after the leading system messages, where the turns were.
+            fitted.append(summary)
+            summary = None
+        fitted.append(message)
+    return fitted
+
+
+def _message_tokens(message: Any, profile: TokenProfile) -> float:
+    if isinstance(message, dict):
+        content = message.get("content")
+        tool_calls = message.get("tool_calls") or message.get("toolCalls")
+    else:
+        content = getattr(message, "content", "")
+        tool_calls = getattr(message, "tool_calls", None)
+    tokens = float(profile.message_tokens)
+    if isinstance(content, str):
+        tokens += _text_tokens(content, profile)
+    elif isinstance(content, list):
+        for part in content:
+            if not isinstance(part, dict):
+                continue
+            if isinstance(part.get("text"), str):
+                tokens += _text_tokens(part["text"], profile)
+            elif part.get("type") in ("image", "image_url", "input_image"):
+                tokens += profile.image_tokens
+    for call in tool_calls or ():
+        tokens += _text_tokens(json.dumps(call, default=vars), profile)
+    return tokens
+
+
+def _text_tokens(text: str, profile: TokenProfile) -> float:
+    if text.isascii():
+        return len(text) / profile.chars_per_token
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (
+        ascii_chars / profile.chars_per_token + (len(text) - ascii_chars) * profile.non_ascii_tokens
+    )
@@ -1,7 +1,14 @@
 """Type definitions for Cencori SDK."""
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+T = TypeVar("T")
 
 
 # ── Chat Types ──
@@ -117,10 +124,99 @@ class StreamChunk:
     finish_reason: Optional[str] = None
     error: Optional[str] = None
     tool_calls: Optional[List[ToolCall]] = None
+    usage: Optional[Usage] = None
+    cost_usd: Optional[float] = None
+
+
+# ── Stream Timing Types ──
+
+
+@dataclass
+class StreamTiming:
+    """
+    Latency breakdown of one stream.
+
+    Offsets are seconds on a monotonic clock from the start of the call.
+    ``tokens`` counts streamed content deltas (one per token for most
+    providers); ``token_gaps_s`` holds the time between consecutive deltas.
+    """
+
+    model: str
+    endpoint: str
+    connect_s: Optional[float] = None
+    headers_s: Optional[float] = None
+    ttfb_s: Optional[float] = None
+    ttft_s: Optional[float] = None
+    total_s: Optional[float] = None
+    tokens: int = 0
+    token_gaps_s: List[float] = field(default_factory=list)
+
+    @property
+    def tokens_per_s(self) -> Optional[float]:
+        """Delivery rate after the first token, or None with fewer than two tokens."""
+        elapsed = sum(self.token_gaps_s)
+        if not self.token_gaps_s or elapsed <= 0:
+            return None
+        return len(self.token_gaps_s) / elapsed
+
+    @property
+    def max_token_gap_s(self) -> Optional[float]:
+        """Longest pause between two deltas."""
+        return max(self.token_gaps_s) if self.token_gaps_s else None
+
+
+@dataclass
+class StreamStatsSummary:
+    """Per-model latency over recent completed streams."""
+
+    model: str
+    streams: int
+    ttft_p50_s: Optional[float] = None
+    ttft_p95_s: Optional[float] = None
+    tokens_per_s: Optional[float] = None
+    token_gap_p95_s: Optional[float] = None
+
+
+# ── Routing Types ──
+
+
+@dataclass
+class ModelScore:
+    """Routing state of one model: smoothed latency, error rate and resulting score."""
+
+    model: str
+    latency_s: Optional[float] = None
+    error_rate: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    healthy: bool = True
+    score: float = 0.0
+
+
+# ── Race Types ──
+
+
+@dataclass
+class RaceResult(Generic[T]):
+    """
+    Outcome of a :meth:`AIModule.chat_race` call.
+
+    ``elapsed_s`` is when the winner crossed the finish line: the complete
+    response, or the first token when streaming. ``margin_s`` is how far
+    behind the runner-up finished, or None when every other model was
+    cancelled or failed first.
+    """
+
+    model: str
+    value: T
+    elapsed_s: float
+    margin_s: Optional[float] = None
+    errors: Dict[str, Exception] = field(default_factory=dict)
 
 
 # ── Completion Types ──
 
+
 @dataclass
 class CompletionRequest:
     """Parameters for text completion."""
@@ -133,6 +229,7 @@ class CompletionRequest:
 
 # ── Embedding Types ──
 
+
 @dataclass
 class EmbeddingRequest:
     """Parameters for embedding generation."""
@@ -148,17 +245,29 @@ class EmbeddingUsage:
     total_tokens: int
 
 
+# A ``compact=True`` result: float32 ``numpy.ndarray`` of shape (n, dimensions),
+# or a flat row-major ``array('f')`` without NumPy.
+CompactVectors = Union["numpy.typing.NDArray[numpy.float32]", "array[float]"]
+
+
 @dataclass
 class EmbeddingResponse:
-    """Response from embedding generation."""
+    """
+    Response from embedding generation.
+
+    ``embeddings`` is a list of float lists, or with ``compact=True`` a
+    :data:`CompactVectors` float32 matrix.
+    """
 
     model: str
-    embeddings: List[List[float]]
+    embeddings: Union[List[List[float]], CompactVectors]
     usage: EmbeddingUsage
+    dimensions: int = 0
 
 
 # ── Generate Object (Structured Output) Types ──
 
+
 @dataclass
 class GenerateObjectRequest:
     """Request for structured output generation."""
@@ -181,8 +290,18 @@ class GenerateObjectResponse:
     usage: Optional[Usage] = None
 
 
+@dataclass
+class GenerateObjectStreamChunk:
+    """A snapshot of the object from streaming structured output generation."""
+
+    object: Optional[Dict[str, Any]] = None
+    done: bool = False
+    usage: Optional[Usage] = None
+
+
 # ── Image Generation Types ──
 
+
 @dataclass
 class ImageGenerationRequest:
     """Request for image generation."""
@@ -216,6 +335,7 @@ class ImageGenerationResponse:
 
 # ── RAG Types ──
 
+
 @dataclass
 class RagRequest:
     """Request for RAG (Retrieval-Augmented Generation)."""
@@ -265,6 +385,7 @@ class RagStreamChunk:
 
 # ── Responses API Types ──
 
+
 @dataclass
 class ResponseInputItem:
     """An input item for the Responses API."""
@@ -363,6 +484,7 @@ class ResponsesResponse:
 
 # ── Agent Types ──
 
+
 @dataclass
 class AgentConfig:
     """Configuration for an AI agent."""
@@ -445,6 +567,7 @@ class AgentKey:
 
 # ── Memory Types ──
 
+
 @dataclass
 class MemoryNamespace:
     """A memory namespace for vector storage."""
@@ -519,6 +642,7 @@ class SearchResult:
 
 # ── Session Types ──
 
+
 @dataclass
 class Session:
     """A durable execution session."""
@@ -623,6 +747,7 @@ class SessionListParams:
 
 # ── Telemetry Types ──
 
+
 @dataclass
 class WebTelemetryPayload:
     """Payload for reporting a web request."""
@@ -643,6 +768,7 @@ class WebTelemetryPayload:
 
 # ── Project Types ──
 
+
 @dataclass
 class Project:
     """A Cencori project."""
@@ -678,6 +804,7 @@ class Stats:
 
 # ── API Key Types ──
 
+
 @dataclass
 class APIKey:
     """A Cencori API key."""
@@ -723,6 +850,7 @@ class KeyUsageStats:
 
 # ── Metrics Types ──
 
+
 @dataclass
 class RequestMetrics:
     total: int
@@ -772,3 +900,32 @@ class MetricsResponse:
     latency: LatencyMetrics
     providers: Dict[str, Breakdown]
     models: Dict[str, Breakdown]
+
+
+# ── Fan-out Types ──
+
+
+@dataclass
+class ItemResult(Generic[T]):
+    """Outcome of one request in a ``*_many`` fan-out call."""
+
+    index: int
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# ── Batch Types ──
+
+
+@dataclass
+class BatchSummary:
+    """Counts from a :meth:`BatchModule.run` call."""
+
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed_s: float = 0.0
@@ -0,0 +1,125 @@
+"""
+Compact float32 embedding matrices decoded straight from response bytes.
+
+A matrix is a ``numpy.ndarray`` of shape ``(rows, dims)`` and dtype float32
+when NumPy is installed (``pip install cencori[numpy]``), otherwise a flat
+row-major ``array('f')`` of ``rows * dims`` floats.
+"""
+
+import json
+import re
+from array import array
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from .errors import CencoriError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without numpy installed
+    np = None
+
+_EMBEDDING_ARRAY = re.compile(rb'"embedding"\s*:\s*\[')
+
+
+def allocate(rows: int, dims: int) -> Any:
+    """Zeroed float32 matrix with ``rows`` rows of ``dims`` floats."""
+    if np is not None:
+        return np.zeros((rows, dims), dtype=np.float32)
+    return array("f", bytes(rows * dims * array("f").itemsize))
+
+
+def row(matrix: Any, dims: int, index: int) -> Any:
+    """View of one row."""
+    if np is not None:
+        return matrix[index]
+    return matrix[index * dims : (index + 1) * dims]
+
+
+def set_row(matrix: Any, dims: int, index: int, values: Any) -> None:
+    """Copy ``values`` (a row or a float sequence) into row ``index``."""
+    if np is not None:
+        matrix[index] = values
+    else:
+        matrix[index * dims : (index + 1) * dims] = (
+            values if isinstance(values, array) else array("f", values)
+        )
+
+
+def row_array(matrix: Any, dims: int, index: int) -> "array[float]":
+    """Copy of one row as ``array('f')`` (e.g. for the embedding cache)."""
+    if np is not None:
+        return array("f", matrix[index].tobytes())
+    result: "array[float]" = matrix[index * dims : (index + 1) * dims]
+    return result
+
+
+def from_vectors(vectors: Sequence[Sequence[float]], dims: int) -> Any:
+    """Matrix holding ``vectors`` in order."""
+    matrix = allocate(len(vectors), dims)
+    for index, vector in enumerate(vectors):
+        set_row(matrix, dims, index, vector)
+    return matrix
+
+
+def concat(matrices: List[Any]) -> Any:
+    """Stack matrices of equal width in order."""
+    if np is not None:
+        return np.concatenate(matrices) if matrices else np.zeros((0, 0), dtype=np.float32)
+    result = array("f")
+    for matrix in matrices:
+        result.extend(matrix)
+    return result
+
+
+def decode_embeddings(
+    body: bytes, loads: Callable[[bytes], Any] = json.loads
+) -> Tuple[Dict[str, Any], Any, int]:
+    """
+    Decode an ``/api/ai/embeddings`` response body.
+
+    Each ``"embedding": [...]`` array is decoded on its own with ``loads``
+    and copied into a float32 row of a preallocated matrix, so no list of
+    every vector is ever held at once. Returns the rest of the document
+    (model, usage, ...) with empty embedding lists, the matrix and its row
+    width.
+    """
+    spans: List[Tuple[int, int]] = []
+    skeleton: List[bytes] = []
+    position = 0
+    for match in _EMBEDDING_ARRAY.finditer(body):
+        start = match.end()
+        end = body.index(b"]", start)
+        skeleton.append(body[position:start])
+        spans.append((start, end))
+        position = end
+    skeleton.append(body[position:])
+    data: Dict[str, Any] = loads(b"".join(skeleton))
+
+    dims = _width(body, spans[0]) if spans else 0
+    matrix = allocate(len(spans), dims)
+    for index, (start, end) in enumerate(spans):
+        _parse_row(matrix, dims, index, body[start:end], loads)
+    return data, matrix, dims
+
+
+def _width(body: bytes, span: Tuple[int, int]) -> int:
+    segment = body[span[0] : span[1]]
+    return segment.count(b",") + 1 if segment.strip() else 0
+
+
+def _parse_row(
+    matrix: Any, dims: int, index: int, segment: bytes, loads: Callable[[bytes], Any]
+) -> None:
+    try:
+        numbers = loads(b"[" + segment + b"]")
+        if np is not None:
+            values = np.array(numbers)
+            if values.ndim != 1 or values.dtype.kind not in "fiu":
+                raise ValueError("expected a flat list of numbers")
+        else:
+            values = array("f", numbers)
+    except (TypeError, ValueError) as exc:
+        raise CencoriError(f"Embedding {index} is not a list of numbers: {exc}") from None
+    if len(values) != dims:
+        raise CencoriError(f"Embedding {index} has {len(values)} dimensions, expected {dims}")
+    set_row(matrix, dims, index, values)
@@ -20,10 +20,13 @@ Example:
     >>> print(ocr["text"])
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from .fanout import DEFAULT_CONCURRENCY, ProgressCallback, async_run_many, run_many
+from .types import ItemResult
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient, Cencori
 
 
 class VisionModule:
@@ -135,6 +138,24 @@ class VisionModule:
             ),
         )
 
+    def analyze_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[ItemResult[Dict[str, Any]]]:
+        """
+        Run many :meth:`analyze` calls with bounded concurrency.
+
+        ``requests`` holds one dict of :meth:`analyze` keyword arguments per call. Results
+        come back as :class:`~cencori.ItemResult` in input order (or as they
+        finish with ``ordered=False``); failures are captured per item.
+        """
+        return run_many(
+            lambda kwargs: self.analyze(**kwargs), requests, concurrency, ordered, on_progress
+        )
+
     # ── async variants ─────────────────────────────────────────
 
     async def a_analyze(self, **kwargs: Any) -> Dict[str, Any]:
@@ -161,6 +182,20 @@ class VisionModule:
             "POST", "/api/ai/vision/classify", json=self._build_body(**kwargs)
         )
 
+    def a_analyze_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[Dict[str, Any]]]:
+        """Async version of :meth:`analyze_many`."""
+
+        async def call(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.a_analyze(**kwargs)
+
+        return async_run_many(call, requests, concurrency, ordered, on_progress)
+
     @staticmethod
     def _build_body(
         image_url: Optional[str] = None,
@@ -196,3 +231,110 @@ class VisionModule:
         if response_format is not None:
             body["response_format"] = response_format
         return body
+
+
+class AsyncVisionModule:
+    """
+    Vision module for :class:`~cencori.AsyncCencori`.
+
+    Same methods as :class:`VisionModule`; each one is a coroutine.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+
+    async def analyze(
+        self,
+        image_url: Optional[str] = None,
+        image_base64: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        images: Optional[List[Dict[str, str]]] = None,
+        prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Analyze an image with a vision-capable model."""
+        return await self._client._async_request(
+            "POST",
+            "/api/ai/vision",
+            json=VisionModule._build_body(
+                image_url=image_url,
+                image_base64=image_base64,
+                mime_type=mime_type,
+                images=images,
+                prompt=prompt,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format=response_format,
+            ),
+        )
+
+    async def describe(
+        self,
+        image_url: Optional[str] = None,
+        image_base64: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Describe an image in rich detail."""
+        return await self._client._async_request(
+            "POST",
+            "/api/ai/vision/describe",
+            json=VisionModule._build_body(
+                image_url=image_url,
+                image_base64=image_base64,
+                mime_type=mime_type,
+                model=model,
+                max_tokens=max_tokens,
+            ),
+        )
+
+    async def ocr(
+        self,
+        image_url: Optional[str] = None,
+        image_base64: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Extract all text visible in an image."""
+        return await self._client._async_request(
+            "POST",
+            "/api/ai/vision/ocr",
+            json=VisionModule._build_body(
+                image_url=image_url, image_base64=image_base64, mime_type=mime_type, model=model
+            ),
+        )
+
+    async def classify(
+        self,
+        image_url: Optional[str] = None,
+        image_base64: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Classify an image and return structured tags + categories."""
+        return await self._client._async_request(
+            "POST",
+            "/api/ai/vision/classify",
+            json=VisionModule._build_body(
+                image_url=image_url, image_base64=image_base64, mime_type=mime_type, model=model
+            ),
+        )
+
+    def analyze_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ItemResult[Dict[str, Any]]]:
+        """Run many :meth:`analyze` calls with bounded concurrency."""
+
+        async def call(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.analyze(**kwargs)
+
+        return async_run_many(call, requests, concurrency, ordered, on_progress)
@@ -20,6 +20,7 @@ Example:
     ...     print(seg["speaker"], seg["text"])
 """
 
+import asyncio
 import os
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
@@ -35,7 +36,7 @@ from .errors import (
 )
 
 if TYPE_CHECKING:
-    from .client import Cencori
+    from .client import BaseClient
 
 # Audio may be a path, raw bytes, or an open binary file object.
 AudioInput = Union[str, bytes, "os.PathLike[str]", Any]
@@ -51,7 +52,7 @@ class VoiceModule:
     (TTS default ``tts-1``; STT default ``whisper-1``).
     """
 
-    def __init__(self, client: "Cencori") -> None:
+    def __init__(self, client: "BaseClient") -> None:
         self._client = client
 
     # ── Text-to-speech ─────────────────────────────────────────
@@ -73,8 +74,11 @@ class VoiceModule:
         result straight to a file, e.g. ``open("out.mp3", "wb").write(audio)``.
         """
         body = _speak_body(input, model, voice, provider, response_format, speed, language)
-        with httpx.Client(timeout=self._timeout) as client:
-            response = client.post(self._url("/api/ai/audio/speech"), json=body, headers=self._headers(json=True))
+        with self._client._permit("/api/ai/audio/speech") as permit:
+            response = self._http.post(
+                self._url("/api/ai/audio/speech"), json=body, headers=self._headers(json=True)
+            )
+            permit.observe(response.status_code)
         return self._audio_bytes(response)
 
     def transcribe(
@@ -99,22 +103,31 @@ class VoiceModule:
         files, data = _transcribe_payload(
             file, model, provider, language, prompt, temperature, diarize, response_format, filename
         )
-        with httpx.Client(timeout=self._timeout) as client:
-            response = client.post(self._url("/api/ai/audio/transcriptions"), files=files, data=data, headers=self._headers())
+        with self._client._permit("/api/ai/audio/transcriptions") as permit:
+            response = self._http.post(
+                self._url("/api/ai/audio/transcriptions"),
+                files=files,
+                data=data,
+                headers=self._headers(),
+            )
+            permit.observe(response.status_code)
         return self._transcript(response, response_format)
 
-    def diarize(self, file: AudioInput, model: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
+    def diarize(
+        self, file: AudioInput, model: Optional[str] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
         """Transcribe with speaker labels. Use a diarization-capable model
         (``nova-3``, ``assemblyai-universal``)."""
         kwargs.pop("diarize", None)
         kwargs.pop("response_format", None)
-        return self.transcribe(file, model=model, diarize=True, response_format="verbose_json", **kwargs)
+        return self.transcribe(
+            file, model=model, diarize=True, response_format="verbose_json", **kwargs
+        )
 
     def list_models(self) -> Dict[str, Any]:
         """Return ``{'tts': [...], 'stt': [...]}`` of available voice models."""
-        with httpx.Client(timeout=self._timeout) as client:
-            tts = client.get(self._url("/api/ai/audio/speech"), headers=self._headers())
-            stt = client.get(self._url("/api/ai/audio/transcriptions"), headers=self._headers())
+        tts = self._http.get(self._url("/api/ai/audio/speech"), headers=self._headers())
+        stt = self._http.get(self._url("/api/ai/audio/transcriptions"), headers=self._headers())
         return {
             "tts": tts.json().get("models", []) if tts.is_success else [],
             "stt": stt.json().get("models", []) if stt.is_success else [],
@@ -125,22 +138,35 @@ class VoiceModule:
     async def a_speak(self, input: str, **kwargs: Any) -> bytes:
         """Async version of :meth:`speak`."""
         body = _speak_body(input, **kwargs)
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(self._url("/api/ai/audio/speech"), json=body, headers=self._headers(json=True))
+        client = self._client._get_async_http_client()
+        async with self._client._permit("/api/ai/audio/speech") as permit:
+            response = await client.post(
+                self._url("/api/ai/audio/speech"), json=body, headers=self._headers(json=True)
+            )
+            permit.observe(response.status_code)
         return self._audio_bytes(response)
 
-    async def a_transcribe(self, file: AudioInput, response_format: str = "json", **kwargs: Any) -> Dict[str, Any]:
+    async def a_transcribe(
+        self, file: AudioInput, response_format: str = "json", **kwargs: Any
+    ) -> Dict[str, Any]:
         """Async version of :meth:`transcribe`."""
         files, data = _transcribe_payload(file, response_format=response_format, **kwargs)
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(self._url("/api/ai/audio/transcriptions"), files=files, data=data, headers=self._headers())
+        client = self._client._get_async_http_client()
+        async with self._client._permit("/api/ai/audio/transcriptions") as permit:
+            response = await client.post(
+                self._url("/api/ai/audio/transcriptions"),
+                files=files,
+                data=data,
+                headers=self._headers(),
+            )
+            permit.observe(response.status_code)
         return self._transcript(response, response_format)
 
     # ── internals ──────────────────────────────────────────────
 
     @property
-    def _timeout(self) -> Any:
-        return self._client._timeout
+    def _http(self) -> httpx.Client:
+        return self._client._get_http_client()
 
     def _url(self, path: str) -> str:
         return f"{self._client.get_base_url()}{path}"
@@ -179,8 +205,95 @@ class VoiceModule:
         except Exception:
             data = {}
         if code == 400 and "reasons" in data:
-            raise SafetyError(message=data.get("error", "Content safety violation"), reasons=data.get("reasons", []))
-        raise CencoriError(message=data.get("message") or data.get("error", "Request failed"), status_code=code)
+            raise SafetyError(
+                message=data.get("error", "Content safety violation"),
+                reasons=data.get("reasons", []),
+            )
+        raise CencoriError(
+            message=data.get("message") or data.get("error", "Request failed"), status_code=code
+        )
+
+
+class AsyncVoiceModule:
+    """
+    Voice module for :class:`~cencori.AsyncCencori`.
+
+    Same methods as :class:`VoiceModule`; each one is a coroutine.
+    """
+
+    def __init__(self, client: "BaseClient") -> None:
+        self._client = client
+        self._voice = VoiceModule(client)
+
+    async def speak(
+        self,
+        input: str,
+        model: Optional[str] = None,
+        voice: Optional[str] = None,
+        provider: Optional[str] = None,
+        response_format: Optional[str] = None,
+        speed: Optional[float] = None,
+        language: Optional[str] = None,
+    ) -> bytes:
+        """Synthesize speech and return the raw audio bytes."""
+        return await self._voice.a_speak(
+            input,
+            model=model,
+            voice=voice,
+            provider=provider,
+            response_format=response_format,
+            speed=speed,
+            language=language,
+        )
+
+    async def transcribe(
+        self,
+        file: AudioInput,
+        model: Optional[str] = None,
+        provider: Optional[str] = None,
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        diarize: bool = False,
+        response_format: str = "json",
+        filename: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Transcribe audio from a path, bytes, or an open binary file."""
+        return await self._voice.a_transcribe(
+            file,
+            response_format=response_format,
+            model=model,
+            provider=provider,
+            language=language,
+            prompt=prompt,
+            temperature=temperature,
+            diarize=diarize,
+            filename=filename,
+        )
+
+    async def diarize(
+        self, file: AudioInput, model: Optional[str] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Transcribe with speaker labels."""
+        kwargs.pop("diarize", None)
+        kwargs.pop("response_format", None)
+        return await self.transcribe(
+            file, model=model, diarize=True, response_format="verbose_json", **kwargs
+        )
+
+    async def list_models(self) -> Dict[str, Any]:
+        """Return ``{'tts': [...], 'stt': [...]}`` of available voice models."""
+        client = self._client._get_async_http_client()
+        tts, stt = await asyncio.gather(
+            client.get(self._voice._url("/api/ai/audio/speech"), headers=self._voice._headers()),
+            client.get(
+                self._voice._url("/api/ai/audio/transcriptions"), headers=self._voice._headers()
+            ),
+        )
+        return {
+            "tts": tts.json().get("models", []) if tts.is_success else [],
+            "stt": stt.json().get("models", []) if stt.is_success else [],
+        }
 
 
 def _speak_body(
@@ -0,0 +1,109 @@
+"""Tests for rebuilding chat responses from streamed chunks."""
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from cencori import Cencori, StreamAccumulator, StreamChunk, ToolCall, ToolCallFunction, Usage
+
+MESSAGES = [{"role": "user", "content": "Weather in Paris?"}]
+
+
+def sse(*events: Dict[str, Any]) -> bytes:
+    return b"".join(b"data: " + json.dumps(e).encode() + b"\n\n" for e in events) + (
+        b"data: [DONE]\n\n"
+    )
+
+
+def client_for(body: bytes) -> Cencori:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    return Cencori(api_key="csk_test", http_client=httpx.Client(transport=transport))
+
+
+class TestStreamAccumulator:
+    """Test StreamAccumulator."""
+
+    def test_passes_chunks_through_and_builds_response(self) -> None:
+        body = sse(
+            {"delta": "It is "},
+            {"delta": "sunny."},
+            {"delta": "", "finish_reason": "stop"},
+            {"usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
+             "cost_usd": 0.002},
+        )
+        stream = StreamAccumulator(model="gpt-4o")
+
+        deltas = [c.delta for c in stream.wrap(client_for(body).ai.chat_stream(MESSAGES))]
+        response = stream.response()
+
+        assert "".join(deltas) == "It is sunny."
+        assert response.content == "It is sunny."
+        assert response.finish_reason == "stop"
+        assert response.usage == Usage(prompt_tokens=5, completion_tokens=3, total_tokens=8)
+        assert response.cost_usd == 0.002
+        assert response.tool_calls is None
+
+    def test_merges_indexed_fragments(self) -> None:
+        stream = StreamAccumulator()
+        fragments: List[List[Dict[str, Any]]] = [
+            [{"index": 0, "id": "call_1", "type": "function",
+              "function": {"name": "weather", "arguments": ""}}],
+            [{"index": 0, "function": {"arguments": '{"city": '}},
+             {"index": 1, "id": "call_2", "function": {"name": "time", "arguments": "{}"}}],
+            [{"index": 0, "function": {"arguments": '"Paris"}'}}],
+        ]
+        for tool_calls in fragments:
+            stream.add(StreamChunk(tool_calls=tool_calls))  # type: ignore[arg-type]
+
+        assert stream.tool_calls == [
+            ToolCall(id="call_1", function=ToolCallFunction("weather", '{"city": "Paris"}')),
+            ToolCall(id="call_2", function=ToolCallFunction("time", "{}")),
+        ]
+
+    def test_whole_call_replaces_fragments(self) -> None:
+        stream = StreamAccumulator()
+        stream.add(StreamChunk(tool_calls=[  # type: ignore[list-item]
+            {"index": 0, "id": "c", "function": {"name": "f", "arguments": '{"a"'}}
+        ]))
+        stream.add(StreamChunk(finish_reason="tool_calls", tool_calls=[  # type: ignore[list-item]
+            {"id": "c", "type": "function", "function": {"name": "f", "arguments": '{"a": 1}'}}
+        ]))
+
+        assert stream.tool_calls == [ToolCall(id="c", function=ToolCallFunction("f", '{"a": 1}'))]
+
+    def test_matches_chat_response(self) -> None:
+        call = {"id": "call_1", "type": "function",
+                "function": {"name": "weather", "arguments": '{"city": "Paris"}'}}
+        usage = {"prompt_tokens": 9, "completion_tokens": 4, "total_tokens": 13}
+        chat = client_for(b"").ai._parse_chat(
+            {"content": "", "model": "gpt-4o", "finish_reason": "tool_calls",
+             "toolCalls": [call], "usage": usage, "cost_usd": 0.01},
+            "gpt-4o",
+        )
+        body = sse(
+            {"delta": "", "finish_reason": "tool_calls", "toolCalls": [call]},
+            {"usage": usage, "cost_usd": 0.01},
+        )
+        stream = StreamAccumulator(model="gpt-4o")
+
+        for _ in stream.wrap(client_for(body).ai.chat_stream(MESSAGES, model="gpt-4o")):
+            pass
+
+        assert stream.response() == chat
+
+    @pytest.mark.asyncio
+    async def test_async(self) -> None:
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=sse({"delta": "a"}, {"delta": "b"}))
+        )
+        client = Cencori(
+            api_key="csk_test", async_http_client=httpx.AsyncClient(transport=transport)
+        )
+        stream = StreamAccumulator()
+
+        async for _ in stream.awrap(client.ai.async_chat_stream(MESSAGES)):
+            pass
+
+        assert stream.content == "ab"
@@ -1,11 +1,13 @@
 """Tests for AI module."""
 
-from typing import Any, Dict
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, List, Tuple
 from unittest.mock import patch
 
 import pytest
 
-from cencori import Cencori
+from cencori import Cencori, GenerateObjectRequest, ResponsesRequest
 from cencori.errors import AuthenticationError, RateLimitError, SafetyError
 
 
@@ -148,3 +150,73 @@ class TestErrorHandling:
                 client.ai.chat(messages=[{"role": "user", "content": "Bad content"}])
 
             assert "harmful_content" in exc_info.value.reasons
+
+
+class TestAsyncMethods:
+    """Test async methods run concurrently without blocking the event loop."""
+
+    CALLS = 10
+    LATENCY = 0.1
+
+    @pytest.fixture
+    def slow_client(self, api_key: str) -> Cencori:
+        client = Cencori(api_key=api_key)
+
+        async def slow_request(method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
+            await asyncio.sleep(self.LATENCY)
+            if endpoint == "/api/ai/chat":
+                return {
+                    "toolCalls": [{"function": {"name": "generate_object", "arguments": '{"a": 1}'}}],
+                }
+            if endpoint == "/api/ai/images/generate":
+                return {"images": [{"url": "https://example.com/cat.png"}]}
+            if endpoint == "/api/ai/rag":
+                return {"message": {"content": "answer"}}
+            return {"id": "resp_1", "output": []}
+
+        client._async_request = slow_request  # type: ignore[method-assign]
+        return client
+
+    async def _timed(self, coros: List[Awaitable[Any]]) -> Tuple[List[Any], float]:
+        start = time.perf_counter()
+        results = await asyncio.gather(*coros)
+        return results, time.perf_counter() - start
+
+    @pytest.mark.asyncio
+    async def test_async_generate_object_concurrent(self, slow_client: Cencori) -> None:
+        params = GenerateObjectRequest(model="gpt-4o", prompt="x", schema={"type": "object"})
+        results, elapsed = await self._timed(
+            [slow_client.ai.async_generate_object(params) for _ in range(self.CALLS)]
+        )
+
+        assert all(r.object == {"a": 1} for r in results)
+        assert elapsed < self.LATENCY * 3
+
+    @pytest.mark.asyncio
+    async def test_async_generate_image_concurrent(self, slow_client: Cencori) -> None:
+        results, elapsed = await self._timed(
+            [slow_client.ai.async_generate_image("a cat") for _ in range(self.CALLS)]
+        )
+
+        assert all(r.images[0].url for r in results)
+        assert elapsed < self.LATENCY * 3
+
+    @pytest.mark.asyncio
+    async def test_async_rag_concurrent(self, slow_client: Cencori) -> None:
+        messages = [{"role": "user", "content": "q"}]
+        results, elapsed = await self._timed(
+            [slow_client.ai.async_rag("gpt-4o", messages, "docs") for _ in range(self.CALLS)]
+        )
+
+        assert all(r.message["content"] == "answer" for r in results)
+        assert elapsed < self.LATENCY * 3
+
+    @pytest.mark.asyncio
+    async def test_async_responses_concurrent(self, slow_client: Cencori) -> None:
+        request = ResponsesRequest(model="gpt-4o", input="hi")
+        results, elapsed = await self._timed(
+            [slow_client.ai.async_responses(request) for _ in range(self.CALLS)]
+        )
+
+        assert all(r.id == "resp_1" for r in results)
+        assert elapsed < self.LATENCY * 3
@@ -0,0 +1,149 @@
+"""Tests for the AsyncCencori client."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from cencori import (
+    AsyncCencori,
+    CreateAgentParams,
+    CreateNamespaceOptions,
+    SearchMemoryOptions,
+    WebTelemetryPayload,
+)
+from cencori.errors import AuthenticationError
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+
+def make_client(api_key: str, routes: Dict[str, Any], seen: List[httpx.Request]) -> AsyncCencori:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        body = routes.get(request.url.path)
+        if body is None:
+            return httpx.Response(404, json={"error": "Not found"})
+        if isinstance(body, bytes):
+            return httpx.Response(200, content=body)
+        return httpx.Response(200, json=body)
+
+    transport = httpx.MockTransport(handler)
+    return AsyncCencori(api_key=api_key, async_http_client=httpx.AsyncClient(transport=transport))
+
+
+class TestAsyncCencori:
+    """Test the async client and its modules."""
+
+    def test_requires_api_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("CENCORI_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="AsyncCencori"):
+            AsyncCencori()
+
+    @pytest.mark.asyncio
+    async def test_chat(self, api_key: str, mock_chat_response: Dict[str, Any]) -> None:
+        seen: List[httpx.Request] = []
+        async with make_client(api_key, {"/api/ai/chat": mock_chat_response}, seen) as client:
+            response = await client.ai.chat(messages=MESSAGES, model="gpt-4o")
+
+        assert response.content == mock_chat_response["content"]
+        assert json.loads(seen[0].content)["model"] == "gpt-4o"
+        assert seen[0].headers["CENCORI_API_KEY"] == api_key
+
+    @pytest.mark.asyncio
+    async def test_chat_stream(self, api_key: str) -> None:
+        sse = b'data: {"delta": "Hel"}\n\ndata: {"delta": "lo"}\n\ndata: [DONE]\n\n'
+        client = make_client(api_key, {"/api/ai/chat": sse}, [])
+
+        chunks = [c.delta async for c in client.ai.chat_stream(messages=MESSAGES)]
+
+        assert chunks == ["Hel", "lo"]
+
+    def test_client_from_a_finished_loop_is_closed(
+        self,
+        api_key: str,
+        mock_chat_response: Dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        created: List[httpx.AsyncClient] = []
+        async_client = httpx.AsyncClient
+
+        def pooled(**kwargs: Any) -> httpx.AsyncClient:
+            transport = httpx.MockTransport(lambda r: httpx.Response(200, json=mock_chat_response))
+            created.append(async_client(transport=transport))
+            return created[-1]
+
+        monkeypatch.setattr("cencori.client.httpx.AsyncClient", pooled)
+        client = AsyncCencori(api_key=api_key)
+
+        asyncio.run(client.ai.chat(messages=MESSAGES))
+        asyncio.run(client.ai.chat(messages=MESSAGES))
+
+        assert len(created) == 2
+        assert created[0].is_closed and created[1].is_closed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_pool(
+        self, api_key: str, mock_chat_response: Dict[str, Any]
+    ) -> None:
+        seen: List[httpx.Request] = []
+        client = make_client(api_key, {"/api/ai/chat": mock_chat_response}, seen)
+
+        results = await asyncio.gather(*(client.ai.chat(messages=MESSAGES) for _ in range(20)))
+
+        assert len(results) == 20
+        assert len(seen) == 20
+
+    @pytest.mark.asyncio
+    async def test_memory(self, api_key: str) -> None:
+        routes = {
+            "/api/memory/namespaces": {"id": "ns_1", "name": "docs", "dimensions": 1536},
+            "/api/memory/search": {
+                "results": [{"id": "m1", "content": "hello", "similarity": 0.9}],
+                "count": 1,
+            },
+        }
+        client = make_client(api_key, routes, [])
+
+        namespace = await client.memory.create_namespace(CreateNamespaceOptions(name="docs"))
+        result = await client.memory.search(SearchMemoryOptions(namespace="docs", query="hi"))
+
+        assert namespace.id == "ns_1"
+        assert result.results[0].content == "hello"
+        assert result.query == "hi"
+
+    @pytest.mark.asyncio
+    async def test_agents_and_request(self, api_key: str) -> None:
+        routes = {
+            "/v1/agents": {"id": "agent_1", "name": "bot", "config": {"model": "gpt-4o"}},
+            "/api/v1/custom": {"ok": True},
+        }
+        seen: List[httpx.Request] = []
+        client = make_client(api_key, routes, seen)
+
+        agent = await client.agents.create(CreateAgentParams(name="bot"))
+        data = await client.request("/api/v1/custom", method="POST", body={"foo": "bar"})
+
+        assert agent.config is not None and agent.config.model == "gpt-4o"
+        assert data == {"ok": True}
+        assert json.loads(seen[1].content) == {"foo": "bar"}
+
+    @pytest.mark.asyncio
+    async def test_errors_are_raised(self, api_key: str) -> None:
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(401, json={"error": "bad key"})
+        )
+        client = AsyncCencori(
+            api_key=api_key, async_http_client=httpx.AsyncClient(transport=transport)
+        )
+
+        with pytest.raises(AuthenticationError):
+            await client.ai.chat(messages=MESSAGES)
+
+    @pytest.mark.asyncio
+    async def test_telemetry_never_raises(self, api_key: str) -> None:
+        client = make_client(api_key, {}, [])
+        payload = WebTelemetryPayload(host="example.com", method="GET", path="/", status_code=200)
+
+        assert await client.telemetry.report_web_request(payload) is None
@@ -0,0 +1,151 @@
+"""Tests for the resumable JSONL batch runner."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from cencori import Cencori, RetryPolicy
+
+
+def write_requests(path: Path, rows: List[Dict[str, Any]]) -> None:
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+def read_results(path: Path) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def make_client(api_key: str, seen: List[str]) -> Cencori:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path == "/api/ai/embeddings":
+            seen.append(body["input"])
+            return httpx.Response(200, json={"data": [{"embedding": [0.5]}]})
+        content = body["messages"][0]["content"]
+        seen.append(content)
+        if content == "fail":
+            return httpx.Response(400, json={"error": "bad request"})
+        if content == "busy" and seen.count("busy") == 1:
+            return httpx.Response(429, json={"error": "slow down"})
+        return httpx.Response(200, json={"content": content.upper(), "model": "m"})
+
+    return Cencori(
+        api_key=api_key,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry=RetryPolicy(max_attempts=1),
+    )
+
+
+def chat_row(custom_id: str, content: str) -> Dict[str, Any]:
+    return {"custom_id": custom_id, "params": {"messages": [{"role": "user", "content": content}]}}
+
+
+class TestBatchRun:
+    """Test BatchModule.run."""
+
+    def test_writes_results_and_errors(self, api_key: str, tmp_path: Path) -> None:
+        seen: List[str] = []
+        requests = tmp_path / "in.jsonl"
+        write_requests(
+            requests,
+            [
+                chat_row("a", "hi"),
+                chat_row("b", "fail"),
+                {"custom_id": "c", "type": "embeddings", "params": {"input": "text"}},
+                {"custom_id": "d", "type": "unknown"},
+            ],
+        )
+        output = tmp_path / "out.jsonl"
+
+        summary = make_client(api_key, seen).batch.run(str(requests), str(output), concurrency=4)
+
+        results = {r["custom_id"]: r for r in read_results(output)}
+        assert summary.succeeded == 2 and summary.failed == 2 and summary.skipped == 0
+        assert results["a"]["response"]["content"] == "HI"
+        assert results["b"]["error"]["status_code"] == 400
+        assert results["c"]["response"]["embeddings"] == [[0.5]]
+        assert results["d"]["error"]["type"] == "ValueError"
+
+    def test_resume_skips_completed_lines(self, api_key: str, tmp_path: Path) -> None:
+        requests = tmp_path / "in.jsonl"
+        write_requests(requests, [chat_row(str(i), f"q{i}") for i in range(6)])
+        output = tmp_path / "out.jsonl"
+        checkpoint = tmp_path / "out.jsonl.checkpoint"
+
+        make_client(api_key, []).batch.run(str(requests), str(output), concurrency=1)
+        # Simulate a crash after three results plus a half-written fourth.
+        entries = checkpoint.read_bytes().splitlines(keepends=True)
+        checkpoint.write_bytes(b"".join(entries[:3]) + b"99")
+        with output.open("ab") as f:
+            f.write(b'{"custom_id": "torn"')
+
+        seen: List[str] = []
+        summary = make_client(api_key, seen).batch.run(str(requests), str(output))
+
+        finished = {int(e.split()[0]) for e in entries[:3]}
+        assert summary.skipped == 3 and summary.succeeded == 3
+        assert len(seen) == 3
+        results = read_results(output)
+        assert sorted(r["custom_id"] for r in results) == [str(i) for i in range(6)]
+        assert finished.isdisjoint(r["offset"] for r in results[3:])
+
+    def test_resume_retries_transient_failures(self, api_key: str, tmp_path: Path) -> None:
+        requests = tmp_path / "in.jsonl"
+        write_requests(
+            requests, [chat_row("a", "hi"), chat_row("b", "busy"), chat_row("c", "fail")]
+        )
+        output = tmp_path / "out.jsonl"
+        seen: List[str] = []
+        client = make_client(api_key, seen)
+
+        first = client.batch.run(str(requests), str(output), concurrency=1)
+        second = client.batch.run(str(requests), str(output), concurrency=1)
+
+        assert (first.succeeded, first.failed) == (1, 2)
+        assert (second.skipped, second.succeeded) == (2, 1)
+        assert seen == ["hi", "busy", "fail", "busy"]
+        results = read_results(output)
+        assert results[1]["error"]["retryable"] is True
+        assert results[2]["error"]["retryable"] is False
+        assert results[-1]["custom_id"] == "b" and results[-1]["response"]["content"] == "BUSY"
+
+    def test_syncs_in_groups_and_on_exit(
+        self, api_key: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        requests = tmp_path / "in.jsonl"
+        write_requests(requests, [chat_row(str(i), f"q{i}") for i in range(6)])
+        output = tmp_path / "out.jsonl"
+        synced: List[int] = []
+        monkeypatch.setattr("cencori.batch.os.fsync", synced.append)
+
+        make_client(api_key, []).batch.run(
+            str(requests), str(output), concurrency=1, sync_every=4, sync_interval=60.0
+        )
+
+        assert len(synced) == 2 * 2  # output and checkpoint, after 4 rows and at the end
+        checkpoint = tmp_path / "out.jsonl.checkpoint"
+        assert len(checkpoint.read_bytes().splitlines()) == 6
+
+    def test_blank_lines_ignored(self, api_key: str, tmp_path: Path) -> None:
+        requests = tmp_path / "in.jsonl"
+        requests.write_text(json.dumps(chat_row("a", "x")) + "\n\n")
+        output = tmp_path / "out.jsonl"
+
+        summary = make_client(api_key, []).batch.run(str(requests), str(output))
+
+        assert summary.succeeded == 1
+        assert len(read_results(output)) == 1
+
+    def test_progress(self, api_key: str, tmp_path: Path) -> None:
+        requests = tmp_path / "in.jsonl"
+        write_requests(requests, [chat_row("a", "x"), chat_row("b", "y")])
+        calls: List[Any] = []
+
+        make_client(api_key, []).batch.run(
+            str(requests), str(tmp_path / "out.jsonl"), on_progress=lambda d, t: calls.append(d)
+        )
+
+        assert calls == [1, 2]
@@ -0,0 +1,175 @@
+"""Tests for the deterministic response cache."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, GenerateObjectRequest, ResponseCache
+from cencori.cache import cache_key
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+
+class TestResponseCache:
+    """Test the cache tiers."""
+
+    def test_key_is_canonical(self) -> None:
+        a = cache_key("/api/ai/chat", {"model": "m", "messages": MESSAGES, "temperature": 0})
+        b = cache_key("/api/ai/chat", {"temperature": 0, "messages": MESSAGES, "model": "m"})
+        c = cache_key("/api/ai/chat", {"temperature": 0, "messages": MESSAGES, "model": "n"})
+
+        assert a == b
+        assert a != c
+
+    def test_memory_lru(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("b") is None
+        assert cache.hits == 2 and cache.misses == 1
+
+    def test_hit_returns_copy(self) -> None:
+        cache = ResponseCache()
+        cache.set("a", {"items": [1]})
+        cache.get("a")["items"].append(2)  # type: ignore[index]
+
+        assert cache.get("a") == {"items": [1]}
+
+    def test_ttl(self) -> None:
+        cache = ResponseCache(ttl=10)
+        with patch("cencori.cache.time.time", return_value=1000.0):
+            cache.set("a", {"v": 1})
+        with patch("cencori.cache.time.time", return_value=1011.0):
+            assert cache.get("a") is None
+
+    def test_sqlite_persists(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "cache.db")
+        first = ResponseCache(path=path)
+        first.set("a", {"v": 1})
+        first.close()
+
+        second = ResponseCache(path=path)
+
+        assert second.get("a") == {"v": 1}
+
+    def test_sqlite_size_bound_evicts_lru(self, tmp_path: Path) -> None:
+        cache = ResponseCache(max_entries=0, path=str(tmp_path / "cache.db"), max_bytes=40)
+        with patch("cencori.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", {"v": "x" * 10})
+            cache.set("b", {"v": "y" * 10})
+            cache.get("a")
+            cache.set("c", {"v": "z" * 10})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_memory_hits_keep_sqlite_recency(self, tmp_path: Path) -> None:
+        cache = ResponseCache(path=str(tmp_path / "cache.db"), max_bytes=40)
+        with patch("cencori.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", {"v": "x" * 10})
+            cache.set("b", {"v": "y" * 10})
+            assert cache.get("a") is not None  # served from memory
+            cache.set("c", {"v": "z" * 10})
+
+        reopened = ResponseCache(max_entries=0, path=str(tmp_path / "cache.db"))
+        assert reopened.get("b") is None
+        assert reopened.get("a") is not None
+
+    def test_size_is_tracked_across_replacements(self, tmp_path: Path) -> None:
+        cache = ResponseCache(path=str(tmp_path / "cache.db"))
+        cache.set("a", {"v": "x" * 10})
+        cache.set("a", {"v": "x" * 20})
+        cache.set("b", {"v": 1})
+
+        assert cache._bytes == cache._stored_bytes()
+        cache.clear()
+        assert cache._bytes == 0
+
+
+def make_client(api_key: str, seen: List[Dict[str, Any]], cache: ResponseCache) -> Cencori:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={
+                "content": "Hello",
+                "model": "m",
+                "toolCalls": [{"function": {"name": "f", "arguments": '{"a": 1}'}}],
+            },
+        )
+
+    return Cencori(
+        api_key=api_key,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        cache=cache,
+    )
+
+
+class TestChatCache:
+    """Test cache use from the AI module."""
+
+    def test_temperature_zero_is_cached(self, api_key: str) -> None:
+        seen: List[Dict[str, Any]] = []
+        client = make_client(api_key, seen, ResponseCache())
+
+        first = client.ai.chat(messages=MESSAGES, temperature=0)
+        second = client.ai.chat(messages=MESSAGES, temperature=0)
+
+        assert first == second
+        assert len(seen) == 1
+
+    def test_sampling_not_cached_unless_requested(self, api_key: str) -> None:
+        seen: List[Dict[str, Any]] = []
+        client = make_client(api_key, seen, ResponseCache())
+
+        client.ai.chat(messages=MESSAGES)
+        client.ai.chat(messages=MESSAGES)
+        client.ai.chat(messages=MESSAGES, temperature=0.7, cache=True)
+        client.ai.chat(messages=MESSAGES, temperature=0.7, cache=True)
+        client.ai.chat(messages=MESSAGES, temperature=0, cache=False)
+
+        assert len(seen) == 4
+
+    def test_generate_object(self, api_key: str) -> None:
+        seen: List[Dict[str, Any]] = []
+        client = make_client(api_key, seen, ResponseCache())
+        params = GenerateObjectRequest(model="m", prompt="x", schema={}, temperature=0)
+
+        first = client.ai.generate_object(params)
+        second = client.ai.generate_object(params)
+
+        assert first.object == second.object == {"a": 1}
+        assert len(seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_shares_cache(self, api_key: str) -> None:
+        seen: List[Dict[str, Any]] = []
+        cache = ResponseCache()
+        client = make_client(api_key, seen, cache)
+        client.ai.chat(messages=MESSAGES, temperature=0)
+
+        async_client = AsyncCencori(api_key=api_key, cache=cache)
+        response = await async_client.ai.chat(messages=MESSAGES, temperature=0)
+
+        assert response.content == "Hello"
+        assert len(seen) == 1
+
+    def test_api_keys_do_not_share_entries(self) -> None:
+        cache = ResponseCache()
+        first: List[Dict[str, Any]] = []
+        second: List[Dict[str, Any]] = []
+
+        make_client("csk_first", first, cache).ai.chat(messages=MESSAGES, temperature=0)
+        make_client("csk_second", second, cache).ai.chat(messages=MESSAGES, temperature=0)
+
+        assert len(first) == 1 and len(second) == 1
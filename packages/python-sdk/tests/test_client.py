@@ -3,10 +3,13 @@
 import os
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from cencori import Cencori
 
+from conftest import MockTransport
+
 
 class TestClientInitialization:
     """Test client initialization."""
@@ -144,3 +147,73 @@ class TestUtilityMethods:
         assert "api_key_hint" in config
         assert "..." in config["api_key_hint"]
         assert api_key not in config["api_key_hint"]
+
+
+class TestConnectionPool:
+    """Test the shared pooled transport."""
+
+    def test_http_client_is_reused(self, api_key: str) -> None:
+        """Test every request goes through one long-lived client."""
+        client = Cencori(api_key=api_key)
+
+        first = client._get_http_client()
+        assert client._get_http_client() is first
+        assert client.ai._client._get_http_client() is first
+
+    def test_requests_share_transport(self, api_key: str, base_url: str) -> None:
+        """Test consecutive requests are sent over the same pool."""
+        transport = MockTransport({"/api/ai/chat": {"content": "Hi"}})
+        client = Cencori(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=httpx.Client(transport=transport),
+        )
+
+        client.ai.chat(messages=[{"role": "user", "content": "Hello"}])
+        client.ai.chat(messages=[{"role": "user", "content": "Again"}])
+
+        assert len(transport.requests) == 2
+        assert transport.requests[0].headers["CENCORI_API_KEY"] == api_key
+
+    def test_custom_limits(self, api_key: str) -> None:
+        """Test pool limits are configurable."""
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        client = Cencori(api_key=api_key, limits=limits)
+
+        assert client._limits is limits
+
+    def test_close_releases_pool(self, api_key: str) -> None:
+        """Test close() drops the owned client and a new one is created lazily."""
+        client = Cencori(api_key=api_key)
+        first = client._get_http_client()
+
+        client.close()
+
+        assert first.is_closed
+        assert client._get_http_client() is not first
+
+    def test_close_leaves_user_client_open(self, api_key: str) -> None:
+        """Test a caller-provided client is not closed by the SDK."""
+        http_client = httpx.Client()
+        client = Cencori(api_key=api_key, http_client=http_client)
+
+        client.close()
+
+        assert not http_client.is_closed
+        http_client.close()
+
+    def test_context_manager_closes(self, api_key: str) -> None:
+        """Test the client closes its pool on exit."""
+        with Cencori(api_key=api_key) as client:
+            http_client = client._get_http_client()
+
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes(self, api_key: str) -> None:
+        """Test the async pool is shared and closed on exit."""
+        async with Cencori(api_key=api_key) as client:
+            async_client = client._get_async_http_client()
+            assert client._get_async_http_client() is async_client
+
+        assert async_client.is_closed
@@ -0,0 +1,114 @@
+"""Tests for micro-batching of concurrent single-text embedding calls."""
+
+import asyncio
+import json
+from typing import Any, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, EmbeddingCoalescing, RetryPolicy
+from cencori.coalesce import EmbeddingCoalescer, _share_usage
+from cencori.errors import CencoriError
+
+
+def make_client(api_key: str, sent: List[List[str]], status: int = 200, **settings: Any) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        sent.append(payload["input"])
+        if status != 200:
+            return httpx.Response(status, json={"error": "boom"})
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"embedding": [float(len(t))]} for t in payload["input"]],
+                "model": payload["model"],
+                "usage": {"total_tokens": 10 * len(payload["input"])},
+            },
+        )
+
+    return AsyncCencori(
+        api_key=api_key,
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        embedding_coalescing=EmbeddingCoalescing(**settings),
+        retry=RetryPolicy(max_attempts=1),
+    )
+
+
+class TestCoalescing:
+    """Test AsyncCencori.ai.embeddings with embedding_coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = make_client(api_key, sent, window_ms=20)
+
+        responses = await asyncio.gather(*(client.ai.embeddings("x" * n) for n in (1, 2, 3)))
+
+        assert sent == [["x", "xx", "xxx"]]
+        assert [r.embeddings for r in responses] == [[[1.0]], [[2.0]], [[3.0]]]
+        assert sum(r.usage.total_tokens for r in responses) == 30
+
+    @pytest.mark.asyncio
+    async def test_max_items_flushes_early(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = make_client(api_key, sent, window_ms=10_000, max_items=2)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(client.ai.embeddings(t) for t in "abcd")), timeout=1
+        )
+
+        assert sent == [["a", "b"], ["c", "d"]]
+
+    @pytest.mark.asyncio
+    async def test_models_batched_separately(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = make_client(api_key, sent)
+
+        a, b = await asyncio.gather(
+            client.ai.embeddings("a", model="m1"), client.ai.embeddings("b", model="m2")
+        )
+
+        assert (a.model, b.model) == ("m1", "m2")
+        assert sorted(sent) == [["a"], ["b"]]
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self, api_key: str) -> None:
+        client = make_client(api_key, [], status=500)
+
+        results = await asyncio.gather(
+            client.ai.embeddings("a"), client.ai.embeddings("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, CencoriError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_dispatch_releases_callers(self) -> None:
+        async def send(texts: List[str], model: str, cache: Any) -> Any:
+            await asyncio.sleep(10)
+
+        coalescer = EmbeddingCoalescer(EmbeddingCoalescing(max_items=2), send)
+        callers = [asyncio.ensure_future(coalescer.embed(t, "m", None)) for t in "ab"]
+        await asyncio.sleep(0.01)
+        for task in list(coalescer._tasks):
+            task.cancel()
+
+        results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), 1)
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_lists_not_coalesced(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = make_client(api_key, sent, window_ms=10_000)
+
+        await asyncio.wait_for(client.ai.embeddings(["a", "b"]), timeout=1)
+
+        assert sent == [["a", "b"]]
+
+
+def test_share_usage_sums_exactly() -> None:
+    shares = _share_usage(["a" * 40, "b", "c" * 7], 17)
+
+    assert sum(shares) == 17
+    assert shares[0] > shares[1]
@@ -0,0 +1,197 @@
+"""Tests for the pluggable JSON codec."""
+
+import importlib.util
+import json
+from dataclasses import dataclass
+from typing import Any, List, Type, Union
+
+import httpx
+import pytest
+
+from cencori import (
+    AsyncCencori,
+    Cencori,
+    Conversation,
+    GenerateObjectRequest,
+    JSONCodec,
+    OrjsonCodec,
+)
+from cencori.codec import default_codec
+from cencori.errors import StreamDecodeError
+
+needs_orjson = pytest.mark.skipif(
+    importlib.util.find_spec("orjson") is None, reason="orjson is not installed"
+)
+CODECS = [JSONCodec, pytest.param(OrjsonCodec, marks=needs_orjson)]
+
+PAYLOAD = {
+    "model": "gpt-4o",
+    "messages": [{"role": "user", "content": 'héllo ✓ "quoted" </script>'}],
+    "temperature": 0.7,
+    "stream": False,
+}
+
+
+@dataclass
+class Part:
+    kind: str
+    size: int
+
+
+class RecordingCodec(JSONCodec):
+    """Standard-library codec that records what passes through it."""
+
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.dumped: List[Any] = []
+        self.loaded: List[Union[bytes, str]] = []
+
+    def dumps(self, value: Any) -> bytes:
+        self.dumped.append(value)
+        return super().dumps(value)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+def httpx_body(payload: Any) -> bytes:
+    return httpx.Request("POST", "https://x", json=payload).content
+
+
+class TestCodecs:
+    """Test encoding and decoding with each codec."""
+
+    @pytest.mark.parametrize("codec_class", CODECS, ids=["json", "orjson"])
+    def test_matches_httpx_encoding(self, codec_class: Type[JSONCodec]) -> None:
+        codec = codec_class()
+        body = codec.dumps(PAYLOAD)
+
+        assert body == httpx_body(PAYLOAD)
+        assert codec.loads(body) == PAYLOAD
+        assert codec.loads(body.decode()) == PAYLOAD
+
+    @pytest.mark.parametrize("codec_class", CODECS, ids=["json", "orjson"])
+    def test_dataclasses_and_big_ints(self, codec_class: Type[JSONCodec]) -> None:
+        codec = codec_class()
+        value = {"parts": [Part("text", 3)], "id": 2**70}
+
+        assert json.loads(codec.dumps(value)) == {
+            "parts": [{"kind": "text", "size": 3}],
+            "id": 2**70,
+        }
+
+    @pytest.mark.parametrize("codec_class", CODECS, ids=["json", "orjson"])
+    def test_malformed_raises_value_error(self, codec_class: Type[JSONCodec]) -> None:
+        codec = codec_class()
+        with pytest.raises(ValueError):
+            codec.loads(b'{"content": ')
+        with pytest.raises(TypeError):
+            codec.dumps({"handle": object()})
+
+    @needs_orjson
+    def test_default_prefers_orjson(self) -> None:
+        assert default_codec().name == "orjson"
+
+
+class TestClientCodec:
+    """Test that the client sends and parses JSON through its codec."""
+
+    def test_request_and_response(self, api_key: str) -> None:
+        codec = RecordingCodec()
+        bodies: List[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(200, json={"content": "hi", "model": "gpt-4o"})
+
+        client = Cencori(
+            api_key=api_key,
+            json_codec=codec,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+
+        response = client.ai.chat(PAYLOAD["messages"], model="gpt-4o")
+
+        assert response.content == "hi"
+        assert codec.dumped[0]["messages"] == PAYLOAD["messages"]
+        assert bodies[0] == httpx_body(codec.dumped[0])
+        assert codec.loaded == [b'{"content":"hi","model":"gpt-4o"}']
+
+    def test_stream_events(self, api_key: str) -> None:
+        codec = RecordingCodec()
+        stream = b'data: {"delta": "a"}\n\ndata: {"delta": "b"}\n\ndata: [DONE]\n\n'
+        client = Cencori(
+            api_key=api_key,
+            json_codec=codec,
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=stream))
+            ),
+        )
+
+        chunks = list(client.ai.chat_stream([{"role": "user", "content": "hi"}]))
+
+        assert "".join(chunk.delta for chunk in chunks) == "ab"
+        assert codec.loaded == ['{"delta": "a"}', '{"delta": "b"}']
+
+    @needs_orjson
+    def test_malformed_event_with_orjson(self, api_key: str) -> None:
+        stream = b'data: {"delta": "a"}\n\ndata: {"delta": \n\n'
+        client = Cencori(
+            api_key=api_key,
+            json_codec=OrjsonCodec(),
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=stream))
+            ),
+        )
+
+        with pytest.raises(StreamDecodeError):
+            list(client.ai.chat_stream([{"role": "user", "content": "hi"}]))
+
+    def test_generated_object(self, api_key: str) -> None:
+        codec = RecordingCodec()
+        arguments = '{"name": "Ada"}'
+        body = {"toolCalls": [{"function": {"name": "person", "arguments": arguments}}]}
+        client = Cencori(
+            api_key=api_key,
+            json_codec=codec,
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+            ),
+        )
+
+        response = client.ai.generate_object(
+            GenerateObjectRequest(model="gpt-4o", prompt="hi", schema={"type": "object"})
+        )
+
+        assert response.object == {"name": "Ada"}
+        assert codec.loaded[-1] == arguments
+
+    def test_conversation_body_uses_codec(self) -> None:
+        codec = RecordingCodec()
+        conversation = Conversation(PAYLOAD["messages"], codec=codec)
+
+        payload = {"messages": conversation.messages, "model": "gpt-4o"}
+
+        assert conversation.body(payload) == httpx_body(payload)
+        assert codec.dumped[0] is PAYLOAD["messages"][0]
+
+    @pytest.mark.asyncio
+    async def test_async_request_and_response(self, api_key: str) -> None:
+        codec = RecordingCodec()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["model"] == "gpt-4o"
+            return httpx.Response(200, json={"content": "hi"})
+
+        client = AsyncCencori(
+            api_key=api_key,
+            json_codec=codec,
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        response = await client.ai.chat([{"role": "user", "content": "hi"}], model="gpt-4o")
+
+        assert response.content == "hi"
+        assert len(codec.dumped) == 1 and len(codec.loaded) == 1
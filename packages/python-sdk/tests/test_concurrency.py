@@ -0,0 +1,159 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from cencori import AdaptiveConcurrency, Cencori, RetryPolicy
+from cencori.concurrency import AdaptiveLimit, endpoint_family
+from cencori.errors import RateLimitError
+
+
+class TestEndpointFamily:
+    """Test endpoint to family mapping."""
+
+    @pytest.mark.parametrize(
+        "endpoint, family",
+        [
+            ("/api/ai/chat", "chat"),
+            ("/api/ai/rag", "chat"),
+            ("/api/ai/embeddings", "embeddings"),
+            ("/api/memory/search", "memory"),
+            ("/api/ai/audio/speech", "voice"),
+            ("/v1/metrics?period=24h", None),
+        ],
+    )
+    def test_family(self, endpoint: str, family: str) -> None:
+        assert endpoint_family(endpoint) == family
+
+
+class TestAdaptiveLimit:
+    """Test AIMD adjustments."""
+
+    def test_additive_increase(self) -> None:
+        """Test success grows the limit by increase/limit."""
+        limit = AdaptiveLimit(initial=4)
+
+        limit.release(limit.acquire(), 200)
+
+        assert limit.limit == pytest.approx(4.25)
+        assert limit.in_flight == 0
+
+    def test_multiplicative_decrease(self) -> None:
+        """Test 429 halves the limit."""
+        limit = AdaptiveLimit(initial=8)
+
+        limit.release(limit.acquire(), 429)
+
+        assert limit.limit == 4
+
+    def test_burst_of_overloads_cuts_once(self) -> None:
+        """Test calls in flight during a cut do not cut again."""
+        limit = AdaptiveLimit(initial=8)
+        generations = [limit.acquire() for _ in range(4)]
+
+        for generation in generations:
+            limit.release(generation, 502)
+
+        assert limit.limit == 4
+
+    def test_respects_floor(self) -> None:
+        """Test the limit never drops below min_limit."""
+        limit = AdaptiveLimit(initial=1, min_limit=1)
+
+        limit.release(limit.acquire(), 429)
+
+        assert limit.limit == 1
+
+    def test_blocks_at_limit(self) -> None:
+        """Test a second acquirer waits until the first releases."""
+        limit = AdaptiveLimit(initial=1)
+        first = limit.acquire()
+        acquired = threading.Event()
+
+        def second() -> None:
+            limit.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        limit.release(first, 200)
+        thread.join(1)
+        assert acquired.is_set()
+
+    @pytest.mark.asyncio
+    async def test_async_cancelled_waiter_frees_queue(self) -> None:
+        """Test a cancelled async waiter does not leak a slot."""
+        limit = AdaptiveLimit(initial=1)
+        first = await limit.async_acquire()
+        task = asyncio.ensure_future(limit.async_acquire())
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        limit.release(first, 200)
+
+        assert limit.in_flight == 0
+
+
+class TestClientConcurrency:
+    """Test the limiter through the client."""
+
+    def test_in_flight_capped_per_family(self, api_key: str) -> None:
+        """Test concurrent chat calls never exceed the family limit."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return httpx.Response(200, json={"content": "ok"})
+
+        limiter = AdaptiveConcurrency(initial=2, max_limit=2)
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            concurrency=limiter,
+        )
+        threads = [
+            threading.Thread(
+                target=client.ai.chat, kwargs={"messages": [{"role": "user", "content": "Hi"}]}
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak <= 2
+        assert limiter.snapshot()["chat"]["in_flight"] == 0
+
+    def test_rate_limit_shrinks_limit(self, api_key: str) -> None:
+        """Test a 429 reduces the chat family limit."""
+        limiter = AdaptiveConcurrency(initial=8)
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(429, json={}))
+            ),
+            retry=RetryPolicy(max_attempts=1),
+            concurrency=limiter,
+        )
+
+        with pytest.raises(RateLimitError):
+            client.ai.chat(messages=[{"role": "user", "content": "Hi"}])
+
+        assert limiter.snapshot()["chat"]["limit"] == 4
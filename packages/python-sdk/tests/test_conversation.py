@@ -0,0 +1,117 @@
+"""Tests for pre-encoded conversation histories."""
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, ContextFitter, Conversation, JSONCodec
+
+
+def history(turns: int) -> List[Dict[str, str]]:
+    messages = [{"role": "system", "content": "Be brief. ✓"}]
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append({"role": "assistant", "content": f"answer {i}"})
+    return messages
+
+
+def httpx_body(payload: Dict[str, Any]) -> bytes:
+    return httpx.Request("POST", "https://x", json=payload).content
+
+
+def recording_client(api_key: str, **kwargs: Any) -> tuple:
+    bodies: List[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        if json.loads(request.content)["stream"]:
+            return httpx.Response(200, content=b'data: {"delta": "hi"}\n\ndata: [DONE]\n\n')
+        return httpx.Response(200, json={"content": "hi"})
+
+    client = Cencori(
+        api_key=api_key,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+    return client, bodies
+
+
+class TestConversation:
+    """Test encoding and reuse of stored messages."""
+
+    def test_body_matches_httpx_encoding(self) -> None:
+        conversation = Conversation(history(3))
+        payload = {"messages": conversation.messages, "model": "gpt-4o", "stream": False}
+
+        assert conversation.body(payload) == httpx_body(payload)
+        assert conversation.encode() == httpx_body(history(3))
+
+    def test_each_message_encoded_once(self) -> None:
+        encoded: List[Any] = []
+
+        class CountingCodec(JSONCodec):
+            def dumps(self, value: Any) -> bytes:
+                encoded.append(value)
+                return super().dumps(value)
+
+        conversation = Conversation(history(2), codec=CountingCodec())
+        for _ in range(3):
+            conversation.body({"messages": conversation.messages, "model": "m"})
+
+        assert len(encoded) == 5 + 3
+
+    def test_selection_reuses_stored_messages(self) -> None:
+        conversation = Conversation(history(2))
+        summary = {"role": "system", "content": "earlier: 1 turn"}
+        selection = [conversation.messages[0], summary] + conversation.messages[3:]
+
+        assert conversation.encode(selection) == httpx_body(selection)
+        assert len(conversation) == 5
+        assert list(conversation)[-1]["content"] == "answer 1"
+
+
+class TestConversationChat:
+    """Test sending a Conversation through ai.chat."""
+
+    def test_chat_sends_same_bytes_as_list(self, api_key: str) -> None:
+        client, bodies = recording_client(api_key)
+
+        client.ai.chat(history(3), model="gpt-4o", temperature=0.2)
+        client.ai.chat(Conversation(history(3)), model="gpt-4o", temperature=0.2)
+        list(client.ai.chat_stream(Conversation(history(3)), model="gpt-4o"))
+
+        assert bodies[0] == bodies[1]
+        assert json.loads(bodies[2])["messages"] == history(3)
+
+    def test_fitter_trims_conversation(self, api_key: str) -> None:
+        client, bodies = recording_client(
+            api_key, context_fitter=ContextFitter(reserve=10, margin=0.0, windows={"m": 40})
+        )
+        conversation = Conversation(history(3))
+        conversation.append({"role": "user", "content": "last"})
+
+        client.ai.chat(conversation, model="m")
+
+        sent = json.loads(bodies[0])["messages"]
+        assert sent[0]["role"] == "system" and sent[-1]["content"] == "last"
+        assert len(sent) < len(conversation)
+
+    @pytest.mark.asyncio
+    async def test_async_chat(self, api_key: str) -> None:
+        bodies: List[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(200, json={"content": "hi"})
+
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        response = await client.ai.chat(Conversation(history(1)), model="gpt-4o")
+
+        assert response.content == "hi"
+        assert json.loads(bodies[0])["messages"] == history(1)
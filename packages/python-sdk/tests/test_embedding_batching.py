@@ -0,0 +1,123 @@
+"""Tests for splitting and parallel dispatch of large embedding inputs."""
+
+import json
+import threading
+import time
+from typing import Any, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, EmbeddingBatching, RetryPolicy
+from cencori.errors import CencoriError
+
+
+class TestSplit:
+    """Test EmbeddingBatching.split."""
+
+    def test_item_limit(self) -> None:
+        batches = EmbeddingBatching(max_items=2).split(["a", "b", "c", "d", "e"])
+
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_token_limit(self) -> None:
+        text = "x" * 36  # ~10 tokens
+        batches = EmbeddingBatching(max_items=100, max_tokens=25).split([text] * 5)
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_oversized_text_sent_alone(self) -> None:
+        big = "x" * 400
+        batches = EmbeddingBatching(max_tokens=10).split(["a", big, "b"])
+
+        assert batches == [["a"], [big], ["b"]]
+
+
+def handler_factory(sent: List[List[str]], fail_first: List[str]) -> Any:
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        with lock:
+            sent.append(texts)
+            if texts[0] in fail_first:
+                fail_first.remove(texts[0])
+                return httpx.Response(503, json={"error": "busy"})
+        time.sleep(0.01)
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"embedding": [float(t)]} for t in texts],
+                "usage": {"total_tokens": len(texts)},
+            },
+        )
+
+    return handler
+
+
+class TestSplitDispatch:
+    """Test AIModule.embeddings with split inputs."""
+
+    def test_reassembles_in_order_and_sums_usage(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler_factory(sent, []))),
+            embedding_batching=EmbeddingBatching(max_items=3, max_parallel=4),
+        )
+        texts = [str(i) for i in range(10)]
+
+        response = client.ai.embeddings(texts)
+
+        assert response.embeddings == [[float(i)] for i in range(10)]
+        assert response.usage.total_tokens == 10
+        assert sorted(len(b) for b in sent) == [1, 3, 3, 3]
+
+    def test_failed_batch_retried_alone(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("cencori.client.time.sleep", lambda s: None)
+        sent: List[List[str]] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(handler_factory(sent, ["3"]))
+            ),
+            embedding_batching=EmbeddingBatching(max_items=3),
+        )
+
+        response = client.ai.embeddings([str(i) for i in range(6)])
+
+        assert response.embeddings == [[float(i)] for i in range(6)]
+        assert sorted(b[0] for b in sent) == ["0", "3", "3"]
+
+    def test_batch_error_raised(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(handler_factory(sent, ["2"]))
+            ),
+            embedding_batching=EmbeddingBatching(max_items=2),
+            retry=RetryPolicy(max_attempts=1),
+        )
+
+        with pytest.raises(CencoriError):
+            client.ai.embeddings([str(i) for i in range(6)])
+        assert len(sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_async(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(handler_factory(sent, []))
+            ),
+            embedding_batching=EmbeddingBatching(max_items=4),
+        )
+
+        response = await client.ai.embeddings([str(i) for i in range(9)])
+
+        assert response.embeddings == [[float(i)] for i in range(9)]
+        assert len(sent) == 3
@@ -0,0 +1,172 @@
+"""Tests for the content-addressed embedding cache."""
+
+import json
+from pathlib import Path
+from typing import Any, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, EmbeddingCache
+from cencori.embedding_cache import text_digest
+from cencori.errors import CencoriError
+
+
+def vector_for(text: str) -> List[float]:
+    return [float(len(text)), 0.5, -1.25]
+
+
+class TestEmbeddingCache:
+    """Test the vector store."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(str(tmp_path))
+        cache.put_many("m", ["a", "bb"], [vector_for("a"), vector_for("bb")])
+
+        assert cache.get_many("m", ["bb", "x", "a"]) == [vector_for("bb"), None, vector_for("a")]
+        assert cache.get_many("other-model", ["a"]) == [None]
+        assert len(cache) == 2
+
+    def test_persists_and_grows(self, tmp_path: Path) -> None:
+        first = EmbeddingCache(str(tmp_path))
+        first.put_many("m", ["a"], [vector_for("a")])
+        first.close()
+
+        second = EmbeddingCache(str(tmp_path))
+        assert second.get_many("m", ["a"]) == [vector_for("a")]
+        second.put_many("m", ["ccc"], [vector_for("ccc")])  # grows the mapped file
+
+        assert second.get_many("m", ["a", "ccc"]) == [vector_for("a"), vector_for("ccc")]
+        assert (tmp_path / "vectors.f32").stat().st_size == 6 * 4
+
+    def test_cached_texts_are_not_appended_again(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(str(tmp_path))
+        cache.put_many("m", ["a", "a"], [vector_for("a"), [9.0, 9.0, 9.0]])
+        cache.put_many("m", ["a", "bb"], [[9.0, 9.0, 9.0], vector_for("bb")])
+
+        assert cache.get_many("m", ["a", "bb"]) == [vector_for("a"), vector_for("bb")]
+        assert (tmp_path / "vectors.f32").stat().st_size == 6 * 4
+
+    def test_torn_write_keeps_offsets_aligned(self, tmp_path: Path) -> None:
+        first = EmbeddingCache(str(tmp_path))
+        first.put_many("m", ["a"], [vector_for("a")])
+        first.close()
+        with (tmp_path / "vectors.f32").open("ab") as f:
+            f.write(b"\x01\x02")  # half a float from a crashed write
+
+        second = EmbeddingCache(str(tmp_path))
+        second.put_many("m", ["bb"], [vector_for("bb")])
+
+        assert second.get_many("m", ["a", "bb"]) == [vector_for("a"), vector_for("bb")]
+
+    def test_torn_tail_is_readable_before_any_write(self, tmp_path: Path) -> None:
+        first = EmbeddingCache(str(tmp_path))
+        first.put_many("m", ["a"], [vector_for("a")])
+        first.close()
+        with (tmp_path / "vectors.f32").open("ab") as f:
+            f.write(b"\x01\x02")
+
+        second = EmbeddingCache(str(tmp_path))
+
+        assert second.get_many("m", ["a", "bb"]) == [vector_for("a"), None]
+
+    def test_entry_past_the_file_is_a_miss(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(str(tmp_path))
+        cache.put_many("m", ["a"], [vector_for("a")])
+        # Indexed by a writer whose vector bytes are not in the file yet.
+        cache._index.execute("INSERT INTO vectors VALUES ('m', ?, 3, 2)", (text_digest("bb"),))
+
+        assert cache.get_many("m", ["a", "bb"]) == [vector_for("a"), None]
+
+    def test_mismatched_lengths(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            EmbeddingCache(str(tmp_path)).put_many("m", ["a"], [])
+
+
+def make_handler(sent: List[Any]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        sent.append(body["input"])
+        return httpx.Response(
+            200,
+            json={
+                "model": body["model"],
+                "data": [{"embedding": vector_for(t)} for t in body["input"]],
+                "usage": {"total_tokens": len(body["input"])},
+            },
+        )
+
+    return handler
+
+
+class TestCachedEmbeddings:
+    """Test AIModule.embeddings with an embedding cache."""
+
+    def test_only_misses_are_sent(self, api_key: str, tmp_path: Path) -> None:
+        sent: List[Any] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(make_handler(sent))),
+            embedding_cache=EmbeddingCache(str(tmp_path)),
+        )
+
+        client.ai.embeddings(["a", "bb"])
+        response = client.ai.embeddings(["bb", "ccc", "a", "ccc"])
+
+        assert sent == [["a", "bb"], ["ccc"]]
+        assert response.embeddings == [vector_for(t) for t in ["bb", "ccc", "a", "ccc"]]
+        assert response.usage.total_tokens == 1
+
+    def test_all_hits_skip_the_network(self, api_key: str, tmp_path: Path) -> None:
+        sent: List[Any] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(make_handler(sent))),
+            embedding_cache=EmbeddingCache(str(tmp_path)),
+        )
+        client.ai.embeddings("a")
+
+        response = client.ai.embeddings("a", model="text-embedding-3-small")
+
+        assert len(sent) == 1
+        assert response.embeddings == [vector_for("a")]
+        assert response.usage.total_tokens == 0
+
+    def test_cache_false_bypasses(self, api_key: str, tmp_path: Path) -> None:
+        sent: List[Any] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(make_handler(sent))),
+            embedding_cache=EmbeddingCache(str(tmp_path)),
+        )
+
+        client.ai.embeddings(["a"], cache=False)
+        client.ai.embeddings(["a"])
+
+        assert len(sent) == 2
+
+    def test_short_response_is_an_error(self, api_key: str, tmp_path: Path) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"data": []}))
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=transport),
+            embedding_cache=EmbeddingCache(str(tmp_path)),
+        )
+
+        with pytest.raises(CencoriError):
+            client.ai.embeddings(["a"])
+
+    @pytest.mark.asyncio
+    async def test_async(self, api_key: str, tmp_path: Path) -> None:
+        sent: List[Any] = []
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(make_handler(sent))),
+            embedding_cache=EmbeddingCache(str(tmp_path)),
+        )
+
+        await client.ai.embeddings(["a", "bb"])
+        response = await client.ai.embeddings(["bb", "x"])
+
+        assert sent == [["a", "bb"], ["x"]]
+        assert response.embeddings == [vector_for("bb"), vector_for("x")]
@@ -0,0 +1,194 @@
+"""Tests for the bounded-concurrency fan-out helpers."""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, RetryPolicy
+from cencori.errors import CencoriError
+from cencori.fanout import async_run_many, run_many
+
+
+class TestRunMany:
+    """Test the sync fan-out runner."""
+
+    def test_ordered_results_and_errors(self) -> None:
+        def work(n: int) -> int:
+            time.sleep(0.01 * (5 - n))
+            if n == 3:
+                raise ValueError("bad item")
+            return n * n
+
+        results = list(run_many(work, range(5), concurrency=5))
+
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+        assert [r.value for r in results if r.ok] == [0, 1, 4, 16]
+        assert isinstance(results[3].error, ValueError)
+
+    def test_unordered_yields_as_finished(self) -> None:
+        def work(n: int) -> int:
+            time.sleep(0.05 if n == 0 else 0.0)
+            return n
+
+        results = list(run_many(work, range(4), concurrency=4, ordered=False))
+
+        assert results[-1].index == 0
+        assert sorted(r.index for r in results) == [0, 1, 2, 3]
+
+    def test_respects_concurrency(self) -> None:
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def work(n: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return n
+
+        list(run_many(work, range(20), concurrency=3))
+
+        assert peak <= 3
+
+    def test_progress(self) -> None:
+        calls: List[Tuple[int, int]] = []
+
+        list(run_many(lambda n: n, range(3), on_progress=lambda d, t: calls.append((d, t))))
+
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+    def test_rejects_zero_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            list(run_many(lambda n: n, [1], concurrency=0))
+
+
+class TestAsyncRunMany:
+    """Test the async fan-out runner."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_and_ordered(self) -> None:
+        active = 0
+        peak = 0
+
+        async def work(n: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01 * (n % 3))
+            active -= 1
+            if n == 4:
+                raise CencoriError("boom")
+            return n
+
+        results = [r async for r in async_run_many(work, range(10), concurrency=4)]
+
+        assert peak <= 4
+        assert [r.index for r in results] == list(range(10))
+        assert isinstance(results[4].error, CencoriError)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_in_flight(self) -> None:
+        cancelled = 0
+
+        async def work(n: int) -> int:
+            nonlocal cancelled
+            if n == 0:
+                return n
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return n
+
+        stream = async_run_many(work, range(5), concurrency=3)
+        first = await stream.__anext__()
+        await stream.aclose()  # type: ignore[attr-defined]
+
+        assert first.index == 0
+        assert cancelled == 2
+
+
+def chat_handler(request: httpx.Request) -> httpx.Response:
+    content = json.loads(request.content)["messages"][0]["content"]
+    if content == "fail":
+        return httpx.Response(400, json={"error": "bad request"})
+    return httpx.Response(200, json={"content": content.upper(), "model": "m"})
+
+
+class TestModuleFanout:
+    """Test the *_many module methods."""
+
+    def test_chat_many(self, api_key: str) -> None:
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(chat_handler)),
+        )
+        prompts = ["a", "fail", "c"]
+
+        results = list(
+            client.ai.chat_many(
+                [{"messages": [{"role": "user", "content": p}]} for p in prompts],
+                concurrency=2,
+            )
+        )
+
+        assert results[0].value is not None and results[0].value.content == "A"
+        assert isinstance(results[1].error, CencoriError)
+        assert results[2].value is not None and results[2].value.content == "C"
+
+    def test_embeddings_many(self, api_key: str) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            text = json.loads(request.content)["input"]
+            return httpx.Response(200, json={"data": [{"embedding": [float(len(text))]}]})
+
+        client = Cencori(
+            api_key=api_key, http_client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+
+        results = list(client.ai.embeddings_many(["a", "bb", "ccc"]))
+
+        assert [r.value.embeddings[0][0] for r in results if r.value] == [1.0, 2.0, 3.0]
+
+    def test_vision_and_documents_many(self, api_key: str) -> None:
+        seen: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"text": "ok"})
+
+        client = Cencori(
+            api_key=api_key, http_client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+
+        vision = list(client.vision.analyze_many([{"image_url": "https://x/1.png"}]))
+        docs = list(client.documents.extract_many([{"document_url": "https://x/1.pdf"}]))
+
+        assert vision[0].value == {"text": "ok"} and docs[0].value == {"text": "ok"}
+        assert seen == ["/api/ai/vision", "/api/ai/documents/extract"]
+
+    @pytest.mark.asyncio
+    async def test_async_chat_many(self, api_key: str) -> None:
+        transport = httpx.MockTransport(chat_handler)
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=transport),
+            retry=RetryPolicy(max_attempts=1),
+        )
+        requests: List[Dict[str, Any]] = [
+            {"messages": [{"role": "user", "content": p}]} for p in ["x", "fail", "y"]
+        ]
+
+        results = [r async for r in client.ai.chat_many(requests, concurrency=2)]
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[2].value is not None and results[2].value.content == "Y"
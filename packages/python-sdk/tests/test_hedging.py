@@ -0,0 +1,234 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import json
+import threading
+from typing import List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, HedgePolicy, RetryPolicy
+from cencori.errors import AuthenticationError, ProviderError
+from cencori.hedging import Hedger
+from cencori.memory import SearchMemoryOptions
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+BACKUP = "https://backup.test"
+
+
+def chat_body(request: httpx.Request) -> dict:
+    model = json.loads(request.content)["model"]
+    return {"content": f"{request.url.host}:{model}", "model": model}
+
+
+class SlowPrimary:
+    """Transport whose requests to the primary host block until released."""
+
+    def __init__(self) -> None:
+        self.calls: List[httpx.Request] = []
+        self.release = threading.Event()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request)
+        if request.url.host != "backup.test":
+            self.release.wait(5)
+        if request.url.path == "/api/ai/embeddings":
+            return httpx.Response(200, json={"data": [{"embedding": [0.5]}], "model": "m"})
+        return httpx.Response(200, json=chat_body(request))
+
+
+def hedged_client(api_key: str, handler: object, **policy: object) -> Cencori:
+    options: dict = {"initial_delay": 0.02, "base_url": BACKUP, **policy}
+    return Cencori(
+        api_key=api_key,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),  # type: ignore[arg-type]
+        hedging=HedgePolicy(**options),
+    )
+
+
+class TestHedger:
+    """Test delay selection and the hedge budget."""
+
+    def test_delay_from_percentile(self) -> None:
+        hedger = Hedger(HedgePolicy(initial_delay=1.0, min_samples=10, percentile=0.9))
+        key = ("/api/ai/chat", "m")
+        for i in range(9):
+            hedger.record(key, i / 10)
+
+        assert hedger.delay(key) == 1.0
+        hedger.record(key, 0.9)
+        assert hedger.delay(key) == pytest.approx(0.9)
+        assert hedger.delay(("/api/ai/chat", "other")) == 1.0
+
+    def test_alternate_model_for_chat_only(self) -> None:
+        hedger = Hedger(HedgePolicy(alternate_models={"big": "small"}))
+
+        assert hedger.alternate("/api/ai/chat", {"model": "big"}) == {"model": "small"}
+        assert hedger.alternate("/api/ai/embeddings", {"model": "big"}) == {"model": "big"}
+
+    def test_budget(self) -> None:
+        hedger = Hedger(HedgePolicy(budget=0.5, burst=1.0))
+
+        hedger._start()
+        assert hedger._take_token()
+        hedger._start()
+        assert not hedger._take_token()
+        hedger._start()
+        assert hedger._take_token()
+
+
+class TestHedgedCalls:
+    """Test hedging through the client."""
+
+    def test_slow_chat_is_hedged(self, api_key: str) -> None:
+        transport = SlowPrimary()
+        client = hedged_client(api_key, transport, alternate_models={"gpt-4o": "gpt-4o-mini"})
+
+        response = client.ai.chat(MESSAGES, model="gpt-4o", temperature=0)
+        transport.release.set()
+
+        assert response.content == "backup.test:gpt-4o-mini"
+        assert [c.url.host for c in transport.calls] == ["cencori.com", "backup.test"]
+        assert client._hedger is not None and client._hedger.hedge_wins == 1
+        client.close()
+
+    def test_only_the_hedge_uses_the_pool(self, api_key: str) -> None:
+        threads: List[str] = []
+        release = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            threads.append(threading.current_thread().name)
+            if request.url.host != "backup.test":
+                release.wait(5)
+            return httpx.Response(200, json=chat_body(request))
+
+        client = hedged_client(api_key, handler, max_workers=1, budget=1.0)
+
+        for _ in range(2):
+            client.ai.chat(MESSAGES, model="gpt-4o", temperature=0)
+        release.set()
+
+        assert [name.startswith("cencori-hedge") for name in threads] == [False, True] * 2
+        client.close()
+
+    def test_fast_call_not_hedged(self, api_key: str) -> None:
+        calls: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=chat_body(request))
+
+        client = hedged_client(api_key, handler, initial_delay=1.0)
+
+        client.ai.chat(MESSAGES, model="gpt-4o", temperature=0)
+
+        assert len(calls) == 1
+        assert client._hedger is not None and client._hedger.hedges == 0
+
+    def test_non_deterministic_chat_not_hedged(self, api_key: str) -> None:
+        transport = SlowPrimary()
+        transport.release.set()
+        client = hedged_client(api_key, transport)
+
+        client.ai.chat(MESSAGES, model="gpt-4o", temperature=0.7)
+
+        assert len(transport.calls) == 1
+
+    def test_embeddings_keep_their_model(self, api_key: str) -> None:
+        transport = SlowPrimary()
+        client = hedged_client(api_key, transport, alternate_models={"m": "other"})
+
+        response = client.ai.embeddings("hi", model="m")
+        transport.release.set()
+
+        assert response.embeddings == [[0.5]]
+        assert [json.loads(c.content)["model"] for c in transport.calls] == ["m", "m"]
+
+    def test_memory_search_is_hedged(self, api_key: str) -> None:
+        transport = SlowPrimary()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            transport.calls.append(request)
+            if request.url.host != "backup.test":
+                transport.release.wait(5)
+            return httpx.Response(200, json={"results": [], "query": request.url.host})
+
+        client = hedged_client(api_key, handler)
+
+        client.memory.search(SearchMemoryOptions(namespace="n", query="q"))
+        transport.release.set()
+
+        assert [c.url.host for c in transport.calls] == ["cencori.com", "backup.test"]
+
+    def test_early_failure_raised_without_hedge(self, api_key: str) -> None:
+        calls: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(401, json={"error": "no"})
+
+        client = hedged_client(api_key, handler, initial_delay=1.0)
+
+        with pytest.raises(AuthenticationError):
+            client.ai.chat(MESSAGES, model="gpt-4o", temperature=0)
+
+        assert len(calls) == 1
+
+    def test_hedge_failure_waits_for_primary(self, api_key: str) -> None:
+        release = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "backup.test":
+                release.set()
+                return httpx.Response(400, json={"error": "bad"})
+            release.wait(5)
+            return httpx.Response(200, json=chat_body(request))
+
+        client = hedged_client(api_key, handler)
+
+        response = client.ai.chat(MESSAGES, model="gpt-4o", temperature=0)
+
+        assert response.content == "cencori.com:gpt-4o"
+
+    @pytest.mark.asyncio
+    async def test_async_loser_cancelled(self, api_key: str) -> None:
+        cancelled: List[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host != "backup.test":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(request.url.host)
+                    raise
+            return httpx.Response(200, json=chat_body(request))
+
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            hedging=HedgePolicy(initial_delay=0.02, base_url=BACKUP),
+        )
+
+        response = await client.ai.chat(MESSAGES, model="gpt-4o", temperature=0)
+        await asyncio.sleep(0)
+
+        assert response.content == "backup.test:gpt-4o"
+        assert cancelled == ["cencori.com"]
+
+    @pytest.mark.asyncio
+    async def test_async_both_fail(self, api_key: str) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host != "backup.test":
+                await asyncio.sleep(0.05)
+            return httpx.Response(502, json={"error": "down"})
+
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            hedging=HedgePolicy(initial_delay=0.01, base_url=BACKUP),
+            retry=RetryPolicy(max_attempts=1),
+        )
+
+        with pytest.raises(ProviderError):
+            await client.ai.embeddings("hi", model="m")
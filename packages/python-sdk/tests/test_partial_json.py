@@ -0,0 +1,134 @@
+"""Tests for incremental JSON parsing and streaming structured output."""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, GenerateObjectRequest
+from cencori.errors import CencoriError
+from cencori.partial_json import PartialJSONParser
+
+DOCUMENT = {
+    "title": 'Say "hi" \\ 😀',
+    "count": -12.5e3,
+    "tags": ["a", "b", {"nested": [True, False, None]}],
+    "empty": {},
+}
+
+
+def snapshots(text: str, step: int = 1) -> List[Any]:
+    parser = PartialJSONParser()
+    values = []
+    for end in range(step, len(text) + step, step):
+        value = parser.update(text[:end])
+        if value is not None:
+            values.append(value)
+    return values
+
+
+class TestPartialJSONParser:
+    """Test PartialJSONParser."""
+
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("step", [1, 3, 17])
+    def test_every_prefix_ends_with_document(self, ensure_ascii: bool, step: int) -> None:
+        text = json.dumps(DOCUMENT, ensure_ascii=ensure_ascii, indent=1)
+
+        values = snapshots(text, step)
+
+        assert values[-1] == DOCUMENT
+        assert all(isinstance(v, dict) for v in values)
+
+    def test_partial_values(self) -> None:
+        parser = PartialJSONParser()
+
+        assert parser.update('{"title": "Hel') == {"title": "Hel"}
+        assert parser.update('{"title": "Hello", "n') == {"title": "Hello"}
+        assert parser.update('{"title": "Hello", "n": 4') is None  # number may continue
+        assert parser.update('{"title": "Hello", "n": 42,') == {"title": "Hello", "n": 42}
+        assert parser.update('{"title": "Hello", "n": 42, "xs": [1, "\\u00') == {
+            "title": "Hello",
+            "n": 42,
+            "xs": [1, ""],
+        }
+
+    def test_restarts_when_text_is_replaced(self) -> None:
+        parser = PartialJSONParser()
+        parser.update('{"a": "x')
+
+        assert parser.update('{"b": 1}') == {"b": 1}
+
+
+def sse(events: List[Dict[str, Any]]) -> bytes:
+    body = b"".join(b"data: " + json.dumps(e).encode() + b"\n\n" for e in events)
+    return body + b"data: [DONE]\n\n"
+
+
+def fragment_events(arguments: str, size: int) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = [
+        {"delta": "", "toolCalls": [
+            {"index": 0, "id": "c1", "function": {"name": "generate_object", "arguments": ""}}
+        ]}
+    ]
+    for i in range(0, len(arguments), size):
+        events.append(
+            {"delta": "", "toolCalls": [
+                {"index": 0, "function": {"arguments": arguments[i : i + size]}}
+            ]}
+        )
+    events.append({"usage": {"prompt_tokens": 3, "completion_tokens": 7, "total_tokens": 10}})
+    return events
+
+
+PARAMS = GenerateObjectRequest(model="gpt-4o", prompt="x", schema={"type": "object"})
+
+
+class TestGenerateObjectStream:
+    """Test generate_object_stream."""
+
+    def test_yields_growing_objects_then_final(self, api_key: str) -> None:
+        sent: List[Dict[str, Any]] = []
+        body = sse(fragment_events(json.dumps(DOCUMENT), 5))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, content=body)
+
+        client = Cencori(
+            api_key=api_key, http_client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+
+        chunks = list(client.ai.generate_object_stream(PARAMS))
+
+        assert sent[0]["stream"] is True
+        assert chunks[0].object == {}
+        assert {"title": 'Say "hi'} in [c.object for c in chunks]
+        assert all("\ud83d" not in (c.object or {}).get("title", "") for c in chunks)
+        assert [c.done for c in chunks].count(True) == 1
+        assert chunks[-1].done and chunks[-1].object == DOCUMENT
+        assert chunks[-1].usage is not None and chunks[-1].usage.total_tokens == 10
+
+    def test_invalid_final_json(self, api_key: str) -> None:
+        body = sse(fragment_events('{"a": 1', 3))
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        client = Cencori(api_key=api_key, http_client=httpx.Client(transport=transport))
+
+        with pytest.raises(CencoriError, match="parse structured output"):
+            list(client.ai.generate_object_stream(PARAMS))
+
+    @pytest.mark.asyncio
+    async def test_async_whole_call(self, api_key: str) -> None:
+        call = {"id": "c1", "function": {"name": "generate_object", "arguments": '{"a": [1]}'}}
+        body = sse([{"delta": "", "finish_reason": "tool_calls", "toolCalls": [call]}])
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        client = AsyncCencori(
+            api_key=api_key, async_http_client=httpx.AsyncClient(transport=transport)
+        )
+
+        objects: List[Optional[Dict[str, Any]]] = [
+            c.object async for c in client.ai.generate_object_stream(PARAMS)
+        ]
+
+        assert objects == [{"a": [1]}, {"a": [1]}]
@@ -0,0 +1,186 @@
+"""Tests for the multi-model chat race."""
+
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, RetryPolicy
+from cencori.errors import ProviderError
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+
+def sse(*events: Any) -> List[bytes]:
+    return [f"data: {json.dumps(event)}\n\n".encode() for event in events] + [b"data: [DONE]\n\n"]
+
+
+def reply(model: str) -> List[bytes]:
+    return sse({"delta": model}, {"delta": "!"}, {"delta": "", "finish_reason": "stop"})
+
+
+class Body(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that waits for ``gate`` before sending and records being closed."""
+
+    def __init__(self, chunks: List[bytes], gate: Any = None) -> None:
+        self.chunks = chunks
+        self.gate = gate
+        self.closed = threading.Event()
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.gate is not None:
+            self.gate.wait(5)
+        yield from self.chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if self.gate is not None:
+            await asyncio.sleep(5)
+        for chunk in self.chunks:
+            yield chunk
+
+    def close(self) -> None:
+        self.closed.set()
+
+    async def aclose(self) -> None:
+        self.closed.set()
+
+
+def race_client(
+    api_key: str, bodies: Dict[str, Body], statuses: Optional[Dict[str, int]] = None
+) -> Cencori:
+    def handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        return httpx.Response((statuses or {}).get(model, 200), stream=bodies[model])
+
+    return Cencori(
+        api_key=api_key,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry=RetryPolicy(max_attempts=1),
+    )
+
+
+def async_race_client(api_key: str, bodies: Dict[str, Body]) -> AsyncCencori:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=bodies[json.loads(request.content)["model"]])
+
+    return AsyncCencori(
+        api_key=api_key,
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+class TestChatRace:
+    """Test AIModule.chat_race."""
+
+    def test_fastest_complete_response_wins(self, api_key: str) -> None:
+        gate = threading.Event()
+        slow = Body(reply("slow"), gate)
+        client = race_client(api_key, {"fast": Body(reply("fast")), "slow": slow})
+
+        result = client.ai.chat_race(MESSAGES, models=["slow", "fast"])
+        gate.set()
+
+        assert result.model == "fast"
+        assert result.value.content == "fast!"
+        assert result.value.finish_reason == "stop"
+        assert result.margin_s is None
+        assert slow.closed.wait(5)
+        assert client.router.scores()["fast"].requests == 1
+
+    def test_stream_returns_winner_from_first_token(self, api_key: str) -> None:
+        gate = threading.Event()
+        slow = Body(reply("slow"), gate)
+        client = race_client(api_key, {"fast": Body(reply("fast")), "slow": slow})
+
+        result = client.ai.chat_race(MESSAGES, models=["slow", "fast"], stream=True)
+        gate.set()
+
+        assert result.model == "fast"
+        assert "".join(chunk.delta for chunk in result.value) == "fast!"
+        assert result.value.timing.tokens == 2
+        assert slow.closed.wait(5)
+        assert "fast" not in client.router.scores()
+
+    def test_grace_measures_margin(self, api_key: str) -> None:
+        client = race_client(api_key, {"a": Body(reply("a")), "b": Body(reply("b"))})
+
+        result = client.ai.chat_race(MESSAGES, models=["a", "b"], grace=5.0)
+
+        assert result.margin_s is not None and result.margin_s >= 0
+        assert result.model in ("a", "b")
+
+    def test_stream_closes_runner_up(self, api_key: str) -> None:
+        bodies = {"a": Body(reply("a")), "b": Body(reply("b"))}
+        client = race_client(api_key, bodies)
+
+        result = client.ai.chat_race(MESSAGES, models=["a", "b"], stream=True, grace=0.2)
+
+        assert result.margin_s is not None
+        assert bodies["b" if result.model == "a" else "a"].closed.is_set()
+        assert not bodies[result.model].closed.is_set()
+
+    def test_failures_are_reported(self, api_key: str) -> None:
+        client = race_client(
+            api_key,
+            {"down": Body([]), "broken": Body(sse({"error": "boom"})), "up": Body(reply("up"))},
+            statuses={"down": 502},
+        )
+
+        result = client.ai.chat_race(MESSAGES, models=["down", "broken", "up"], grace=5.0)
+
+        assert result.model == "up"
+        assert set(result.errors) == {"down", "broken"}
+        assert isinstance(result.errors["broken"], ProviderError)
+        assert client.router.scores()["down"].failures == 1
+
+    def test_all_fail_raises_first_candidate_error(self, api_key: str) -> None:
+        client = race_client(
+            api_key,
+            {"down": Body([]), "broken": Body(sse({"error": "boom"}))},
+            statuses={"down": 502},
+        )
+
+        with pytest.raises(ProviderError) as exc_info:
+            client.ai.chat_race(MESSAGES, models=["broken", "down"])
+
+        assert exc_info.value.message == "boom"
+
+    def test_requires_models(self, api_key: str) -> None:
+        with pytest.raises(ValueError):
+            race_client(api_key, {}).ai.chat_race(MESSAGES, models=[])
+
+    @pytest.mark.asyncio
+    async def test_async_losers_cancelled(self, api_key: str) -> None:
+        slow = Body(reply("slow"), gate=True)
+        client = async_race_client(api_key, {"fast": Body(reply("fast")), "slow": slow})
+
+        result = await client.ai.chat_race(MESSAGES, models=["slow", "fast"])
+
+        assert result.model == "fast"
+        assert result.value.content == "fast!"
+        assert slow.closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self, api_key: str) -> None:
+        slow = Body(reply("slow"), gate=True)
+        client = async_race_client(api_key, {"fast": Body(reply("fast")), "slow": slow})
+
+        result = await client.ai.chat_race(MESSAGES, models=["slow", "fast"], stream=True)
+
+        assert result.model == "fast"
+        assert slow.closed.is_set()
+        assert "".join([chunk.delta async for chunk in result.value]) == "fast!"
+
+    @pytest.mark.asyncio
+    async def test_async_stream_closes_runner_up(self, api_key: str) -> None:
+        bodies = {"a": Body(reply("a")), "b": Body(reply("b"))}
+        client = async_race_client(api_key, bodies)
+
+        result = await client.ai.chat_race(MESSAGES, models=["a", "b"], stream=True, grace=0.2)
+
+        assert result.margin_s is not None
+        assert bodies["b" if result.model == "a" else "a"].closed.is_set()
+        assert not bodies[result.model].closed.is_set()
@@ -0,0 +1,98 @@
+"""Tests for the local token-bucket rate limiter."""
+
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from cencori import Cencori, RateLimit, RateLimiter
+from cencori.ratelimit import TokenBucket, estimate_tokens
+
+
+class TestTokenBucket:
+    """Test bucket accounting."""
+
+    def test_within_budget_does_not_wait(self) -> None:
+        bucket = TokenBucket(per_minute=60)
+
+        assert bucket.reserve(1) == 0.0
+
+    def test_empty_bucket_waits_for_refill(self) -> None:
+        """Test overdrawing returns the time to refill the debt."""
+        bucket = TokenBucket(per_minute=60)
+        bucket.reserve(60)
+
+        assert bucket.reserve(2) == pytest.approx(2.0, abs=0.01)
+
+    def test_refund_restores_budget(self) -> None:
+        bucket = TokenBucket(per_minute=60)
+        bucket.reserve(60)
+        bucket.refund(60)
+
+        assert bucket.reserve(1) == 0.0
+
+
+class TestRateLimiter:
+    """Test keyed budgets."""
+
+    def test_model_override(self) -> None:
+        """Test a per-model budget overrides the default."""
+        limiter = RateLimiter(
+            default=RateLimit(requests_per_minute=1000),
+            models={"gpt-4o": RateLimit(requests_per_minute=1)},
+        )
+
+        assert limiter._reserve("key", "gpt-4o", 0) == 0.0
+        assert limiter._reserve("key", "gpt-4o", 0) > 0
+        assert limiter._reserve("key", "gemini-2.5-flash", 0) == 0.0
+
+    def test_keys_have_separate_buckets(self) -> None:
+        limiter = RateLimiter(default=RateLimit(requests_per_minute=1))
+
+        assert limiter._reserve("key-a", "m", 0) == 0.0
+        assert limiter._reserve("key-b", "m", 0) == 0.0
+
+    def test_token_budget(self) -> None:
+        """Test the tokens-per-minute bucket paces large prompts."""
+        limiter = RateLimiter(default=RateLimit(tokens_per_minute=600))
+
+        assert limiter._reserve("key", "m", 600) == 0.0
+        assert limiter._reserve("key", "m", 10) == pytest.approx(1.0, abs=0.01)
+
+    def test_estimate_tokens(self) -> None:
+        messages = [{"role": "user", "content": "x" * 400}]
+
+        assert estimate_tokens(messages, max_tokens=50) == 100 + 4 + 50
+
+
+class TestChatPacing:
+    """Test chat waits on an empty bucket instead of failing."""
+
+    def test_chat_waits_when_bucket_empty(
+        self, api_key: str, mock_chat_response: Dict[str, Any]
+    ) -> None:
+        limiter = RateLimiter(default=RateLimit(requests_per_minute=1))
+        client = Cencori(api_key=api_key, rate_limiter=limiter)
+
+        with patch.object(client, "_request", return_value=mock_chat_response):
+            with patch("cencori.ratelimit.time.sleep") as sleep:
+                client.ai.chat(messages=[{"role": "user", "content": "Hi"}])
+                client.ai.chat(messages=[{"role": "user", "content": "Hi"}])
+
+        sleep.assert_called_once()
+        assert sleep.call_args.args[0] == pytest.approx(60.0, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_async_chat_waits(self, api_key: str, mock_chat_response: Dict[str, Any]) -> None:
+        limiter = RateLimiter(default=RateLimit(requests_per_minute=1))
+        client = Cencori(api_key=api_key, rate_limiter=limiter)
+
+        async def fake_request(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            return mock_chat_response
+
+        with patch.object(client, "_async_request", side_effect=fake_request):
+            with patch("cencori.ratelimit.asyncio.sleep") as sleep:
+                await client.ai.async_chat(messages=[{"role": "user", "content": "Hi"}])
+                await client.ai.async_chat(messages=[{"role": "user", "content": "Hi"}])
+
+        sleep.assert_called_once()
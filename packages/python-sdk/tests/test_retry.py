@@ -0,0 +1,158 @@
+"""Tests for the retry policy."""
+
+from typing import Iterator, List
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from cencori import Cencori, RetryPolicy
+from cencori.errors import ProviderError, RateLimitError
+
+CHAT = {"content": "Hi", "model": "gpt-4o"}
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def sequence_client(api_key: str, responses: List[object], **kwargs: object) -> tuple:
+    """Client whose transport replays ``responses`` (Response or exception) in order."""
+    calls: List[httpx.Request] = []
+    it: Iterator[object] = iter(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        item = next(it)
+        if isinstance(item, Exception):
+            raise item
+        return item  # type: ignore[return-value]
+
+    client = Cencori(
+        api_key=api_key,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,  # type: ignore[arg-type]
+    )
+    return client, calls
+
+
+class TestRetryPolicy:
+    """Test backoff computation."""
+
+    def test_full_jitter_bounds(self) -> None:
+        """Test backoff stays within the exponential ceiling."""
+        policy = RetryPolicy(initial_backoff=1.0, max_backoff=5.0)
+
+        for attempt in range(6):
+            assert 0 <= policy.backoff(attempt) <= min(5.0, 2 ** attempt)
+
+    def test_retry_after_seconds(self) -> None:
+        """Test Retry-After overrides the computed backoff."""
+        state = RetryPolicy().start()
+        response = httpx.Response(429, headers={"Retry-After": "3"})
+
+        assert state.next_delay(response) == 3.0
+
+    def test_non_retryable_status(self) -> None:
+        """Test client errors are not retried."""
+        state = RetryPolicy().start()
+
+        assert state.next_delay(httpx.Response(400)) is None
+
+    def test_attempts_exhausted(self) -> None:
+        """Test no delay is returned once max_attempts is reached."""
+        state = RetryPolicy(max_attempts=2).start()
+        response = httpx.Response(502)
+
+        assert state.next_delay(response) is not None
+        assert state.next_delay(response) is None
+
+    def test_deadline_stops_retries(self) -> None:
+        """Test a Retry-After beyond the deadline is not waited for."""
+        state = RetryPolicy(deadline=1.0).start()
+        response = httpx.Response(429, headers={"Retry-After": "30"})
+
+        assert state.next_delay(response) is None
+
+
+class TestClientRetries:
+    """Test retries through the client."""
+
+    def test_retries_then_succeeds(self, api_key: str) -> None:
+        """Test a 429 followed by success returns the response."""
+        client, calls = sequence_client(
+            api_key,
+            [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json=CHAT)],
+        )
+
+        with patch("cencori.client.time.sleep") as sleep:
+            response = client.ai.chat(messages=MESSAGES)
+
+        assert response.content == "Hi"
+        assert len(calls) == 2
+        sleep.assert_called_once_with(0.0)
+
+    def test_retries_connect_timeout(self, api_key: str) -> None:
+        """Test connect timeouts are retried."""
+        client, calls = sequence_client(
+            api_key,
+            [httpx.ConnectTimeout("timed out"), httpx.Response(200, json=CHAT)],
+        )
+
+        with patch("cencori.client.time.sleep"):
+            client.ai.chat(messages=MESSAGES)
+
+        assert len(calls) == 2
+
+    def test_raises_after_exhausting_attempts(self, api_key: str) -> None:
+        """Test the final error surfaces once attempts run out."""
+        client, calls = sequence_client(
+            api_key,
+            [httpx.Response(502, json={}), httpx.Response(502, json={})],
+            retry=RetryPolicy(max_attempts=2),
+        )
+
+        with patch("cencori.client.time.sleep"):
+            with pytest.raises(ProviderError):
+                client.ai.chat(messages=MESSAGES)
+
+        assert len(calls) == 2
+
+    def test_rate_limit_error_carries_retry_after(self, api_key: str) -> None:
+        """Test RateLimitError exposes the server's Retry-After."""
+        client, _ = sequence_client(
+            api_key,
+            [httpx.Response(429, headers={"Retry-After": "7"}, json={})],
+            retry=RetryPolicy(max_attempts=1),
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            client.ai.chat(messages=MESSAGES)
+
+        assert exc_info.value.retry_after == 7.0
+
+    def test_stream_retries_before_first_byte(self, api_key: str) -> None:
+        """Test a stream that fails to open is retried."""
+        body = b'data: {"delta": "Hi"}\n\ndata: [DONE]\n\n'
+        client, calls = sequence_client(
+            api_key,
+            [httpx.Response(503, json={}), httpx.Response(200, content=body)],
+        )
+
+        with patch("cencori.client.time.sleep"):
+            chunks = list(client.ai.chat_stream(messages=MESSAGES))
+
+        assert [c.delta for c in chunks] == ["Hi"]
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_retries(self, api_key: str) -> None:
+        """Test the async path retries too."""
+        responses = iter([httpx.Response(502, json={}), httpx.Response(200, json=CHAT)])
+        transport = httpx.MockTransport(lambda request: next(responses))
+        client = Cencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=transport),
+            retry=RetryPolicy(initial_backoff=0.0),
+        )
+
+        response = await client.ai.async_chat(messages=MESSAGES)
+
+        assert response.content == "Hi"
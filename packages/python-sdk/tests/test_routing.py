@@ -0,0 +1,236 @@
+"""Tests for the latency-aware model router."""
+
+import json
+import time
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, ContextFitter, ModelRouter, ResponseCache
+from cencori.errors import (
+    AuthenticationError,
+    ContextWindowError,
+    ProviderError,
+    RateLimitError,
+)
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def routed_client(api_key: str, statuses: Dict[str, List[int]], **kwargs: object) -> tuple:
+    """Client answering each model with its queued statuses (200 once they run out)."""
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        calls.append(model)
+        queue = statuses.get(model, [])
+        status = queue.pop(0) if queue else 200
+        return httpx.Response(status, json={"content": model, "model": model})
+
+    client = Cencori(
+        api_key=api_key,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        router=ModelRouter(explore=0.0),
+        **kwargs,  # type: ignore[arg-type]
+    )
+    return client, calls
+
+
+class TestModelRouter:
+    """Test scoring and ordering."""
+
+    def test_untried_models_first_in_candidate_order(self) -> None:
+        router = ModelRouter(explore=0.0)
+        router.record("a", 0.5, ok=True)
+
+        assert router.order(["a", "b", "c"]) == ["b", "c", "a"]
+
+    def test_fastest_first(self) -> None:
+        router = ModelRouter(explore=0.0)
+        router.record("slow", 2.0, ok=True)
+        router.record("fast", 0.2, ok=True)
+
+        assert router.order(["slow", "fast"]) == ["fast", "slow"]
+
+    def test_ewma(self) -> None:
+        router = ModelRouter(alpha=0.5, explore=0.0)
+        router.record("m", 1.0, ok=True)
+        router.record("m", 3.0, ok=True)
+        router.record("m", None, ok=False)
+
+        score = router.scores()["m"]
+        assert score.latency_s == pytest.approx(2.0)
+        assert score.error_rate == pytest.approx(0.5)
+        assert score.requests == 3 and score.failures == 1
+        assert score.score == pytest.approx(2.0 * (1 + 4.0 * 0.5))
+
+    def test_errors_outweigh_speed(self) -> None:
+        router = ModelRouter(explore=0.0)
+        router.record("flaky", 0.1, ok=True)
+        router.record("flaky", None, ok=False)
+        router.record("steady", 0.2, ok=True)
+
+        assert router.order(["flaky", "steady"]) == ["steady", "flaky"]
+
+    def test_unhealthy_until_cooldown(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr("cencori.routing.time.monotonic", lambda: now[0])
+        router = ModelRouter(alpha=1.0, cooldown=10.0, explore=0.0)
+        router.record("down", 0.1, ok=True)
+        router.record("down", None, ok=False)
+        router.record("up", 5.0, ok=True)
+
+        assert router.scores()["down"].healthy is False
+        assert router.order(["down", "up"]) == ["up", "down"]
+
+        now[0] = 111.0
+        assert router.scores()["down"].healthy is True
+
+    def test_explore(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("cencori.routing.random.random", lambda: 0.0)
+        monkeypatch.setattr("cencori.routing.random.randrange", lambda lo, hi: hi - 1)
+        router = ModelRouter(explore=0.1)
+        for model, latency in (("a", 0.1), ("b", 0.2), ("c", 0.3)):
+            router.record(model, latency, ok=True)
+
+        assert router.order(["a", "b", "c"]) == ["c", "a", "b"]
+
+    def test_requires_candidates(self) -> None:
+        with pytest.raises(ValueError):
+            ModelRouter().order([])
+
+
+class TestRoutedChat:
+    """Test ai.chat(models=...)."""
+
+    def test_routes_and_records(self, api_key: str) -> None:
+        client, calls = routed_client(api_key, {})
+
+        response = client.ai.chat(MESSAGES, models=["a", "b"])
+
+        assert response.content == "a"
+        assert calls == ["a"]
+        assert client.router.scores()["a"].requests == 1
+
+    def test_falls_back_without_retrying(self, api_key: str) -> None:
+        client, calls = routed_client(api_key, {"a": [502], "b": [429]})
+
+        response = client.ai.chat(MESSAGES, models=["a", "b", "c"])
+
+        assert response.content == "c"
+        assert calls == ["a", "b", "c"]
+        scores = client.router.scores()
+        assert scores["a"].failures == 1 and scores["b"].failures == 1
+        # The next call avoids both failed models.
+        assert client.router.order(["a", "b", "c"])[0] == "c"
+
+    def test_retries_transient_statuses_on_same_model(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("cencori.client.time.sleep", lambda s: None)
+        client, calls = routed_client(api_key, {"a": [503]})
+
+        assert client.ai.chat(MESSAGES, models=["a", "b"]).content == "a"
+        assert calls == ["a", "a"]
+
+    def test_all_fail(self, api_key: str) -> None:
+        client, calls = routed_client(api_key, {"a": [502], "b": [429]})
+
+        with pytest.raises(RateLimitError):
+            client.ai.chat(MESSAGES, models=["a", "b"])
+
+        assert calls == ["a", "b"]
+
+    def test_other_errors_do_not_fall_back(self, api_key: str) -> None:
+        client, calls = routed_client(api_key, {"a": [401]})
+
+        with pytest.raises(AuthenticationError):
+            client.ai.chat(MESSAGES, models=["a", "b"])
+
+        assert calls == ["a"]
+        assert "a" not in client.router.scores()
+
+    def test_local_errors_leave_stats_alone(self, api_key: str) -> None:
+        client, calls = routed_client(
+            api_key, {}, context_fitter=ContextFitter(windows={"a": 10, "b": 10})
+        )
+
+        with pytest.raises(ContextWindowError):
+            client.ai.chat([{"role": "user", "content": "x" * 400}], models=["a", "b"])
+
+        assert calls == []
+        assert client.router.scores() == {}
+
+    def test_cache_hits_and_pacing_are_not_timed(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client, calls = routed_client(api_key, {}, cache=ResponseCache())
+
+        def slow_pace(*args: object) -> int:
+            time.sleep(0.2)  # waiting for the local rate limiter
+            return 0
+
+        monkeypatch.setattr(client.ai, "_pace", slow_pace)
+
+        client.ai.chat(MESSAGES, models=["a"], temperature=0)
+        client.ai.chat(MESSAGES, models=["a"], temperature=0)
+
+        assert calls == ["a"]
+        score = client.router.scores()["a"]
+        assert score.requests == 1
+        assert score.latency_s is not None and score.latency_s < 0.1
+
+    def test_timeout_falls_back_and_records(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("cencori.client.time.sleep", lambda s: None)
+        calls: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            model = json.loads(request.content)["model"]
+            calls.append(model)
+            if model == "slow":
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={"content": model, "model": model})
+
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            router=ModelRouter(explore=0.0),
+        )
+
+        assert client.ai.chat(MESSAGES, models=["slow", "b"]).content == "b"
+        assert calls == ["slow"] * 3 + ["b"]  # retried on the model, then fell back
+        assert client.router.scores()["slow"].failures == 1
+        assert client.router.order(["slow", "b"])[0] == "b"
+
+    def test_server_error_falls_back(self, api_key: str) -> None:
+        client, calls = routed_client(api_key, {"a": [500]})
+
+        assert client.ai.chat(MESSAGES, models=["a", "b"]).content == "b"
+        assert calls == ["a", "b"]
+        assert client.router.scores()["a"].failures == 1
+
+    @pytest.mark.asyncio
+    async def test_async_fallback(self, api_key: str) -> None:
+        calls: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            model = json.loads(request.content)["model"]
+            calls.append(model)
+            status = 502 if model == "a" else 200
+            return httpx.Response(status, json={"content": model, "model": model})
+
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            router=ModelRouter(explore=0.0),
+        )
+
+        response = await client.ai.chat(MESSAGES, models=["a", "b"])
+
+        assert response.content == "b"
+        assert calls == ["a", "b"]
+        assert isinstance(ProviderError(), client.router.fallback_on)
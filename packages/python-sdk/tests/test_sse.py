@@ -0,0 +1,104 @@
+"""Tests for the shared server-sent events parser."""
+
+from typing import List
+
+import httpx
+import pytest
+
+from cencori import Cencori, ResponsesRequest, StreamDecodeError
+from cencori.sse import ServerSentEvent, SSEDecoder, iter_events
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+
+def parse(*chunks: bytes) -> List[ServerSentEvent]:
+    return list(iter_events(chunks))
+
+
+class TestSSEDecoder:
+    """Test SSEDecoder against the EventSource parsing rules."""
+
+    def test_fields(self) -> None:
+        events = parse(
+            b": keep-alive\nevent: delta\nid: 7\nretry: 1500\ndata: one\n\ndata: two\n\n"
+        )
+
+        assert events == [
+            ServerSentEvent("one", "delta", "7", 1500),
+            ServerSentEvent("two", "message", "7", 1500),
+        ]
+
+    def test_multi_line_data(self) -> None:
+        assert parse(b'data: {\ndata:  "a": 1\ndata: }\n\n') == [ServerSentEvent('{\n "a": 1\n}')]
+
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+    def test_line_endings(self, newline: bytes) -> None:
+        body = b"event: e" + newline + b"data: x" + newline + newline + b"data: y" + newline * 2
+
+        assert parse(body) == [ServerSentEvent("x", "e"), ServerSentEvent("y")]
+
+    def test_every_split_point(self) -> None:
+        body = "﻿data: héllo\r\n\r\nevent: e\ndata: a\ndata: b\n\ndata:c\r\r".encode()
+        expected = parse(body)
+
+        assert expected == [
+            ServerSentEvent("héllo"),
+            ServerSentEvent("a\nb", "e"),
+            ServerSentEvent("c"),
+        ]
+        for i in range(len(body)):
+            for j in range(i, len(body)):
+                assert parse(body[:i], body[i:j], body[j:]) == expected
+
+    def test_ignores_empty_and_unknown(self) -> None:
+        events = parse(b"event: lonely\n\nfoo: bar\nretry: soon\nid: a\x00b\ndata: x\n\n")
+
+        assert events == [ServerSentEvent("x")]
+
+    def test_empty_data_not_dispatched(self) -> None:
+        assert parse(b"data\n\ndata: \n\nevent: ping\ndata:\n\n") == []
+        assert parse(b"data: \r\n\r\n") == []
+        assert parse(b"data:\ndata:\n\n") == [ServerSentEvent("\n")]
+
+    def test_unfinished_event_not_dispatched(self) -> None:
+        decoder = SSEDecoder()
+
+        assert decoder.feed(b"data: partial\n") == []
+
+    def test_malformed_json(self) -> None:
+        with pytest.raises(StreamDecodeError) as info:
+            ServerSentEvent("{nope").json()
+
+        assert info.value.data == "{nope"
+
+
+def stream_client(api_key: str, body: bytes) -> Cencori:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    return Cencori(api_key=api_key, http_client=httpx.Client(transport=transport))
+
+
+class TestStreams:
+    """Test the streaming methods on top of the shared parser."""
+
+    def test_chat_stream_surfaces_malformed_json(self, api_key: str) -> None:
+        client = stream_client(api_key, b'data: {"delta": "a"}\n\ndata: {"delta": \n\n')
+        stream = client.ai.chat_stream(messages=MESSAGES)
+
+        assert next(stream).delta == "a"
+        with pytest.raises(StreamDecodeError):
+            next(stream)
+
+    def test_rag_stream(self, api_key: str) -> None:
+        client = stream_client(api_key, b'data: {"delta": "x"}\r\n\r\ndata: [DONE]\r\n\r\n')
+
+        chunks = list(client.ai.rag_stream("gpt-4o", MESSAGES, namespace="docs"))
+
+        assert [c.delta for c in chunks] == ["x"]
+
+    def test_responses_stream_multi_line_data(self, api_key: str) -> None:
+        body = b'event: response.completed\ndata: {"id":\ndata: "r1"}\n\n'
+        client = stream_client(api_key, body)
+
+        events = list(client.ai.responses_stream(ResponsesRequest(model="m", input="x")))
+
+        assert events == [{"type": "response.completed", "data": {"id": "r1"}}]
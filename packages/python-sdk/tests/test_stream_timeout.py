@@ -0,0 +1,211 @@
+"""Tests for idle-gap and deadline limits on streams."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from typing import AsyncIterator, Iterator, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, StreamStalledError, StreamTimeout
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+DELTAS = [f"data: {json.dumps({'delta': text})}\n\n".encode() for text in ("a", "b", "c")]
+
+
+def stalling_body() -> Iterator[bytes]:
+    yield DELTAS[0]
+    raise httpx.ReadTimeout("timed out")
+
+
+def serve_then_stall(listener: socket.socket, release: threading.Event) -> None:
+    """Answer one request with two events 0.5s apart, then go quiet until released."""
+    connection, _ = listener.accept()
+    with connection:
+        connection.recv(65536)
+        connection.sendall(
+            b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+            b"transfer-encoding: chunked\r\n\r\n"
+        )
+        for delta in DELTAS[:2]:
+            connection.sendall(b"%x\r\n%s\r\n" % (len(delta), delta))
+            time.sleep(0.5)
+        release.wait(10)
+
+
+def client_for(api_key: str, handler: httpx.MockTransport, **kwargs: object) -> Cencori:
+    return Cencori(api_key=api_key, http_client=httpx.Client(transport=handler), **kwargs)
+
+
+class TestStreamTimeout:
+    """Test the timeout settings."""
+
+    def test_defaults(self) -> None:
+        timeout = StreamTimeout().httpx_timeout(30.0)
+
+        assert timeout.connect == 30.0
+        assert timeout.read == 60.0
+
+    def test_read_uses_tighter_limit(self) -> None:
+        assert StreamTimeout(idle=60, total=5).httpx_timeout(30.0).read == 5
+        assert StreamTimeout(idle=None).httpx_timeout(30.0).read is None
+
+    def test_rejects_non_positive(self) -> None:
+        with pytest.raises(ValueError):
+            StreamTimeout(idle=0)
+
+
+class TestStalledStreams:
+    """Test how stalls surface from the streaming methods."""
+
+    def test_idle_stall_mid_stream(self, api_key: str) -> None:
+        seen: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=stalling_body())
+
+        cencori = client_for(
+            api_key, httpx.MockTransport(handler), stream_timeout=StreamTimeout(idle=5)
+        )
+        deltas: List[str] = []
+
+        with pytest.raises(StreamStalledError) as info:
+            for chunk in cencori.ai.chat_stream(messages=MESSAGES):
+                deltas.append(chunk.delta)
+
+        assert deltas == ["a"]
+        assert len(seen) == 1  # never retried once events were delivered
+        assert info.value.reason == "idle"
+        assert info.value.timeout == 5
+        assert info.value.endpoint == "/api/ai/chat"
+        assert info.value.code == "STREAM_STALLED"
+        assert seen[0].extensions["timeout"]["read"] == 5
+
+    def test_deadline(self, api_key: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = iter([100.0, 100.5, 101.0, 102.0, 103.0])
+        monkeypatch.setattr("cencori.stream_timeout.time.monotonic", lambda: next(clock))
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=iter(DELTAS)))
+        cencori = client_for(api_key, transport, stream_timeout=StreamTimeout(total=1.5))
+        deltas: List[str] = []
+
+        with pytest.raises(StreamStalledError) as info:
+            for chunk in cencori.ai.rag_stream(model="gpt-4o", messages=MESSAGES, namespace="n"):
+                deltas.append(chunk.delta or "")
+
+        assert deltas == ["a"]
+        assert info.value.reason == "deadline"
+        assert info.value.timeout == 1.5
+
+    def test_deadline_ends_a_pending_read(self, api_key: str) -> None:
+        listener = socket.create_server(("127.0.0.1", 0))
+        release = threading.Event()
+        server = threading.Thread(target=serve_then_stall, args=(listener, release))
+        server.start()
+        cencori = Cencori(
+            api_key=api_key,
+            base_url=f"http://127.0.0.1:{listener.getsockname()[1]}",
+            # The last read starts 0.5s in, with 0.7s left but a 1s idle limit.
+            stream_timeout=StreamTimeout(idle=1, total=1.2),
+        )
+        deltas: List[str] = []
+        started = time.monotonic()
+
+        try:
+            with pytest.raises(StreamStalledError) as info:
+                for chunk in cencori.ai.chat_stream(messages=MESSAGES):
+                    deltas.append(chunk.delta)
+        finally:
+            release.set()
+            server.join()
+            listener.close()
+            cencori.close()
+
+        assert deltas == ["a", "b"]
+        assert info.value.reason == "deadline"
+        assert time.monotonic() - started < 1.45
+
+    def test_stall_before_headers_is_retried(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("cencori.client.time.sleep", lambda s: None)
+        calls: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ReadTimeout("no headers", request=request)
+            return httpx.Response(200, content=iter(DELTAS))
+
+        cencori = client_for(api_key, httpx.MockTransport(handler))
+
+        deltas = [chunk.delta for chunk in cencori.ai.chat_stream(messages=MESSAGES)]
+
+        assert deltas == ["a", "b", "c"]
+        assert len(calls) == 2
+
+    def test_stall_before_headers_exhausts_retries(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("cencori.client.time.sleep", lambda s: None)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("no headers", request=request)
+
+        cencori = client_for(api_key, httpx.MockTransport(handler))
+
+        with pytest.raises(StreamStalledError) as info:
+            list(cencori.ai.chat_stream(messages=MESSAGES))
+
+        assert info.value.reason == "idle"
+        assert isinstance(info.value.__cause__, httpx.ReadTimeout)
+
+    @pytest.mark.asyncio
+    async def test_async_idle_stall(self, api_key: str) -> None:
+        async def body() -> AsyncIterator[bytes]:
+            yield DELTAS[0]
+            raise httpx.ReadTimeout("timed out")
+
+        cencori = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+            ),
+        )
+        deltas: List[str] = []
+
+        with pytest.raises(StreamStalledError) as info:
+            async for chunk in cencori.ai.chat_stream(messages=MESSAGES):
+                deltas.append(chunk.delta)
+
+        assert deltas == ["a"]
+        assert info.value.reason == "idle"
+
+    @pytest.mark.asyncio
+    async def test_async_deadline_ends_a_pending_read(self, api_key: str) -> None:
+        async def body() -> AsyncIterator[bytes]:
+            yield DELTAS[0]
+            await asyncio.sleep(10)
+            yield DELTAS[1]
+
+        cencori = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+            ),
+            stream_timeout=StreamTimeout(idle=10, total=0.2),
+        )
+        deltas: List[str] = []
+        started = time.monotonic()
+
+        with pytest.raises(StreamStalledError) as info:
+            async for chunk in cencori.ai.chat_stream(messages=MESSAGES):
+                deltas.append(chunk.delta)
+
+        assert deltas == ["a"]
+        assert info.value.reason == "deadline"
+        assert time.monotonic() - started < 5
@@ -0,0 +1,229 @@
+"""Tests for stream latency instrumentation."""
+
+import json
+from typing import Any, AsyncIterator, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, StreamStats, StreamTiming
+from cencori.timing import StreamTimer
+from cencori.types import TurnParams
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+
+class FakeClock:
+    def __init__(self, *times: float) -> None:
+        self.times = list(times)
+
+    def __call__(self) -> float:
+        return self.times.pop(0)
+
+
+def sse(*events: Any) -> List[bytes]:
+    return [f"data: {json.dumps(event)}\n\n".encode() for event in events] + [
+        b"data: [DONE]\n\n"
+    ]
+
+
+CHAT_EVENTS = sse(
+    {"delta": "Hel"},
+    {"delta": "lo"},
+    {"delta": "!"},
+    {"delta": "", "finish_reason": "stop"},
+    {"usage": {"prompt_tokens": 3, "completion_tokens": 3, "total_tokens": 6}},
+)
+
+
+def stream_client(api_key: str, chunks: List[bytes]) -> Cencori:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=iter(chunks))
+
+    transport = httpx.MockTransport(handler)
+    return Cencori(api_key=api_key, http_client=httpx.Client(transport=transport))
+
+
+class TestStreamTimer:
+    """Test the phase bookkeeping on a controlled clock."""
+
+    def test_phases(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "cencori.timing.time.perf_counter",
+            FakeClock(10.0, 10.05, 10.1, 10.2, 10.3, 10.5, 10.9, 11.0),
+        )
+        stats = StreamStats()
+        timer = StreamTimer("gpt-4o", "/api/ai/chat", stats)
+
+        timer.start()
+        timer.trace("connection.connect_tcp.started", {})
+        timer.trace("http11.send_request_headers.started", {})
+        timer.headers()
+        assert list(timer.body(iter([b"a", b"b"]))) == [b"a", b"b"]
+        for _ in range(3):
+            timer.token()
+        timer.finish(True)
+
+        timing = timer.timing
+        assert timing.connect_s == pytest.approx(0.05)
+        assert timing.headers_s == pytest.approx(0.1)
+        assert timing.ttfb_s == pytest.approx(0.2)
+        assert timing.ttft_s == pytest.approx(0.3)
+        assert timing.token_gaps_s == pytest.approx([0.2, 0.4])
+        assert timing.total_s == pytest.approx(1.0)
+        assert timing.tokens_per_s == pytest.approx(2 / 0.6)
+        assert timing.max_token_gap_s == pytest.approx(0.4)
+        assert stats.models() == ["gpt-4o"]
+
+    def test_finish_once_and_only_completed_recorded(self) -> None:
+        stats = StreamStats()
+        timer = StreamTimer("m", "/x", stats)
+
+        timer.finish(True)  # never started: nothing to report
+        assert timer.timing.total_s is None
+
+        timer.start()
+        timer.finish(False)
+        timer.finish(True)
+
+        assert timer.timing.total_s is not None
+        assert stats.summary("m") is None
+
+    def test_single_token_has_no_rate(self) -> None:
+        assert StreamTiming(model="m", endpoint="/x", tokens=1).tokens_per_s is None
+
+
+class TestStreamStats:
+    """Test the per-model aggregates."""
+
+    def test_summary(self) -> None:
+        stats = StreamStats(window=10)
+        for i in range(20):
+            stats.record(
+                StreamTiming(
+                    model="m", endpoint="/x", ttft_s=i / 10, tokens=3, token_gaps_s=[0.1, 0.1]
+                )
+            )
+
+        summary = stats.summary("m")
+
+        assert summary is not None
+        assert summary.streams == 20
+        assert summary.ttft_p50_s == pytest.approx(1.5)  # only the last 10 are kept
+        assert summary.ttft_p95_s == pytest.approx(1.9)
+        assert summary.tokens_per_s == pytest.approx(10.0)
+        assert summary.token_gap_p95_s == pytest.approx(0.1)
+        assert stats.summary("other") is None
+
+
+class TestInstrumentedStreams:
+    """Test that the streaming methods expose and record their timing."""
+
+    def test_chat_stream(self, api_key: str) -> None:
+        cencori = stream_client(api_key, CHAT_EVENTS)
+
+        stream = cencori.ai.chat_stream(messages=MESSAGES, model="gpt-4o")
+        assert "".join(chunk.delta for chunk in stream) == "Hello!"
+
+        timing = stream.timing
+        assert timing.model == "gpt-4o"
+        assert timing.endpoint == "/api/ai/chat"
+        assert timing.tokens == 3
+        assert len(timing.token_gaps_s) == 2
+        assert timing.headers_s is not None and timing.ttfb_s is not None
+        assert timing.ttft_s is not None and timing.total_s is not None
+        assert timing.headers_s <= timing.ttfb_s <= timing.ttft_s <= timing.total_s
+        summary = cencori.stream_stats.summary("gpt-4o")
+        assert summary is not None and summary.streams == 1
+
+    def test_error_chunk_not_recorded(self, api_key: str) -> None:
+        cencori = stream_client(api_key, sse({"delta": "a"}, {"error": "provider down"}))
+
+        stream = cencori.ai.chat_stream(messages=MESSAGES, model="gpt-4o")
+        assert [chunk.error for chunk in stream] == [None, "provider down"]
+
+        assert stream.timing.total_s is not None
+        assert cencori.stream_stats.summary("gpt-4o") is None
+
+    def test_closed_early_not_recorded(self, api_key: str) -> None:
+        cencori = stream_client(api_key, CHAT_EVENTS)
+
+        stream = cencori.ai.chat_stream(messages=MESSAGES, model="gpt-4o")
+        next(stream)
+        stream.close()
+
+        assert stream.timing.tokens == 1
+        assert stream.timing.total_s is not None
+        assert cencori.stream_stats.models() == []
+
+    def test_stats_shared_between_clients(self, api_key: str) -> None:
+        stats = StreamStats()
+        for _ in range(2):
+            transport = httpx.MockTransport(
+                lambda request: httpx.Response(200, content=iter(CHAT_EVENTS))
+            )
+            cencori = Cencori(
+                api_key=api_key, http_client=httpx.Client(transport=transport), stream_stats=stats
+            )
+            list(cencori.ai.chat_stream(messages=MESSAGES, model="gpt-4o"))
+
+        summary = stats.summary("gpt-4o")
+        assert summary is not None and summary.streams == 2
+
+    def test_rag_stream(self, api_key: str) -> None:
+        chunks = sse({"type": "content", "delta": "a"}, {"type": "sources"})
+        cencori = stream_client(api_key, chunks)
+
+        stream = cencori.ai.rag_stream(model="gpt-4o", messages=MESSAGES, namespace="docs")
+        list(stream)
+
+        assert stream.timing.tokens == 1
+        assert stream.timing.endpoint == "/api/ai/rag"
+
+    def test_session_turn(self, api_key: str) -> None:
+        chunks = [
+            b'event: turn.started\ndata: {"turn": 1}\n\n',
+            b'event: output_text.delta\ndata: {"delta": "Hi"}\n\n',
+            b'event: output_text.delta\ndata: {"delta": " there"}\n\n',
+            b'event: turn.completed\ndata: {"turn": 1}\n\n',
+        ]
+        seen: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=iter(chunks))
+
+        cencori = Cencori(
+            api_key=api_key, http_client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+
+        turn = cencori.sessions.stream_turn("sess_1", TurnParams(input="Hi", model="gpt-4o"))
+        types = [event["type"] for event in turn]
+
+        assert seen[0].url.path == "/v1/sessions/sess_1/turns"
+        assert types == ["turn.started", "output_text.delta", "output_text.delta", "turn.completed"]
+        assert turn.timing.tokens == 2
+        assert cencori.stream_stats.models() == ["gpt-4o"]
+
+    @pytest.mark.asyncio
+    async def test_async_chat_stream(self, api_key: str) -> None:
+        async def body() -> AsyncIterator[bytes]:
+            for chunk in CHAT_EVENTS:
+                yield chunk
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        cencori = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        stream = cencori.ai.chat_stream(messages=MESSAGES, model="gpt-4o")
+        deltas = [chunk.delta async for chunk in stream]
+
+        assert "".join(deltas) == "Hello!"
+        assert stream.timing.tokens == 3
+        assert stream.timing.ttft_s is not None
+        summary = cencori.stream_stats.summary("gpt-4o")
+        assert summary is not None and summary.streams == 1
@@ -0,0 +1,135 @@
+"""Tests for sync and async streaming."""
+
+import asyncio
+from typing import AsyncIterator, List
+
+import httpx
+import pytest
+
+from cencori import Cencori, ResponsesRequest
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+CHAT_SSE = (
+    b'data: {"delta": "Hel"}\n\n'
+    b'data: {"delta": "lo", "finish_reason": "stop"}\n\n'
+    b"data: [DONE]\n\n"
+)
+
+
+def async_client(api_key: str, body: bytes) -> Cencori:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    return Cencori(api_key=api_key, async_http_client=httpx.AsyncClient(transport=transport))
+
+
+class HangingStream(httpx.AsyncByteStream):
+    """Yields one event, then stalls until closed."""
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b'data: {"delta": "first"}\n\n'
+        await asyncio.sleep(3600)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class TestAsyncChatStream:
+    """Test async_chat_stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_chunks(self, api_key: str) -> None:
+        client = async_client(api_key, CHAT_SSE)
+
+        chunks = [c async for c in client.ai.async_chat_stream(messages=MESSAGES)]
+
+        assert [c.delta for c in chunks] == ["Hel", "lo"]
+        assert chunks[-1].finish_reason == "stop"
+
+    @pytest.mark.asyncio
+    async def test_error_event_ends_stream(self, api_key: str) -> None:
+        client = async_client(api_key, b'data: {"error": "boom"}\n\ndata: {"delta": "x"}\n\n')
+
+        chunks = [c async for c in client.ai.async_chat_stream(messages=MESSAGES)]
+
+        assert len(chunks) == 1
+        assert chunks[0].error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_aclose_aborts_upstream(self, api_key: str) -> None:
+        """Test closing the iterator closes the upstream response at once."""
+        stream = HangingStream()
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=stream))
+        client = Cencori(api_key=api_key, async_http_client=httpx.AsyncClient(transport=transport))
+
+        chunks = client.ai.async_chat_stream(messages=MESSAGES)
+        first = await chunks.__anext__()
+        await asyncio.wait_for(chunks.aclose(), timeout=1)
+
+        assert first.delta == "first"
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_cancel_aborts_upstream(self, api_key: str) -> None:
+        """Test cancelling the consuming task closes the upstream response."""
+        stream = HangingStream()
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=stream))
+        client = Cencori(api_key=api_key, async_http_client=httpx.AsyncClient(transport=transport))
+        received: List[str] = []
+
+        async def consume() -> None:
+            async for chunk in client.ai.async_chat_stream(messages=MESSAGES):
+                received.append(chunk.delta)
+
+        task = asyncio.ensure_future(consume())
+        while not received:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert stream.closed
+
+
+class TestAsyncRagStream:
+    """Test async_rag_stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_rag_chunks(self, api_key: str) -> None:
+        body = (
+            b'data: {"type": "sources", "sources": [{"content": "doc"}]}\n\n'
+            b'data: {"type": "content", "delta": "answer"}\n\n'
+            b"data: [DONE]\n\n"
+        )
+        client = async_client(api_key, body)
+
+        chunks = [
+            c async for c in client.ai.async_rag_stream("gpt-4o", MESSAGES, namespace="docs")
+        ]
+
+        assert chunks[0].sources is not None and chunks[0].sources[0].content == "doc"
+        assert chunks[1].delta == "answer"
+
+
+class TestAsyncResponsesStream:
+    """Test async_responses_stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_events(self, api_key: str) -> None:
+        body = (
+            b"event: response.output_text.delta\n"
+            b'data: {"delta": "Hi"}\n\n'
+            b'data: {"done": true}\n\n'
+        )
+        client = async_client(api_key, body)
+
+        events = [
+            e async for e in client.ai.async_responses_stream(ResponsesRequest(model="m", input="x"))
+        ]
+
+        assert events == [
+            {"type": "response.output_text.delta", "data": {"delta": "Hi"}},
+            {"type": "message", "data": {"done": True}},
+        ]
@@ -0,0 +1,181 @@
+"""Tests for local token estimates and the context-window fitter."""
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from cencori import Cencori, ContextFitter, ContextWindowError
+from cencori.tokens import estimate_message_tokens, estimate_text_tokens, profile_for
+from cencori.types import ToolDefinition, ToolFunction
+
+# 400 characters: 100 tokens at 4 characters per token.
+TURN = "x" * 400
+
+
+def conversation(turns: int) -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = [{"role": "system", "content": "Be brief."}]
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"{i}{TURN}"})
+        messages.append({"role": "assistant", "content": f"{i}{TURN}"})
+    messages.append({"role": "user", "content": "last"})
+    return messages
+
+
+class TestEstimates:
+    """Test the per-family approximation."""
+
+    def test_profile_by_family_prefix(self) -> None:
+        assert profile_for("gpt-4o-mini").context_window == 128_000
+        assert profile_for("gpt-4").context_window == 8_192
+        assert profile_for("anthropic/claude-3-5-haiku") is profile_for("claude-opus-4")
+        assert profile_for("unknown-model").context_window is None
+
+    def test_families_differ(self) -> None:
+        assert estimate_text_tokens(TURN, "gpt-4o") == 100
+        assert estimate_text_tokens(TURN, "claude-3-5-sonnet") == 115
+
+    def test_non_ascii(self) -> None:
+        assert estimate_text_tokens("你好世界", "gpt-4o") == 4
+        assert estimate_text_tokens("abcd你好", "gpt-4o") == 3
+
+    def test_messages_parts_and_tools(self) -> None:
+        messages = [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": TURN},
+                    {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}},
+                ],
+            },
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "c", "arguments": "{}"}]},
+        ]
+        base = estimate_message_tokens(messages, "gpt-4o")
+        tool = ToolDefinition(function=ToolFunction(name="lookup", description="Find a thing"))
+
+        assert base > 100 + 765 + 2 * 3
+        assert estimate_message_tokens(messages, "gpt-4o", tools=[tool]) > base
+
+
+class TestContextFitter:
+    """Test trimming and summarizing old turns."""
+
+    def test_fitting_payload_is_returned_as_is(self) -> None:
+        messages = conversation(3)
+
+        assert ContextFitter().fit(messages, "gpt-4o") is messages
+
+    def test_unknown_window_passes_through(self) -> None:
+        messages = conversation(50)
+
+        assert ContextFitter().fit(messages, "my-model") is messages
+
+    def test_drops_oldest_turns(self) -> None:
+        fitter = ContextFitter(reserve=100, margin=0.0, windows={"small": 400})
+
+        fitted = fitter.fit(conversation(5), "small-v2")
+
+        assert fitted[0]["role"] == "system"
+        assert fitted[-1]["content"] == "last"
+        assert [m["content"][0] for m in fitted[1:-1]] == ["4", "4"]
+        assert estimate_message_tokens(fitted, "small") <= 300
+
+    def test_tool_results_stay_with_their_call(self) -> None:
+        messages = [
+            {"role": "user", "content": TURN},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "1"}]},
+            {"role": "tool", "content": TURN, "tool_call_id": "1"},
+            {"role": "user", "content": "last"},
+        ]
+        fitter = ContextFitter(reserve=10, margin=0.0, windows={"m": 100})
+
+        assert fitter.fit(messages, "m") == [{"role": "user", "content": "last"}]
+
+    def test_summarize_replaces_dropped_turns(self) -> None:
+        seen: List[List[Dict[str, Any]]] = []
+
+        def summarize(dropped: List[Dict[str, Any]]) -> str:
+            seen.append(dropped)
+            return f"{len(dropped)} earlier messages"
+
+        fitter = ContextFitter(reserve=100, margin=0.0, summarize=summarize, windows={"small": 400})
+
+        fitted = fitter.fit(conversation(5), "small")
+
+        assert len(seen) == 1
+        assert fitted[1] == {"role": "system", "content": f"{len(seen[0])} earlier messages"}
+        assert fitted[0]["content"] == "Be brief." and fitted[-1]["content"] == "last"
+
+    def test_summary_too_large_is_left_out(self) -> None:
+        seen: List[List[Dict[str, Any]]] = []
+
+        def summarize(dropped: List[Dict[str, Any]]) -> str:
+            seen.append(dropped)
+            return TURN * 3
+
+        fitter = ContextFitter(
+            reserve=100,
+            margin=0.0,
+            summarize=summarize,
+            summary_tokens=50,
+            windows={"small": 400},
+        )
+
+        fitted = fitter.fit(conversation(5), "small")
+
+        assert len(seen) == 1
+        assert [m["content"][0] for m in seen[0]] == ["0", "0", "1", "1", "2", "2", "3", "3"]
+        assert [m["content"][0] for m in fitted] == ["B", "4", "4", "l"]
+
+    def test_too_large_raises(self) -> None:
+        fitter = ContextFitter(windows={"m": 1000})
+        messages = [{"role": "user", "content": TURN * 10}]
+
+        with pytest.raises(ContextWindowError) as exc_info:
+            fitter.fit(messages, "m", max_tokens=100)
+
+        assert exc_info.value.model == "m"
+        assert exc_info.value.tokens == 1004
+        assert exc_info.value.limit == 850
+
+
+class TestFittedChat:
+    """Test the fitter on client calls."""
+
+    def test_chat_sends_trimmed_history(self, api_key: str) -> None:
+        sent: List[Dict[str, Any]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, json={"content": "ok"})
+
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            context_fitter=ContextFitter(reserve=100, margin=0.0, windows={"small": 400}),
+        )
+
+        client.ai.chat(conversation(5), model="small")
+
+        assert len(sent[0]["messages"]) == 4
+
+    def test_oversized_chat_fails_without_request(self, api_key: str) -> None:
+        calls: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"content": "ok"})
+
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            context_fitter=ContextFitter(windows={"m": 1000}),
+        )
+
+        with pytest.raises(ContextWindowError):
+            client.ai.chat_stream([{"role": "user", "content": TURN * 10}], model="m")
+        with pytest.raises(ContextWindowError):
+            client.ai.rag("m", [{"role": "user", "content": TURN * 10}], namespace="docs")
+
+        assert calls == []
@@ -0,0 +1,133 @@
+"""Tests for compact float32 embedding results."""
+
+import json
+from array import array
+from typing import Any, List
+
+import httpx
+import pytest
+
+from cencori import AsyncCencori, Cencori, EmbeddingBatching, EmbeddingCache
+from cencori import vectors
+from cencori.codec import default_codec
+from cencori.errors import CencoriError
+
+BODY = (
+    b'{"data": [{"object": "embedding", "embedding": [0.5, -1.25, 3e-2], "index": 0},'
+    b' {"object": "embedding", "embedding": [1,2,3], "index": 1}],'
+    b' "model": "text-embedding-3-small", "usage": {"total_tokens": 7}}'
+)
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "array":
+        monkeypatch.setattr(vectors, "np", None)
+    elif vectors.np is None:
+        pytest.skip("numpy not installed")
+    return str(request.param)
+
+
+def rows(matrix: Any, dims: int) -> List[List[float]]:
+    count = len(matrix) if vectors.np is not None else len(matrix) // max(dims, 1)
+    return [list(vectors.row(matrix, dims, i)) for i in range(count)]
+
+
+def embedding_handler(sent: List[List[str]]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        sent.append(texts)
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"embedding": [float(t), -float(t)]} for t in texts],
+                "model": "text-embedding-3-small",
+                "usage": {"total_tokens": len(texts)},
+            },
+        )
+
+    return handler
+
+
+class TestDecode:
+    """Test vectors.decode_embeddings."""
+
+    def test_decodes_rows_and_remainder(self, backend: str) -> None:
+        data, matrix, dims = vectors.decode_embeddings(BODY)
+
+        assert dims == 3
+        assert rows(matrix, dims) == [[0.5, -1.25, pytest.approx(0.03)], [1.0, 2.0, 3.0]]
+        assert data["usage"]["total_tokens"] == 7
+        assert data["data"][1]["index"] == 1
+        if backend == "array":
+            assert isinstance(matrix, array)
+        else:
+            assert matrix.shape == (2, 3)
+
+    def test_dimension_mismatch(self, backend: str) -> None:
+        body = b'{"data": [{"embedding": [1, 2]}, {"embedding": [1, 2, 3]}]}'
+
+        with pytest.raises(CencoriError, match="dimensions"):
+            vectors.decode_embeddings(body)
+
+    @pytest.mark.parametrize("row", [b'1, "x", 3', b"1, null, 3", b"1, x, 3", b"1,, 3"])
+    @pytest.mark.parametrize("loads", [json.loads, default_codec().loads], ids=["json", "default"])
+    def test_malformed_row(self, backend: str, row: bytes, loads: Any) -> None:
+        body = b'{"data": [{"embedding": [1, 2, 3]}, {"embedding": [' + row + b"]}]}"
+
+        with pytest.raises(CencoriError, match="Embedding 1 is not a list of numbers"):
+            vectors.decode_embeddings(body, loads)
+
+    def test_empty(self, backend: str) -> None:
+        data, matrix, dims = vectors.decode_embeddings(b'{"data": []}')
+
+        assert (data, len(matrix), dims) == ({"data": []}, 0, 0)
+
+
+class TestCompactEmbeddings:
+    """Test ai.embeddings(compact=True)."""
+
+    def test_batches_concatenated(self, api_key: str, backend: str) -> None:
+        sent: List[List[str]] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(embedding_handler(sent))),
+            embedding_batching=EmbeddingBatching(max_items=2),
+        )
+
+        response = client.ai.embeddings(["1", "2", "3"], compact=True)
+
+        assert response.dimensions == 2
+        assert rows(response.embeddings, 2) == [[1.0, -1.0], [2.0, -2.0], [3.0, -3.0]]
+        assert response.usage.total_tokens == 3
+        assert len(sent) == 2
+
+    def test_merges_cached_rows(self, api_key: str, backend: str, tmp_path: Any) -> None:
+        sent: List[List[str]] = []
+        client = Cencori(
+            api_key=api_key,
+            http_client=httpx.Client(transport=httpx.MockTransport(embedding_handler(sent))),
+            embedding_cache=EmbeddingCache(str(tmp_path)),
+        )
+        client.ai.embeddings(["2"], compact=True)
+
+        response = client.ai.embeddings(["1", "2", "1"], compact=True)
+        hit = client.ai.embeddings(["2", "1"], compact=True)
+
+        assert rows(response.embeddings, 2) == [[1.0, -1.0], [2.0, -2.0], [1.0, -1.0]]
+        assert rows(hit.embeddings, 2) == [[2.0, -2.0], [1.0, -1.0]]
+        assert sent == [["2"], ["1"]]
+
+    @pytest.mark.asyncio
+    async def test_async(self, api_key: str) -> None:
+        sent: List[List[str]] = []
+        client = AsyncCencori(
+            api_key=api_key,
+            async_http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(embedding_handler(sent))
+            ),
+        )
+
+        response = await client.ai.embeddings("4", compact=True)
+
+        assert rows(response.embeddings, 2) == [[4.0, -4.0]]